@@ -10,7 +10,8 @@ central atom bonded to the other three.
 from __future__ import annotations
 
 import argparse
-from collections import defaultdict
+import mmap
+import os
 from pathlib import Path
 import re
 from typing import Dict, List, Sequence, Tuple
@@ -19,60 +20,106 @@ import numpy as np
 import parmed
 
 
-def _pointer_to_serial(value: int) -> int:
-    return abs(int(value)) // 3 + 1
+def _pointer_to_serial(pointers: np.ndarray) -> np.ndarray:
+    """Map parm7 coordinate pointers (``3 * (serial - 1)``, sign-flagged) to serials.
 
+    Works elementwise on whole arrays of pointers as well as on scalars.
+    """
 
-def _parse_parm7_sections(path: Path) -> Dict[str, List[str]]:
+    return np.abs(pointers) // 3 + 1
+
+
+def _section_cells(lines: Sequence[bytes], count: int, width: int) -> np.ndarray:
+    """Slice a section's data lines into non-blank fixed-width cells.
+
+    Lines are padded or truncated to ``count * width`` bytes and viewed as one
+    ``S{width}`` array, so the cells are cut in C rather than per slot.
+    """
+
+    full_width = count * width
+    block = b"".join(line[:full_width].ljust(full_width) for line in lines)
+    cells = np.frombuffer(block, dtype=f"S{width}")
+    blank = (np.frombuffer(block, dtype=np.uint8).reshape(-1, width) == 0x20).all(1)
+    return cells[~blank]
+
+
+_FORMAT_RE = re.compile(rb"%FORMAT\((\d+)([a-zA-Z])(\d+)(?:\.(\d+))?\)")
+# A prmtop repeats a handful of distinct %FORMAT lines, so each is only
+# matched against the regex the first time it is seen.
+_FORMAT_CACHE: Dict[bytes, Tuple[int, bytes, int]] = {}
+
+
+def _parse_format(line: bytes) -> Tuple[int, bytes, int]:
+    """Return the ``(count, type, width)`` of a ``%FORMAT`` line.
+
+    Unrecognized lines give ``(0, b"", 0)``.
+    """
+
+    layout = _FORMAT_CACHE.get(line)
+    if layout is None:
+        match = _FORMAT_RE.search(line)
+        if match:
+            layout = (int(match.group(1)), match.group(2).upper(), int(match.group(3)))
+        else:
+            layout = (0, b"", 0)
+        _FORMAT_CACHE[line] = layout
+    return layout
+
+
+def _flag_offsets(buffer: mmap.mmap) -> List[int]:
+    """Return the byte offsets of every line starting with ``%FLAG``."""
+
+    offsets = [0] if buffer[:5] == b"%FLAG" else []
+    pos = buffer.find(b"\n%FLAG")
+    while pos != -1:
+        offsets.append(pos + 1)
+        pos = buffer.find(b"\n%FLAG", pos + 1)
+    return offsets
+
+
+def _parse_parm7_sections(path: Path) -> Dict[str, np.ndarray]:
+    """Tokenize every parm7 section into fixed-width cells.
+
+    Integer (``I``) sections are converted to int32 as they are collected;
+    every other section is returned as fixed-width byte cells.
+
+    The file is memory-mapped and only located by its ``%FLAG`` offsets; each
+    section is split into lines on its own, so at most one section's lines are
+    held next to the mapping instead of a full copy of the file.
+    """
+
+    sections: Dict[str, np.ndarray] = {}
     with path.open("rb") as handle:
-        text = handle.read().decode("utf-8", errors="replace")
-    lines = text.splitlines()
-    fmt_re = re.compile(r"%FORMAT\((\d+)([a-zA-Z])(\d+)(?:\.(\d+))?\)")
-    sections: Dict[str, List[str]] = {}
-    current_name = None
-    current_count = 0
-    current_width = 0
-    current_tokens: List[str] = []
-    collect_tokens = False
-
-    def finalize_section() -> None:
-        if current_name:
-            sections[current_name] = list(current_tokens)
-
-    for line in lines:
-        if line.startswith("%FLAG"):
-            if current_name is not None:
-                finalize_section()
-            parts = line.split()
-            current_name = parts[1] if len(parts) > 1 else None
-            current_count = 0
-            current_width = 0
-            current_tokens = []
-            collect_tokens = current_name is not None
-            continue
-        if line.startswith("%FORMAT"):
-            match = fmt_re.search(line)
-            if match:
-                current_count = int(match.group(1))
-                current_width = int(match.group(3))
-            continue
-        if collect_tokens and current_name and current_count and current_width:
-            for slot in range(current_count):
-                start = slot * current_width
-                end = start + current_width
-                if start >= len(line):
-                    break
-                raw = line[start:end]
-                if not raw.strip():
+        if not os.fstat(handle.fileno()).st_size:
+            return sections
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            offsets = _flag_offsets(buffer)
+            bounds = zip(offsets, offsets[1:] + [len(buffer)])
+            for start, end in bounds:
+                lines = buffer[start:end].splitlines()
+                parts = lines[0].decode("utf-8", errors="replace").split()
+                if len(parts) < 2:
                     continue
-                current_tokens.append(raw)
-
-    if current_name is not None:
-        finalize_section()
+                count = 0
+                kind = b""
+                width = 0
+                data_start = 1
+                # Header lines (%FORMAT, %COMMENT) sit between %FLAG and data.
+                while data_start < len(lines) and lines[data_start].startswith(b"%"):
+                    if lines[data_start].startswith(b"%FORMAT"):
+                        count, kind, width = _parse_format(lines[data_start].rstrip())
+                    data_start += 1
+                if count and width:
+                    cells = _section_cells(lines[data_start:], count, width)
+                    if kind == b"I":
+                        cells = cells.astype(np.int32)
+                    sections[parts[1]] = cells
+                else:
+                    sections[parts[1]] = np.empty(0, dtype="S1")
     return sections
 
 
-def _parse_pointers(pointer_tokens: Sequence[str]) -> Dict[str, int]:
+def _parse_pointers(pointer_tokens: np.ndarray) -> Dict[str, int]:
     pointer_names = [
         "NATOM",
         "NTYPES",
@@ -107,52 +154,91 @@ def _parse_pointers(pointer_tokens: Sequence[str]) -> Dict[str, int]:
         "NUMEXTRA",
         "NCOPY",
     ]
-    raw = " ".join(pointer_tokens)
-    values = np.fromstring(raw, sep=" ", dtype=int)
+    values = _parse_int_tokens(pointer_tokens)
     if values.size not in (31, 32):
         raise ValueError(
             f"POINTERS length {values.size} does not match expected 31 or 32"
         )
-    names = pointer_names[: values.size]
-    return {name: int(value) for name, value in zip(names, values.tolist())}
+    # tolist() already yields Python ints, so the names zip straight in.
+    return dict(zip(pointer_names, values.tolist()))
+
+
+def _parse_int_tokens(tokens: np.ndarray) -> np.ndarray:
+    """Return integer tokens as a packed int32 array.
 
+    Sections with an ``I`` format already arrive as int32 and pass through
+    without a copy.
+    """
 
-def _parse_int_tokens(tokens: Sequence[str]) -> List[int]:
-    raw = " ".join(tokens)
-    values = np.fromstring(raw, sep=" ", dtype=int)
-    return values.astype(int).tolist()
+    return np.asarray(tokens, dtype=np.int32)
 
 
-def _build_adjacency(structure: parmed.Structure) -> Dict[int, set[int]]:
-    adjacency: Dict[int, set[int]] = defaultdict(set)
-    for bond in structure.bonds:
-        a = bond.atom1.idx + 1
-        b = bond.atom2.idx + 1
-        adjacency[a].add(b)
-        adjacency[b].add(a)
-    return adjacency
+def _pair_keys(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Pack unordered serial pairs into int64 keys (``min << 32 | max``)."""
 
+    a = np.asarray(a, dtype=np.int64)
+    b = np.asarray(b, dtype=np.int64)
+    return (np.minimum(a, b) << 32) | np.maximum(a, b)
 
-def _is_bonded(adjacency: Dict[int, set[int]], a: int, b: int) -> bool:
-    return b in adjacency.get(a, set())
 
+def _bond_keys(structure: parmed.Structure) -> np.ndarray:
+    """Return the sorted, unique packed keys of every bonded serial pair."""
 
-def _is_improper_by_l_sign(raw_l: int) -> bool:
-    return int(raw_l) < 0
+    bonds = structure.bonds
+    pairs = np.fromiter(
+        (idx for bond in bonds for idx in (bond.atom1.idx, bond.atom2.idx)),
+        dtype=np.int64,
+        count=2 * len(bonds),
+    ).reshape(-1, 2)
+    return np.unique(_pair_keys(pairs[:, 0] + 1, pairs[:, 1] + 1))
+
+
+def _are_bonded(bond_keys: np.ndarray, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Vectorized bond test of serial pairs against sorted ``bond_keys``."""
+
+    keys = _pair_keys(a, b)
+    if not bond_keys.size:
+        return np.zeros(keys.shape, dtype=bool)
+    positions = np.searchsorted(bond_keys, keys)
+    return bond_keys[np.minimum(positions, bond_keys.size - 1)] == keys
 
 
 def _format_dihedral(serials: Sequence[int]) -> str:
     return f"({serials[0]}, {serials[1]}, {serials[2]}, {serials[3]})"
 
 
-def _parse_dihedral_records(values: Sequence[int]) -> List[Tuple[int, int, int, int, int]]:
-    records: List[Tuple[int, int, int, int, int]] = []
-    for idx in range(0, len(values), 5):
-        chunk = values[idx : idx + 5]
-        if len(chunk) < 5:
-            break
-        records.append((chunk[0], chunk[1], chunk[2], chunk[3], chunk[4]))
-    return records
+def _dihedral_records(values: np.ndarray) -> np.ndarray:
+    """View complete 5-integer dihedral records as an ``(n, 5)`` int32 array.
+
+    A trailing partial record is dropped, as the token-count check already
+    reports it.
+    """
+
+    values = np.asarray(values, dtype=np.int32)
+    return values[: values.size // 5 * 5].reshape(-1, 5)
+
+
+def _classify_dihedrals(
+    records: np.ndarray, bond_keys: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Classify ``(n, 5)`` dihedral records in one vectorized pass.
+
+    Returns
+    -------
+    tuple
+        Atom serials, the improper mask (negative l index) and the mask of
+        proper dihedrals whose j-k atoms are not bonded.
+    """
+
+    serials = _pointer_to_serial(records[:, :4])
+    improper = records[:, 3] < 0
+    # Impropers are never bond-checked, so only proper rows are looked up.
+    proper_rows = np.flatnonzero(~improper)
+    jk_unbonded = np.zeros(len(records), dtype=bool)
+    jk_unbonded[proper_rows] = ~_are_bonded(
+        bond_keys, serials[proper_rows, 1], serials[proper_rows, 2]
+    )
+    return serials, improper, jk_unbonded
 
 
 def main() -> int:
@@ -173,37 +259,37 @@ def main() -> int:
         raise SystemExit(f"rst7 not found: {rst7_path}")
 
     structure = parmed.load_file(str(parm7_path), str(rst7_path))
-    adjacency = _build_adjacency(structure)
+    bond_keys = _bond_keys(structure)
 
     sections = _parse_parm7_sections(parm7_path)
     pointer_tokens = sections.get("POINTERS")
-    if not pointer_tokens:
+    if pointer_tokens is None or not pointer_tokens.size:
         raise SystemExit("POINTERS section missing in parm7")
     pointers = _parse_pointers(pointer_tokens)
 
     dihedral_sections = (
-        ("DIHEDRALS_INC_HYDROGEN", int(pointers.get("NPHIH", 0))),
-        ("DIHEDRALS_WITHOUT_HYDROGEN", int(pointers.get("MPHIA", 0))),
+        ("DIHEDRALS_INC_HYDROGEN", pointers["NPHIH"]),
+        ("DIHEDRALS_WITHOUT_HYDROGEN", pointers["MPHIA"]),
     )
 
     malformed_records: List[str] = []
     improper_records: List[str] = []
-    improper_position_counts: Dict[str, int] = defaultdict(int)
-    improper_section_counts: Dict[str, int] = defaultdict(int)
-    section_totals: Dict[str, int] = defaultdict(int)
-    j_k_not_bonded = 0
-    improper_total = 0
-    total = 0
-
-    for section_name, count in dihedral_sections:
+    # Both sections are classified together in one batch; each record keeps
+    # its section index (0 = INC_HYDROGEN, 1 = WITHOUT_HYDROGEN).
+    record_parts: List[np.ndarray] = [np.empty((0, 5), dtype=np.int32)]
+    section_id_parts: List[np.ndarray] = [np.empty(0, dtype=np.intp)]
+
+    for section_idx, (section_name, count) in enumerate(dihedral_sections):
         section_tokens = sections.get(section_name)
+        if section_tokens is None:
+            section_tokens = np.empty(0, dtype="S1")
         if count == 0:
-            if section_tokens:
+            if section_tokens.size:
                 malformed_records.append(
                     f"{section_name}: expected 0 entries but found {len(section_tokens)} tokens"
                 )
             continue
-        if not section_tokens:
+        if not section_tokens.size:
             malformed_records.append(f"{section_name}: missing or empty section")
             continue
         if len(section_tokens) != count * 5:
@@ -211,34 +297,45 @@ def main() -> int:
                 f"{section_name}: expected {count * 5} tokens but found {len(section_tokens)}"
             )
         values = _parse_int_tokens(section_tokens)
-        if len(values) % 5 != 0:
+        if values.size % 5 != 0:
             malformed_records.append(
-                f"{section_name}: token count {len(values)} is not a multiple of 5"
+                f"{section_name}: token count {values.size} is not a multiple of 5"
             )
-        records = _parse_dihedral_records(values)
-        for raw_i, raw_j, raw_k, raw_l, raw_param in records:
-            serials = (
-                _pointer_to_serial(raw_i),
-                _pointer_to_serial(raw_j),
-                _pointer_to_serial(raw_k),
-                _pointer_to_serial(raw_l),
+        records = _dihedral_records(values)
+        record_parts.append(records)
+        section_id_parts.append(np.full(len(records), section_idx, dtype=np.intp))
+
+    records = np.concatenate(record_parts)
+    section_ids = np.concatenate(section_id_parts)
+    serials, improper, jk_unbonded = _classify_dihedrals(records, bond_keys)
+    j_k_not_bonded = int(jk_unbonded.sum())
+    section_totals = np.bincount(section_ids, minlength=len(dihedral_sections))
+    improper_section_counts = np.bincount(
+        section_ids[improper], minlength=len(dihedral_sections)
+    )
+    total = int(section_totals.sum())
+    improper_total = int(improper_section_counts.sum())
+    # The negative l index flags k as the central atom of every improper.
+    improper_position_counts = {"k": improper_total}
+
+    # Messages are only built once validation is done, and only for flagged rows.
+    rows = np.flatnonzero(improper | jk_unbonded)
+    for section_idx, row_serials, raw_param, is_improper in zip(
+        section_ids[rows].tolist(),
+        serials[rows].tolist(),
+        records[rows, 4].tolist(),
+        improper[rows].tolist(),
+    ):
+        section_name = dihedral_sections[section_idx][0]
+        label = _format_dihedral(row_serials)
+        if is_improper:
+            improper_records.append(
+                f"{section_name} dihedral {label} param={raw_param} "
+                "improper (l index negative)"
             )
-            total += 1
-            section_totals[section_name] += 1
-            if _is_improper_by_l_sign(raw_l):
-                improper_total += 1
-                improper_position_counts["k"] += 1
-                improper_section_counts[section_name] += 1
-                improper_records.append(
-                    f"{section_name} dihedral {_format_dihedral(serials)} param={raw_param} "
-                    "improper (l index negative)"
-                )
-                continue
-            if _is_bonded(adjacency, serials[1], serials[2]):
-                continue
-            j_k_not_bonded += 1
+        else:
             malformed_records.append(
-                f"{section_name} dihedral {_format_dihedral(serials)} param={raw_param} "
+                f"{section_name} dihedral {label} param={raw_param} "
                 "has non-bonded j-k and no central atom"
             )
 
@@ -247,8 +344,8 @@ def main() -> int:
     print(f"  impropers detected: {improper_total}")
     print(f"  j-k not bonded (non-improper): {j_k_not_bonded}")
     print("\nSection totals:")
-    for section_name in ("DIHEDRALS_INC_HYDROGEN", "DIHEDRALS_WITHOUT_HYDROGEN"):
-        print(f"  {section_name}: {section_totals.get(section_name, 0)}")
+    for section_idx, (section_name, _) in enumerate(dihedral_sections):
+        print(f"  {section_name}: {section_totals[section_idx]}")
 
     if improper_records:
         print("\nImproper-like dihedrals (central bonded to other three):")
@@ -261,9 +358,8 @@ def main() -> int:
     for label in ("i", "j", "k", "l"):
         count = improper_position_counts.get(label, 0)
         print(f"  central={label}: {count}")
-    for section_name in ("DIHEDRALS_INC_HYDROGEN", "DIHEDRALS_WITHOUT_HYDROGEN"):
-        count = improper_section_counts.get(section_name, 0)
-        print(f"  {section_name}: {count}")
+    for section_idx, (section_name, _) in enumerate(dihedral_sections):
+        print(f"  {section_name}: {improper_section_counts[section_idx]}")
     if malformed_records:
         print("\nMalformed or unexpected records:")
         for record in malformed_records:
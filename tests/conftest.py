@@ -0,0 +1,24 @@
+from pathlib import Path
+
+import pytest
+
+from topview.model.state import Parm7Section
+from topview.services.parm7 import parse_parm7
+
+DATA_DIR = Path(__file__).resolve().parent / "data"
+WCN_PARM7 = DATA_DIR / "wcn.parm7"
+
+
+@pytest.fixture(scope="session")
+def wcn_parsed() -> tuple[str, dict[str, Parm7Section]]:
+    """Parse the wcn.parm7 fixture once per test session."""
+    assert WCN_PARM7.exists()
+    return parse_parm7(str(WCN_PARM7))
+
+
+@pytest.fixture
+def wcn_sections(wcn_parsed) -> dict[str, Parm7Section]:
+    """Per-test shallow copy of the wcn sections, safe to add or drop keys."""
+    _, sections = wcn_parsed
+    assert sections
+    return dict(sections)
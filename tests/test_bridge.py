@@ -0,0 +1,423 @@
+import json
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from topview import bridge
+from topview.bridge import Api
+from topview.errors import ModelError
+
+
+class _FakeModel:
+    def get_atom_bundle(self, serial):
+        if int(serial) > 2:
+            raise ModelError("not_found", f"Atom serial {serial} not found")
+        return {"ok": True, "atom": {"serial": int(serial)}, "highlights": []}
+
+    def get_atom_info(self, serial):
+        if int(serial) > 2:
+            raise ModelError("not_found", f"Atom serial {serial} not found")
+        return {"ok": True, "atom": {"serial": int(serial)}}
+
+    def get_residue_info(self, resid):
+        return {"ok": True, "residue": {"resid": int(resid)}}
+
+    def load_system(self, parm7_path, rst7_path, resname, nmr_path):
+        return {"ok": True}
+
+    def warm_highlight_indices(self):
+        self.warm_calls = getattr(self, "warm_calls", 0) + 1
+        return {"ok": True, "indices": 0}
+
+
+class _InlineWorker:
+    def submit(self, fn, *args, **kwargs):
+        from concurrent.futures import Future
+
+        future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as exc:
+            future.set_exception(exc)
+        return future
+
+
+def _make_api() -> Api:
+    return Api(model=_FakeModel(), worker=_InlineWorker())
+
+
+def test_get_atom_bundles_returns_items_in_order() -> None:
+    result = _make_api().get_atom_bundles({"serials": [2, 1, 3]})
+
+    assert result["ok"] is True
+    items = result["items"]
+    assert [item["ok"] for item in items] == [True, True, False]
+    assert items[0]["atom"]["serial"] == 2
+    assert items[1]["atom"]["serial"] == 1
+    assert items[2]["error"]["code"] == "not_found"
+
+
+def test_get_atom_infos_and_residue_infos() -> None:
+    api = _make_api()
+
+    infos = api.get_atom_infos({"serials": [1]})
+    residues = api.get_residue_infos({"resids": [5, 6]})
+
+    assert infos["items"][0]["atom"]["serial"] == 1
+    assert [item["residue"]["resid"] for item in residues["items"]] == [5, 6]
+
+
+def test_batch_endpoints_validate_payload() -> None:
+    api = _make_api()
+
+    assert api.get_atom_bundles(None)["error"]["code"] == "invalid_input"
+    assert api.get_atom_bundles({})["error"]["message"] == "serials is required"
+    assert api.get_residue_infos({"resids": 3})["error"]["message"] == (
+        "resids must be a list"
+    )
+
+
+def test_batch_dispatches_calls_in_order() -> None:
+    api = _make_api()
+
+    result = api.batch(
+        {
+            "calls": [
+                {"method": "get_ui_config"},
+                {"method": "get_atom_info", "payload": {"serial": 2}},
+                {"method": "get_atom_info", "payload": {"serial": 9}},
+                {"method": "get_atom_info"},
+                {"method": "select_files"},
+                "get_ui_config",
+            ]
+        }
+    )
+
+    assert result["ok"] is True
+    results = result["results"]
+    assert results[0] == {"ok": True, "config": {}}
+    assert results[1]["atom"]["serial"] == 2
+    assert results[2]["error"]["code"] == "not_found"
+    assert [item["error"]["code"] for item in results[3:]] == ["invalid_input"] * 3
+    assert api.batch({"calls": "get_ui_config"})["error"]["message"] == (
+        "calls must be a list"
+    )
+
+
+class _RecordingWindow:
+    def __init__(self) -> None:
+        self.scripts: list[str] = []
+
+    def evaluate_js(self, script: str) -> None:
+        self.scripts.append(script)
+
+
+def test_exposed_methods_are_bound_on_the_instance() -> None:
+    api = _make_api()
+    public = {
+        name
+        for name in vars(Api)
+        if not name.startswith("_") and callable(getattr(Api, name))
+    }
+
+    assert public - {"set_window"} == set(bridge.EXPOSED_METHODS)
+    for name in bridge.EXPOSED_METHODS:
+        assert api.__dict__[name].__func__ is getattr(Api, name)
+
+
+def test_async_query_returns_task_id_and_delivers_result() -> None:
+    class _QueryModel(_FakeModel):
+        def query_atoms(self, filters):
+            return {"ok": True, "serials": [1, 2], "count": 2, "truncated": False}
+
+    api = Api(model=_QueryModel(), worker=_InlineWorker())
+    window = _RecordingWindow()
+    api.set_window(window)
+
+    result = api.query_atoms({"filters": {}, "async": True})
+
+    assert result["ok"] is True
+    task_id = result["task_id"]
+    assert len(window.scripts) == 1
+    prefix = f'window.__topviewTaskDone("{task_id}", '
+    assert window.scripts[0].startswith(prefix)
+    delivered = json.loads(window.scripts[0][len(prefix) : -1])
+    assert delivered["serials"] == [1, 2]
+
+
+def test_async_result_that_cannot_serialize_delivers_an_error() -> None:
+    class _QueryModel(_FakeModel):
+        def query_atoms(self, filters):
+            return {"ok": True, "serials": {1, 2}}
+
+    api = Api(model=_QueryModel(), worker=_InlineWorker())
+    window = _RecordingWindow()
+    api.set_window(window)
+
+    task_id = api.query_atoms({"filters": {}, "async": True})["task_id"]
+
+    assert len(window.scripts) == 1
+    prefix = f'window.__topviewTaskDone("{task_id}", '
+    assert window.scripts[0].startswith(prefix)
+    delivered = json.loads(window.scripts[0][len(prefix) : -1])
+    assert delivered["ok"] is False
+    assert delivered["error"]["code"] == "unexpected"
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_task_payload_encoding_does_not_depend_on_orjson(
+    monkeypatch, use_orjson
+) -> None:
+    if use_orjson and bridge.orjson is None:
+        pytest.skip("orjson is not installed")
+    if not use_orjson:
+        monkeypatch.setattr(bridge, "orjson", None)
+    payload = {
+        "nan": float("nan"),
+        "values": (1.5, float("inf")),
+        1: np.int64(2),
+        None: np.array([0.5, np.nan]),
+    }
+
+    encoded = bridge._dumps_js(payload)
+
+    assert encoded == '{"nan":null,"values":[1.5,null],"1":2,"null":[0.5,null]}'
+    with pytest.raises(TypeError):
+        bridge._dumps_js({"serials": {1, 2}})
+    with pytest.raises(TypeError):
+        bridge._dumps_js({(1, 2): 1})
+
+
+def test_async_flag_without_window_answers_synchronously() -> None:
+    class _QueryModel(_FakeModel):
+        def query_atoms(self, filters):
+            return {"ok": True, "serials": [], "count": 0, "truncated": False}
+
+    api = Api(model=_QueryModel(), worker=_InlineWorker())
+
+    result = api.query_atoms({"filters": {}, "async": True})
+
+    assert "task_id" not in result
+    assert result["count"] == 0
+
+
+def test_atom_info_is_memoized_until_next_load() -> None:
+    class _CountingModel(_FakeModel):
+        def __init__(self) -> None:
+            self.calls = 0
+
+        def get_atom_info(self, serial):
+            self.calls += 1
+            return super().get_atom_info(serial)
+
+    model = _CountingModel()
+    api = Api(model=model, worker=_InlineWorker())
+
+    first = api.get_atom_info({"serial": 1})
+    second = api.get_atom_info({"serial": "1"})
+    api.get_atom_infos({"serials": [1]})
+    assert first == second
+    assert model.calls == 1
+
+    api.get_atom_info({"serial": 3})
+    api.get_atom_info({"serial": 3})
+    assert model.calls == 3
+
+    api.load_system({"parm7_path": "x.parm7"})
+    api.get_atom_info({"serial": 1})
+    assert model.calls == 4
+
+
+def test_panel_payloads_are_reused_until_next_load() -> None:
+    class _PanelModel(_FakeModel):
+        def __init__(self) -> None:
+            self.calls = {"pointers": 0, "system_info": 0}
+
+        def get_parm7_pointers(self):
+            self.calls["pointers"] += 1
+            return {"ok": True, "pointers": []}
+
+        def get_system_info(self):
+            self.calls["system_info"] += 1
+            return {"ok": True, "tables": {}}
+
+    model = _PanelModel()
+    api = Api(model=model, worker=_InlineWorker(), ui_config={"info_font_size": 9})
+
+    assert api.get_ui_config() is api.get_ui_config()
+    for _ in range(3):
+        api.get_parm7_pointers()
+        api.get_system_info()
+    assert model.calls == {"pointers": 1, "system_info": 1}
+
+    api.load_system({"parm7_path": "x.parm7"})
+    api.get_parm7_pointers()
+    api.get_system_info()
+    assert model.calls == {"pointers": 2, "system_info": 2}
+
+
+def test_load_system_prefetches_parm7_sections_but_not_text() -> None:
+    class _LoadingModel(_FakeModel):
+        def __init__(self) -> None:
+            self.text_calls = 0
+            self.section_calls = 0
+
+        def get_parm7_text(self):
+            self.text_calls += 1
+            return {"ok": True, "parm7_text_b64": "AA=="}
+
+        def get_parm7_sections(self):
+            self.section_calls += 1
+            return {"ok": True, "sections": []}
+
+    model = _LoadingModel()
+    api = Api(model=model, worker=_InlineWorker())
+
+    api.load_system({"parm7_path": "x.parm7"})
+    assert model.section_calls == 1
+    assert model.text_calls == 0
+    assert model.warm_calls == 1
+
+    assert api.get_parm7_sections()["sections"] == []
+    assert model.section_calls == 1
+    assert api.get_parm7_text()["parm7_text_b64"] == "AA=="
+    assert api.get_parm7_text()["parm7_text_b64"] == "AA=="
+    assert model.text_calls == 2
+
+
+class _DialogWindow:
+    def __init__(self, *responses) -> None:
+        self.responses = list(responses)
+        self.calls = []
+
+    def create_file_dialog(self, dialog_type, allow_multiple, file_types):
+        self.calls.append(allow_multiple)
+        return self.responses.pop(0)
+
+
+def test_select_files_classifies_single_dialog(monkeypatch) -> None:
+    monkeypatch.setattr(bridge, "webview", SimpleNamespace(OPEN_DIALOG=10))
+    window = _DialogWindow(("/a/sys.RST7", "/a/sys.prmtop"))
+    api = Api(model=_FakeModel(), worker=_InlineWorker())
+    api.set_window(window)
+
+    result = api.select_files()
+
+    assert result == {
+        "ok": True,
+        "parm7_path": "/a/sys.prmtop",
+        "rst7_path": "/a/sys.RST7",
+    }
+    assert window.calls == [True]
+
+
+def test_select_files_falls_back_when_ambiguous(monkeypatch) -> None:
+    monkeypatch.setattr(bridge, "webview", SimpleNamespace(OPEN_DIALOG=10))
+    window = _DialogWindow(
+        ("/a/one.parm7", "/a/two.parm7"),
+        ("/a/two.parm7",),
+        None,
+    )
+    api = Api(model=_FakeModel(), worker=_InlineWorker())
+    api.set_window(window)
+
+    result = api.select_files()
+
+    assert result == {"ok": True, "parm7_path": "/a/two.parm7", "rst7_path": None}
+    assert window.calls == [True, False, False]
+
+
+def test_save_system_info_csv_streams_chunks(monkeypatch, tmp_path) -> None:
+    monkeypatch.setattr(bridge, "webview", SimpleNamespace(SAVE_DIALOG=30))
+    target = tmp_path / "types.csv"
+
+    class _SaveWindow:
+        def create_file_dialog(self, dialog_type, save_filename, file_types):
+            return str(target)
+
+    api = Api(model=_FakeModel(), worker=_InlineWorker())
+    api.set_window(_SaveWindow())
+
+    result = api.save_system_info_csv(
+        {"csv_chunks": ["a,b\n", "1,2\n", "3,4"], "name": "types"}
+    )
+
+    assert result == {"ok": True, "path": str(target)}
+    assert target.read_text(encoding="utf-8") == "a,b\n1,2\n3,4"
+    assert api.save_system_info_csv({"csv_chunks": "a,b"})["error"]["code"] == (
+        "invalid_input"
+    )
+
+
+def test_parm7_highlights_dedupes_and_caps_serials() -> None:
+    class _HighlightModel(_FakeModel):
+        def get_parm7_highlights(self, serials, mode=None):
+            return {"ok": True, "serials": serials, "mode": mode}
+
+    api = Api(model=_HighlightModel(), worker=_InlineWorker())
+
+    result = api.get_parm7_highlights({"serials": [3, "1", 3, 2, 1], "mode": "Angle"})
+    assert result["serials"] == [3, 1, 2]
+
+    too_many = list(range(bridge.MAX_HIGHLIGHT_SERIALS + 1))
+    result = api.get_parm7_highlights({"serials": too_many})
+    assert result["ok"] is False
+    assert result["error"]["code"] == "invalid_input"
+
+
+def test_single_serial_highlights_are_memoized_per_mode() -> None:
+    class _HighlightModel(_FakeModel):
+        def __init__(self) -> None:
+            self.calls = []
+
+        def get_parm7_highlights(self, serials, mode=None):
+            self.calls.append((serials, mode))
+            return {"ok": True, "serials": serials, "mode": mode}
+
+    model = _HighlightModel()
+    api = Api(model=model, worker=_InlineWorker())
+
+    first = api.get_parm7_highlights({"serial": "4", "mode": "Atom"})
+    assert first["serials"] == [4]
+    assert api.get_parm7_highlights({"serial": 4, "mode": "Atom"}) is first
+    api.get_parm7_highlights({"serial": 4, "mode": "Bond"})
+    assert model.calls == [([4], "Atom"), ([4], "Bond")]
+
+
+def test_lazy_model_is_built_on_first_call() -> None:
+    from topview.model import LazyModel
+
+    built = []
+
+    def _factory():
+        built.append(True)
+        return _FakeModel()
+
+    api = Api(model=LazyModel(_factory), worker=_InlineWorker())
+    assert built == []
+
+    assert api.get_atom_info({"serial": 1})["ok"] is True
+    assert api.get_atom_info({"serial": 2})["ok"] is True
+    assert built == [True]
+
+
+def test_load_system_includes_initial_payloads() -> None:
+    class _LoadingModel(_FakeModel):
+        def load_system(self, parm7_path, rst7_path, resname, nmr_path):
+            return {"ok": True, "natoms": 1}
+
+        def get_parm7_text(self):
+            return {"ok": True, "parm7_text_b64": "AA=="}
+
+        def get_parm7_sections(self):
+            raise ModelError("not_loaded", "No parm7 sections available")
+
+    api = Api(model=_LoadingModel(), worker=_InlineWorker())
+
+    result = api.load_system({"parm7_path": "x.parm7", "include_initial": True})
+
+    assert result["natoms"] == 1
+    assert result["parm7_text"]["parm7_text_b64"] == "AA=="
+    assert result["parm7_sections"]["error"]["code"] == "not_loaded"
+    assert "parm7_text" not in api.load_system({"parm7_path": "x.parm7"})
@@ -33,6 +33,37 @@ def test_parse_args_export_override() -> None:
     assert args.export == "atom,bond"
 
 
+def _parse_outcome(parse) -> object:
+    try:
+        return vars(parse())
+    except SystemExit as exc:
+        return ("exit", exc.code)
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["example.parm7", "example.rst7", "--info-font-size=14", "--log-file", "x.log"],
+        ["--nmr", "n.in", "a.parm7", "b.rst7"],
+        ["a.parm7", "--nmr", "n.in", "b.rst7"],
+    ],
+)
+def test_parse_args_matches_argparse_fallback(argv) -> None:
+    fast = _parse_outcome(lambda: _parse_args(["topview", *argv]))
+    slow = _parse_outcome(lambda: app_module._build_arg_parser().parse_args(argv))
+    assert fast == slow
+
+
+def test_parse_args_falls_back_for_abbreviations() -> None:
+    args = _parse_args(["topview", "example.parm7", "--res", "ABC"])
+    assert args.resname == "ABC"
+
+
+def test_parse_args_rejects_extra_positionals() -> None:
+    with pytest.raises(SystemExit):
+        _parse_args(["topview", "a.parm7", "b.rst7", "c"])
+
+
 def test_parse_export_terms_rejects_unknown_term() -> None:
     with pytest.raises(SystemExit, match="Unsupported --export term 'bogus'"):
         app_module._parse_export_terms("atom,bogus")
@@ -81,3 +112,9 @@ def test_validate_nmr_startup_inputs_exits_on_parse_failure(monkeypatch) -> None
 
     with pytest.raises(SystemExit, match="Failed to parse NMR restraints: bad restraint"):
         app_module._validate_nmr_startup_inputs("example.parm7", "example.rst7", "rest.in")
+
+
+def test_parse_args_is_memoized_per_argv() -> None:
+    argv = ["topview", "example.parm7", "--resname", "LIG"]
+    assert _parse_args(argv) is _parse_args(list(argv))
+    assert _parse_args(["topview", "other.parm7"]).parm7_path == "other.parm7"
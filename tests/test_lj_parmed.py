@@ -7,8 +7,8 @@ from topview.services.lj import compute_lj_tables
 from topview.services.parm7 import parse_parm7, parse_pointers
 
 
-def _compute_topview_lj(parm7_path: Path) -> tuple[dict[int, dict[str, float]], int]:
-    text, sections = parse_parm7(str(parm7_path))
+def _compute_topview_lj(parsed) -> tuple[dict[int, dict[str, float]], int]:
+    text, sections = parsed
     assert text
     pointer_section = sections.get("POINTERS")
     assert pointer_section is not None
@@ -37,7 +37,7 @@ def test_lj_matches_parmed() -> None:
     parm7_path = Path(__file__).resolve().parents[1] / "daux" / "binder_IDC-5270.parm7"
     assert parm7_path.exists()
     parmed_parm = AmberParm(str(parm7_path))
-    lj_by_type, ntypes = _compute_topview_lj(parm7_path)
+    lj_by_type, ntypes = _compute_topview_lj(parse_parm7(str(parm7_path)))
 
     assert len(parmed_parm.LJ_radius) == ntypes
     assert len(parmed_parm.LJ_depth) == ntypes
@@ -51,3 +51,20 @@ def test_lj_matches_parmed() -> None:
         assert ours["epsilon"] == pytest.approx(
             parmed_parm.LJ_depth[type_index - 1], rel=1e-6, abs=1e-8
         )
+
+
+def test_lj_matches_parmed_fixture(wcn_parsed) -> None:
+    parm7_path = Path(__file__).resolve().parents[1] / "tests" / "data" / "wcn.parm7"
+    parmed_parm = AmberParm(str(parm7_path))
+    lj_by_type, ntypes = _compute_topview_lj(wcn_parsed)
+
+    assert len(lj_by_type) == ntypes
+    for type_index in range(1, ntypes + 1):
+        ours = lj_by_type[type_index]
+        assert isinstance(ours["pair_index"], int)
+        assert ours["rmin"] == pytest.approx(
+            parmed_parm.LJ_radius[type_index - 1], rel=1e-6, abs=1e-8
+        )
+        assert ours["epsilon"] == pytest.approx(
+            parmed_parm.LJ_depth[type_index - 1], rel=1e-6, abs=1e-8
+        )
@@ -1,6 +1,12 @@
 from topview.model import AtomMeta, ResidueMeta
-from topview.services.loader import _extract_bond_pairs
-from topview.services.pdb_writer import write_pdb
+from topview.model.query import query_atoms
+from topview.model.state import AtomTable
+from topview.services.loader import (
+    _atom_columns,
+    _extract_bond_pairs,
+    _residue_columns,
+)
+from topview.services.pdb_writer import write_pdb, write_pdb_bytes
 
 
 def test_pdb_writer_serials_order():
@@ -81,6 +87,27 @@ def test_pdb_writer_conect_records():
     assert "CONECT    3    2" in pdb
 
 
+def test_pdb_writer_conect_splits_and_dedupes_partners():
+    residue = ResidueMeta(resid=1, resname="LIG")
+    metas = [
+        AtomMeta(
+            serial=serial, atom_name=f"C{serial}", element="C", residue=residue,
+            residue_index=1, coords=(float(serial), 0.0, 0.0), parm7={},
+        )
+        for serial in range(1, 7)
+    ]
+    bonds = [(1, 6), (1, 2), (3, 1), (1, 4), (5, 1), (2, 1)]
+    conect_lines = [
+        line for line in write_pdb(metas, bonds=bonds).splitlines()
+        if line.startswith("CONECT")
+    ]
+    assert conect_lines[:2] == [
+        "CONECT    1    2    3    4    5",
+        "CONECT    1    6",
+    ]
+    assert conect_lines[2:] == [f"CONECT{serial:5d}    1" for serial in range(2, 7)]
+
+
 def test_extract_bond_pairs_from_parm7():
     from topview.model.state import Parm7Token, Parm7Section
 
@@ -100,3 +127,78 @@ def test_extract_bond_pairs_from_parm7():
     assert (1, 2) in bonds
     assert (2, 3) in bonds
     assert (15, 17) in bonds
+
+
+def test_atom_table_builds_atom_meta_lazily():
+    residue = ResidueMeta(resid=1, resname="LIG")
+    table = AtomTable(
+        atom_names=["C1", "N2"],
+        elements=["C", "N"],
+        residues=[residue, residue],
+        residue_indices=[1, 1],
+        coords=[(0.0, 1.0, 2.0), (3.0, 4.0, 5.0)],
+        atom_types=["c3", "n"],
+        atom_type_indices=[1, 2],
+        charges=[0.1, -0.2],
+        charges_raw=["1.8", "-3.6"],
+        charges_mdanalysis=[0.1, -0.2],
+        masses=[12.01, 14.01],
+        lj_by_type={2: {"rmin": 1.8, "epsilon": 0.17}},
+    )
+    by_serial = table.by_serial()
+
+    assert len(table) == 2 and len(by_serial) == 2
+    atom = by_serial[2]
+    assert atom.serial == 2 and atom.atom_name == "N2"
+    assert atom.coords == (3.0, 4.0, 5.0)
+    assert atom.parm7["lj_rmin"] == 1.8 and table[0].parm7["lj_rmin"] is None
+    assert 3 not in by_serial and list(by_serial) == [1, 2]
+    assert query_atoms(table, {"charge_max": 0.0})["serials"] == [2]
+
+
+def test_pdb_writer_formats_atom_table_like_atom_metas():
+    residue = ResidueMeta(resid=7, resname="LIG", chain="A")
+    table = AtomTable(
+        atom_names=["C1", "CL2"],
+        elements=["C", None],
+        residues=[residue, residue],
+        residue_indices=[1, 1],
+        coords=[(1.0, -2.5, 3.25), (0.0, 0.0, 0.0)],
+        atom_types=["c3", "cl"],
+        atom_type_indices=[1, 2],
+        charges=[0.1, -0.1],
+        charges_raw=[None, None],
+        charges_mdanalysis=[None, None],
+        masses=[None, None],
+    )
+
+    assert write_pdb(table, bonds=[(1, 2)]) == write_pdb(list(table), bonds=[(1, 2)])
+    assert write_pdb_bytes(table, bonds=[(1, 2)]) == write_pdb(
+        table, bonds=[(1, 2)]
+    ).encode("ascii")
+
+
+def test_residue_columns_group_runs_and_keep_distinct_keys_per_resid():
+    residues, indices, index_map, keys_by_resid = _residue_columns(
+        5,
+        resids=[1, 1, 2, 2, 1],
+        resnames=["LIG", "LIG", "WAT", "WAT", "LIG"],
+        resindices=[0, 0, 1, 1, 2],
+        segids=["A", "A", "A", "A", "B"],
+    )
+
+    assert residues[0] is residues[1] and residues[2] is residues[3]
+    assert residues[4].segid == "B"
+    assert indices == [1, 1, 2, 2, 3]
+    assert index_map == {"A:1:LIG": [1, 2], "A:2:WAT": [3, 4], "B:1:LIG": [5]}
+    assert keys_by_resid == {1: ["A:1:LIG", "B:1:LIG"], 2: ["A:2:WAT"]}
+
+
+def test_atom_columns_keep_missing_charges_and_masses_as_none():
+    columns = _atom_columns(
+        2, ["C1", "H1"], None, ["ca", None], [0.1, None], [12.0, None], None, [1, 2]
+    )
+
+    assert columns["charges"] == [0.1, None]
+    assert columns["charges_mdanalysis"] == [0.1, None]
+    assert columns["masses"] == [12.0, None]
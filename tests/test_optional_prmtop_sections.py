@@ -1,23 +1,14 @@
-from pathlib import Path
-
 import pytest
 
 from topview.model.state import Parm7Section
-from topview.services.parm7 import OPTIONAL_PRMTOP_SECTIONS, parse_parm7
+from topview.services.parm7 import OPTIONAL_PRMTOP_SECTIONS
 from topview.services.system_info import build_system_info_tables
 
 
-def _load_fixture_sections() -> dict[str, Parm7Section]:
-    root = Path(__file__).resolve().parents[1]
-    parm7_path = root / "tests" / "data" / "wcn.parm7"
-    assert parm7_path.exists()
-    _, sections = parse_parm7(str(parm7_path))
-    assert sections
-    return dict(sections)
-
-
-def test_system_info_build_succeeds_without_scee_and_scnb() -> None:
-    sections = _load_fixture_sections()
+def test_system_info_build_succeeds_without_scee_and_scnb(
+    wcn_sections: dict[str, Parm7Section],
+) -> None:
+    sections = wcn_sections
     sections.pop("SCEE_SCALE_FACTOR", None)
     sections.pop("SCNB_SCALE_FACTOR", None)
 
@@ -40,8 +31,10 @@ def test_system_info_build_succeeds_without_scee_and_scnb() -> None:
         assert all(row[scnb_idx] is None for row in table["rows"])
 
 
-def test_system_info_build_succeeds_without_unconsumed_optional_sections() -> None:
-    sections = _load_fixture_sections()
+def test_system_info_build_succeeds_without_unconsumed_optional_sections(
+    wcn_sections: dict[str, Parm7Section],
+) -> None:
+    sections = wcn_sections
     for name in OPTIONAL_PRMTOP_SECTIONS - {"SCEE_SCALE_FACTOR", "SCNB_SCALE_FACTOR"}:
         sections.pop(name, None)
 
@@ -51,8 +44,10 @@ def test_system_info_build_succeeds_without_unconsumed_optional_sections() -> No
     assert "dihedral_types" in tables
 
 
-def test_malformed_optional_section_still_errors_when_present() -> None:
-    sections = _load_fixture_sections()
+def test_malformed_optional_section_still_errors_when_present(
+    wcn_sections: dict[str, Parm7Section],
+) -> None:
+    sections = wcn_sections
     section = sections["SCEE_SCALE_FACTOR"]
     assert section.tokens
     sections["SCEE_SCALE_FACTOR"] = Parm7Section(
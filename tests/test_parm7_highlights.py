@@ -100,6 +100,56 @@ def test_dihedral_highlights_include_term_and_parameter_sections() -> None:
     assert interaction["mode"] == "Dihedral"
 
 
+def test_section_caches_hold_read_only_arrays_and_plain_values() -> None:
+    sections = {
+        "DIHEDRALS_WITHOUT_HYDROGEN": _make_section(
+            "DIHEDRALS_WITHOUT_HYDROGEN", [0, 3, 6, 9, 1], 100
+        ),
+        "DIHEDRAL_FORCE_CONSTANT": _make_section("DIHEDRAL_FORCE_CONSTANT", [0.25], 120),
+    }
+    int_cache: dict = {}
+    float_cache: dict = {}
+    engine = HighlightEngine(
+        sections,
+        _make_meta_by_serial([1, 2, 3, 4]),
+        int_cache=int_cache,
+        float_cache=float_cache,
+    )
+
+    _, interaction = engine.get_highlights([1, 2, 3, 4], mode="Dihedral")
+    term = interaction["dihedrals"][0]
+
+    assert not int_cache["DIHEDRALS_WITHOUT_HYDROGEN"].flags.writeable
+    assert not float_cache["DIHEDRAL_FORCE_CONSTANT"].flags.writeable
+    assert type(term["param_index"]) is int
+    assert type(term["force_constant"]) is float
+
+
+def test_param_values_are_cached_across_engines() -> None:
+    sections = {
+        "DIHEDRALS_WITHOUT_HYDROGEN": _make_section(
+            "DIHEDRALS_WITHOUT_HYDROGEN", [0, 3, 6, 9, 1], 100
+        ),
+        "DIHEDRAL_FORCE_CONSTANT": _make_section("DIHEDRAL_FORCE_CONSTANT", [0.25], 120),
+    }
+    param_cache: dict = {}
+    for _ in range(2):
+        engine = HighlightEngine(
+            sections,
+            _make_meta_by_serial([1, 2, 3, 4]),
+            int_cache={},
+            float_cache={},
+            param_cache=param_cache,
+        )
+        _, interaction = engine.get_highlights([1, 2, 3, 4], mode="Dihedral")
+        term = interaction["dihedrals"][0]
+        assert term["force_constant"] == 0.25
+        assert term["phase"] is None
+
+    assert param_cache[("DIHEDRAL_FORCE_CONSTANT", 1)] == 0.25
+    assert param_cache[("DIHEDRAL_PHASE", 1)] is None
+
+
 def test_one_four_highlights_include_dihedral_record_and_scaling_sections() -> None:
     sections = {
         "DIHEDRALS_WITHOUT_HYDROGEN": _make_section(
@@ -123,3 +173,114 @@ def test_one_four_highlights_include_dihedral_record_and_scaling_sections() -> N
     assert "SCNB_SCALE_FACTOR" in section_names
     assert interaction is not None
     assert interaction["mode"] == "1-4 Nonbonded"
+
+
+def test_term_index_cache_is_shared_between_engines() -> None:
+    sections = {
+        "BONDS_WITHOUT_HYDROGEN": _make_section(
+            "BONDS_WITHOUT_HYDROGEN", [0, 3, 1, 3, 6, 2], 300
+        ),
+        "BOND_FORCE_CONSTANT": _make_section("BOND_FORCE_CONSTANT", [300.0, 250.0], 310),
+        "BOND_EQUIL_VALUE": _make_section("BOND_EQUIL_VALUE", [1.5, 1.4], 320),
+    }
+    meta_by_serial = _make_meta_by_serial([1, 1, 1])
+    index_cache: dict = {}
+
+    first = HighlightEngine(
+        sections, meta_by_serial, int_cache={}, float_cache={}, index_cache=index_cache
+    )
+    _, interaction = first.get_highlights([3, 2], mode="Bond")
+    assert [bond["param_index"] for bond in interaction["bonds"]] == [2]
+    assert ("BONDS_WITHOUT_HYDROGEN", (0, 1)) in index_cache
+
+    second = HighlightEngine(
+        sections, meta_by_serial, int_cache={}, float_cache={}, index_cache=index_cache
+    )
+    _, interaction = second.get_highlights([1, 2], mode="Bond")
+    assert [bond["serials"] for bond in interaction["bonds"]] == [[1, 2]]
+
+
+def test_build_term_indices_prepares_every_present_section() -> None:
+    sections = {
+        "BONDS_WITHOUT_HYDROGEN": _make_section(
+            "BONDS_WITHOUT_HYDROGEN", [0, 3, 1, 3, 6, 2], 300
+        ),
+        "DIHEDRALS_WITHOUT_HYDROGEN": _make_section(
+            "DIHEDRALS_WITHOUT_HYDROGEN", [0, 3, 6, 9, 1], 400
+        ),
+    }
+    index_cache: dict = {}
+    engine = HighlightEngine(
+        sections,
+        _make_meta_by_serial([1, 1, 1, 1]),
+        int_cache={},
+        float_cache={},
+        index_cache=index_cache,
+    )
+
+    assert engine.build_term_indices() == 3
+    assert set(index_cache) == {
+        ("BONDS_WITHOUT_HYDROGEN", (0, 1)),
+        ("DIHEDRALS_WITHOUT_HYDROGEN", (0, 1, 2, 3)),
+        ("DIHEDRALS_WITHOUT_HYDROGEN", (0, 3)),
+    }
+
+
+def test_term_index_lookup_returns_matching_records_in_order() -> None:
+    import numpy as np
+
+    from topview.model.highlights import TermIndex, _atom_set_key, _atom_set_keys
+
+    atoms = np.array([[2, 1], [3, 4], [1, 2], [5, 5]])
+    index = TermIndex(_atom_set_keys(atoms), width=3)
+
+    assert index.lookup(_atom_set_key([1, 2])).tolist() == [0, 6]
+    assert index.lookup(_atom_set_key([4, 3])).tolist() == [3]
+    assert index.lookup(_atom_set_key([1, 5])).tolist() == []
+    assert index.lookup(_atom_set_key([1, 2, 3])).tolist() == []
+
+
+def test_single_atom_set_key_matches_row_keys() -> None:
+    from topview.model.highlights import _atom_set_key, _atom_set_keys
+
+    for row in ([2, 1], [5, 5], [3, 1, 2], [1, 3, 1], [4, 2, 2, 9], [7, 7, 7, 7]):
+        assert _atom_set_key(row) == _atom_set_keys([row])[0]
+
+
+def test_atom_highlights_are_cached_per_serial() -> None:
+    sections = {"ATOM_NAME": _make_section("ATOM_NAME", ["C1", "C2"], 10)}
+    cache: dict = {}
+    engine = HighlightEngine(
+        sections,
+        _make_meta_by_serial([1, 1]),
+        int_cache={},
+        float_cache={},
+        atom_highlight_cache=cache,
+    )
+
+    highlights, _ = engine.get_highlights([2], mode="Atom")
+    assert highlights == [{"line": 11, "start": 0, "end": 2, "section": "ATOM_NAME"}]
+    assert list(cache) == [2]
+    assert engine.get_highlights([2], mode="Atom")[0][0] is cache[2][0]
+
+
+def test_batched_atom_highlights_match_single_atom_builds() -> None:
+    sections = {
+        "ATOM_NAME": _make_section("ATOM_NAME", ["C1", "C2", "C3"], 10),
+        "CHARGE": _make_section("CHARGE", [0.1, -0.1, 0.0], 20),
+        "RESIDUE_LABEL": _make_section("RESIDUE_LABEL", ["TST"], 30),
+    }
+    metas = _make_meta_by_serial([1, 1, 1])
+    engine = HighlightEngine(sections, metas, int_cache={}, float_cache={})
+
+    batch = engine.build_atom_highlights_many([metas[3], metas[1]])
+
+    assert batch == [
+        engine.build_atom_highlights(metas[3]),
+        engine.build_atom_highlights(metas[1]),
+    ]
+    assert [entry["section"] for entry in batch[0]] == [
+        "ATOM_NAME",
+        "CHARGE",
+        "RESIDUE_LABEL",
+    ]
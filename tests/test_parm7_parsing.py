@@ -0,0 +1,131 @@
+from pathlib import Path
+
+import base64
+import os
+
+import numpy as np
+import pytest
+
+from topview.services.parm7 import (
+    parse_float_array,
+    parse_float_values,
+    parse_int_array,
+    parse_int_values,
+    parm7_file_stamp,
+    parse_parm7,
+    read_parm7_b64,
+    token_int_array,
+)
+
+
+def test_parse_int_values_handles_malformed_cells() -> None:
+    assert parse_int_values(["  12", "3 ", "", "4.0", "x"]) == [12, 3, 0, 4, 0]
+    assert parse_int_array([]).dtype == np.int64
+
+
+def test_parse_float_values_supports_fortran_d_notation() -> None:
+    assert parse_float_values([" 1.5E+00", "2.0D-01", "", "bad"]) == [1.5, 0.2, 0.0, 0.0]
+    np.testing.assert_allclose(parse_float_array(["1.0", " -2.5E+02"]), [1.0, -250.0])
+    np.testing.assert_allclose(parse_float_array(["1.0D+00", " -2.5d-01"]), [1.0, -0.25])
+
+
+def test_parse_parm7_streaming_matches_full_text(tmp_path) -> None:
+    source = Path(__file__).parent / "data" / "wcn.parm7"
+    crlf_path = tmp_path / "wcn_crlf.parm7"
+    crlf_path.write_bytes(source.read_bytes().replace(b"\n", b"\r\n"))
+
+    for path in (source, crlf_path):
+        text, sections = parse_parm7(str(path))
+        streamed_text, streamed = parse_parm7(str(path), include_text=False)
+        assert text.encode("utf-8") == path.read_bytes()
+        assert streamed_text == ""
+        assert streamed == sections
+
+
+def test_parse_parm7_positions_cover_full_short_and_blank_rows(tmp_path) -> None:
+    path = tmp_path / "rows.parm7"
+    path.write_bytes(
+        b"%FLAG POINTERS\n%FORMAT(3I4)\n   1   2   3\n   4    \n   5   6\n"
+    )
+
+    tokens = parse_parm7(str(path), include_text=False)[1]["POINTERS"].tokens
+
+    assert tokens.values == ["   1", "   2", "   3", "   4", "   5", "   6"]
+    assert tokens.lines.tolist() == [2, 2, 2, 3, 4, 4]
+    assert tokens.starts.tolist() == [0, 4, 8, 0, 0, 4]
+    assert tokens.ends.tolist() == [4, 8, 12, 4, 4, 8]
+
+
+def test_read_parm7_b64_reads_ranges_and_detects_changes(tmp_path) -> None:
+    path = tmp_path / "tiny.parm7"
+    path.write_bytes(b"%VERSION\n%FLAG POINTERS\n")
+    stamp = parm7_file_stamp(str(path))
+
+    assert base64.b64decode(read_parm7_b64(str(path), stamp)) == path.read_bytes()
+    assert base64.b64decode(read_parm7_b64(str(path), stamp, 9, 5)) == b"%FLAG"
+
+    path.write_bytes(b"%VERSION\n")
+    os.utime(path, ns=(stamp[1] + 10**9, stamp[1] + 10**9))
+    with pytest.raises(ValueError):
+        read_parm7_b64(str(path), stamp)
+
+
+def test_parm7_token_array_behaves_like_token_list() -> None:
+    import pickle
+
+    from topview.model.state import Parm7Token, Parm7TokenArray
+
+    tokens = Parm7TokenArray(["   1", "   2", "   3"], [4, 4, 5], [0, 4, 0], [4, 8, 4])
+    expected = [
+        Parm7Token("   1", 4, 0, 4),
+        Parm7Token("   2", 4, 4, 8),
+        Parm7Token("   3", 5, 0, 4),
+    ]
+
+    assert len(tokens) == 3
+    assert tokens == expected
+    assert tokens[-1] == expected[-1]
+    assert type(tokens[0].line) is int
+    assert list(tokens[1:]) == expected[1:]
+    assert pickle.loads(pickle.dumps(tokens)) == tokens
+
+
+def test_token_int_array_is_parsed_once_per_section() -> None:
+    from topview.model.state import Parm7TokenArray
+
+    tokens = Parm7TokenArray(["   12", "  -3"], [0, 0], [0, 5], [5, 10])
+    values = token_int_array(tokens)
+    assert values.tolist() == [12, -3]
+    assert token_int_array(tokens) is values
+    assert not values.flags.writeable
+    assert token_int_array(list(tokens)).tolist() == [12, -3]
+
+
+def test_parm7_reference_is_cached_on_disk(tmp_path, monkeypatch) -> None:
+    from topview.services import parm7
+
+    reference = tmp_path / "ref.md"
+    reference.write_text(
+        "## Charge\n"
+        "**Flag:** `%FLAG CHARGE`\n"
+        "**Contents:** Atomic   charges\n"
+        "\n"
+        "## Old\n"
+        "`%FLAG JOIN_ARRAY` is deprecated\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(parm7, "PARM7_REFERENCE_PATH", reference)
+    monkeypatch.setattr(parm7, "_PARM7_DESCRIPTIONS", None)
+    monkeypatch.setattr(parm7, "_PARM7_DEPRECATED", None)
+
+    assert parm7.load_parm7_descriptions() == {"CHARGE": "Atomic charges"}
+    assert "JOIN_ARRAY" in parm7.load_parm7_deprecated_flags()
+    assert (tmp_path / "ref.md.cache.json").exists()
+
+    def _fail(lines):
+        raise AssertionError("reference should come from the cache")
+
+    monkeypatch.setattr(parm7, "_PARM7_DESCRIPTIONS", None)
+    monkeypatch.setattr(parm7, "_PARM7_DEPRECATED", None)
+    monkeypatch.setattr(parm7, "_parse_reference_descriptions", _fail)
+    assert parm7.load_parm7_descriptions() == {"CHARGE": "Atomic charges"}
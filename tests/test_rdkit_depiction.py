@@ -15,11 +15,9 @@ from topview.services.loader import (
     _is_resname_all,
     load_system_data,
 )
-from topview.services.parm7 import parse_parm7
 
 
-def _first_resname(parm7_path: Path) -> str | None:
-    _, sections = parse_parm7(str(parm7_path))
+def _first_resname(sections) -> str | None:
     section = sections.get("RESIDUE_LABEL")
     if not section or not section.tokens:
         return None
@@ -39,11 +37,11 @@ def _submit_immediately(fn, *args, **kwargs):
     return future
 
 
-def test_parm7_only_loads_2d_depiction() -> None:
+def test_parm7_only_loads_2d_depiction(wcn_sections) -> None:
     pytest.importorskip("rdkit")
     parm7_path = Path(__file__).resolve().parents[1] / "tests" / "data" / "wcn.parm7"
     assert parm7_path.exists()
-    resname = _first_resname(parm7_path)
+    resname = _first_resname(wcn_sections)
     if not resname:
         pytest.skip("No residue labels available in sample parm7")
     result = load_system_data(str(parm7_path), rst7_path=None, resname=resname)
@@ -53,10 +51,10 @@ def test_parm7_only_loads_2d_depiction() -> None:
     assert result.depiction.get("atom_serials")
 
 
-def test_parm7_only_loads_system_info_with_cpu_submit() -> None:
+def test_parm7_only_loads_system_info_with_cpu_submit(wcn_sections) -> None:
     parm7_path = Path(__file__).resolve().parents[1] / "tests" / "data" / "wcn.parm7"
     assert parm7_path.exists()
-    resname = _first_resname(parm7_path)
+    resname = _first_resname(wcn_sections)
     if not resname:
         pytest.skip("No residue labels available in sample parm7")
 
@@ -277,13 +275,12 @@ def test_is_resname_all() -> None:
     assert _is_resname_all("") is False
 
 
-def test_parm7_all_residues_2d_depiction() -> None:
+def test_parm7_all_residues_2d_depiction(wcn_sections) -> None:
     pytest.importorskip("rdkit")
     parm7_path = Path(__file__).resolve().parents[1] / "tests" / "data" / "wcn.parm7"
     assert parm7_path.exists()
-    from topview.services.parm7 import parse_parm7, parse_pointers
-    _, sections = parse_parm7(str(parm7_path))
-    pointers = parse_pointers(sections.get("POINTERS"))
+    from topview.services.parm7 import parse_pointers
+    pointers = parse_pointers(wcn_sections.get("POINTERS"))
     natom = int(pointers.get("NATOM", 0))
     if natom > 500:
         pytest.skip(f"System too large for 2D 'all' depiction ({natom} atoms)")
@@ -1,3 +1,4 @@
+import threading
 from pathlib import Path
 
 from topview.model import Model
@@ -180,3 +181,26 @@ def test_system_info_selection_integration_without_optional_sections() -> None:
         if dihedrals:
             assert all(entry.get("scee") is None for entry in dihedrals)
             assert all(entry.get("scnb") is None for entry in dihedrals)
+
+
+def test_loaded_snapshot_readers_do_not_take_model_lock() -> None:
+    root = Path(__file__).resolve().parents[1]
+    model = Model()
+    assert model.load_system(
+        str(root / "tests" / "data" / "wcn.parm7"),
+        str(root / "tests" / "data" / "wcnref.rst7"),
+    )["ok"]
+
+    results = {}
+
+    def _read() -> None:
+        results["pointers"] = model.get_parm7_pointers()
+        results["sections"] = model.get_parm7_sections()
+        results["atom"] = model.get_atom_info(1)
+
+    with model._lock:
+        reader = threading.Thread(target=_read)
+        reader.start()
+        reader.join(timeout=10)
+    assert not reader.is_alive()
+    assert all(payload["ok"] for payload in results.values())
@@ -0,0 +1,30 @@
+import pytest
+
+from topview.worker import Worker
+
+
+@pytest.fixture
+def shared_worker_reset():
+    Worker.reset_shared()
+    yield
+    Worker.reset_shared()
+
+
+def test_shared_worker_is_reused(shared_worker_reset) -> None:
+    worker = Worker.shared(max_workers=2)
+    assert Worker.shared() is worker
+    assert Worker.shared(max_workers=2, max_processes=0) is worker
+    assert worker.submit(sum, [1, 2, 3]).result() == 6
+    worker.prewarm(("topview.services.system_info",))
+
+
+def test_shared_worker_rejects_conflicting_sizes(shared_worker_reset) -> None:
+    worker = Worker.shared(max_workers=2)
+
+    with pytest.raises(ValueError):
+        Worker.shared(max_processes=1)
+    with pytest.raises(ValueError):
+        Worker.shared(max_workers=3)
+
+    Worker.reset_shared()
+    assert Worker.shared(max_workers=3) is not worker
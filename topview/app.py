@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
-import argparse
-import csv
-import io
+import functools
 import logging
+import importlib
 import os
 from pathlib import Path
 import sys
+import threading
+from types import SimpleNamespace
 from typing import Optional, Sequence, Tuple
 
 from topview import config
@@ -38,11 +39,34 @@ _EXPORT_TABLE_SPECS = {
     },
 }
 
+_PRELOAD_MODULES = ("numpy", "MDAnalysis", "topview.model.model", "topview.bridge")
+
+
+def _preload_modules() -> threading.Thread:
+    """Import heavy modules in a background thread.
+
+    Returns
+    -------
+    threading.Thread
+        Started daemon thread performing the imports.
+    """
+
+    def _run() -> None:
+        for name in _PRELOAD_MODULES:
+            try:
+                importlib.import_module(name)
+            except Exception:
+                logger.debug("Preloading %s failed", name, exc_info=True)
+
+    thread = threading.Thread(target=_run, name="topview-preload", daemon=True)
+    thread.start()
+    return thread
+
 
 def _parse_parm7(path: str):
     from topview.services.parm7 import parse_parm7
 
-    return parse_parm7(path)
+    return parse_parm7(path, include_text=False)
 
 
 def _parse_pointers(section):
@@ -93,7 +117,9 @@ def _validate_nmr_startup_inputs(
         raise SystemExit(f"Failed to parse NMR restraints: {exc}") from exc
 
 
-def _parse_args(argv: list[str]) -> argparse.Namespace:
+def _build_arg_parser():
+    import argparse
+
     parser = argparse.ArgumentParser(description=f"{config.APP_NAME}")
     parser.add_argument("parm7_path", nargs="?", help="Path to parm7/prmtop file")
     parser.add_argument("rst7_path", nargs="?", help="Path to rst7/inpcrd file")
@@ -131,7 +157,84 @@ def _parse_args(argv: list[str]) -> argparse.Namespace:
         default=config.DEFAULT_INFO_FONT_SIZE,
         help="Font size (pt) for section info popups",
     )
-    return parser.parse_args(argv[1:])
+    return parser
+
+
+_OPTION_DESTS = {
+    "--export": "export",
+    "--nmr": "nmr_path",
+    "--resname": "resname",
+    "--log-file": "log_file",
+    "--info-font-size": "info_font_size",
+}
+
+
+def _parse_args(argv: Sequence[str]) -> SimpleNamespace:
+    """Parse command-line arguments.
+
+    Common invocations are parsed by hand so argparse is not imported at
+    startup; help requests, abbreviations and malformed input are handed
+    to the argparse parser for its usual messages. Results are memoized
+    per argument vector, so re-entering ``main`` does not parse again.
+
+    Parameters
+    ----------
+    argv
+        Full argument vector including the program name.
+
+    Returns
+    -------
+    types.SimpleNamespace
+        Parsed arguments; treat as read-only, it is shared between calls.
+    """
+
+    return _parse_argv(tuple(argv))
+
+
+@functools.lru_cache(maxsize=1)
+def _parse_argv(argv: Tuple[str, ...]) -> SimpleNamespace:
+    values: dict[str, object] = {
+        "parm7_path": None,
+        "rst7_path": None,
+        "export": None,
+        "nmr_path": None,
+        "resname": config.DEFAULT_RESNAME,
+        "log_file": None,
+        "info_font_size": config.DEFAULT_INFO_FONT_SIZE,
+    }
+    positionals: list[str] = []
+    args = argv[1:]
+    idx = 0
+    # argparse fills both optional positionals from the first run of them, so
+    # a positional after an option that ended such a run is an error there.
+    positionals_closed = False
+    try:
+        while idx < len(args):
+            arg = args[idx]
+            idx += 1
+            if not arg.startswith("-"):
+                if positionals_closed:
+                    raise ValueError(arg)
+                positionals.append(arg)
+                continue
+            positionals_closed = bool(positionals)
+            name, sep, value = arg.partition("=")
+            dest = _OPTION_DESTS.get(name)
+            if dest is None:
+                raise ValueError(arg)
+            if not sep:
+                if idx >= len(args) or args[idx].startswith("-"):
+                    raise ValueError(arg)
+                value = args[idx]
+                idx += 1
+            values[dest] = float(value) if dest == "info_font_size" else value
+        if len(positionals) > 2:
+            raise ValueError(positionals)
+    except ValueError:
+        return SimpleNamespace(**vars(_build_arg_parser().parse_args(args)))
+    values["parm7_path"] = positionals[0] if positionals else None
+    values["rst7_path"] = positionals[1] if len(positionals) > 1 else None
+    return SimpleNamespace(**values)
 
 
 def _parse_export_terms(value: Optional[str]) -> list[str]:
@@ -156,6 +259,9 @@ def _parse_export_terms(value: Optional[str]) -> list[str]:
 
 
 def _build_csv_text(columns: Sequence[object], rows: Sequence[Sequence[object]]) -> str:
+    import csv
+    import io
+
     buffer = io.StringIO(newline="")
     writer = csv.writer(buffer, lineterminator="\n")
     writer.writerow(columns)
@@ -191,6 +297,24 @@ def _export_system_info_csvs(
     return exported_paths
 
 
+def _prewarm_worker() -> None:
+    """Spawn the shared worker's process pool and import its task modules.
+
+    Passed to ``webview.start`` so the spawn overlaps GUI and page startup
+    instead of delaying ``create_window``.
+
+    Returns
+    -------
+    None
+        This function does not return a value.
+    """
+
+    from topview.worker import Worker
+
+    # System info tables are built in the process pool right after a load.
+    Worker.shared().prewarm(("topview.services.system_info",))
+
+
 def create_app(
     initial_paths: Optional[Tuple[str, Optional[str]]] = None,
     info_font_size: float = config.DEFAULT_INFO_FONT_SIZE,
@@ -216,11 +340,17 @@ def create_app(
 
     import webview
     from topview.bridge import Api
-    from topview.model import Model
+    from topview.model import LazyModel
     from topview.worker import Worker
 
-    worker = Worker(max_workers=1, max_processes=1)
-    model = Model(cpu_submit=worker.submit_cpu)
+    worker = Worker.shared(max_processes=1)
+
+    def _build_model():
+        from topview.model import Model
+
+        return Model(cpu_submit=worker.submit_cpu)
+
+    model = LazyModel(_build_model)
     api = Api(
         model=model,
         worker=worker,
@@ -268,6 +398,7 @@ def main() -> None:
             print(output_path)
         return
 
+    _preload_modules()
     _validate_nmr_startup_inputs(args.parm7_path, args.rst7_path, args.nmr_path)
     import webview
 
@@ -288,7 +419,7 @@ def main() -> None:
         logger.debug("Using pywebview GUI backend: %s", gui)
     else:
         logger.debug("Using pywebview GUI backend: auto")
-    webview.start(debug=False, gui=gui)
+    webview.start(_prewarm_worker, debug=False, gui=gui)
 
 
 if __name__ == "__main__":
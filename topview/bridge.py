@@ -3,8 +3,13 @@
 from __future__ import annotations
 
 import base64
+import functools
+import json
 import logging
-from typing import Dict, Optional
+import math
+import threading
+import uuid
+from typing import TYPE_CHECKING, Callable, Dict, Optional, Tuple
 
 try:
     import webview
@@ -13,12 +18,166 @@ except (
 ):  # pragma: no cover - exercised in test environments without GUI deps
     webview = None
 
+try:
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - optional speedup
+    orjson = None
+
 from topview.errors import ModelError, error_result
-from topview.model import Model
 from topview.worker import Worker
 
+if TYPE_CHECKING:
+    from topview.model import Model
+
 logger = logging.getLogger(__name__)
 
+LOOKUP_CACHE_LIMIT = 4096
+MAX_HIGHLIGHT_SERIALS = 4096
+CSV_WRITE_BUFFER = 1 << 20
+
+# Methods reachable through ``Api.batch``; dialog-driven calls are left out so
+# one batch never blocks on user input.
+BATCH_METHODS = (
+    "get_initial_paths",
+    "get_ui_config",
+    "load_system",
+    "get_atom_info",
+    "get_all_charges",
+    "get_atom_bundle",
+    "get_atom_bundles",
+    "get_atom_infos",
+    "get_residue_infos",
+    "query_atoms",
+    "get_residue_info",
+    "get_parm7_text",
+    "get_parm7_chunk",
+    "get_parm7_sections",
+    "get_parm7_pointers",
+    "get_system_info",
+    "get_system_info_selection",
+    "get_parm7_highlights",
+    "log_client_error",
+)
+
+# Every method pywebview exposes to JS.
+EXPOSED_METHODS = BATCH_METHODS + (
+    "batch",
+    "save_system_info_csv",
+    "save_viewer_image",
+    "select_files",
+)
+
+# Static error payloads are built once and shared; bridge results are only
+# serialized, never mutated.
+_ERR_PAYLOAD_NOT_OBJECT = error_result("invalid_input", "payload must be an object")
+_ERR_NO_WINDOW = error_result("no_window", "Window is not available")
+_ERR_NO_WEBVIEW = error_result("missing_dependency", "pywebview is not available")
+_ERR_NO_PARM7_SELECTED = error_result("cancelled", "No parm7 file selected")
+_ERR_SAVE_CANCELLED = error_result("cancelled", "Save cancelled")
+_ERR_BATCH_CALL_NOT_OBJECT = error_result("invalid_input", "batch call must be an object")
+_ERR_VALUE_REQUIRED = error_result("invalid_input", "value is required")
+_ERR_SERIAL_REQUIRED = error_result("invalid_input", "serial or serials is required")
+_ERR_SERIALS_NOT_LIST = error_result("invalid_input", "serials must be a list")
+_ERR_TOO_MANY_SERIALS = error_result(
+    "invalid_input", f"At most {MAX_HIGHLIGHT_SERIALS} serials can be highlighted"
+)
+_ERR_NOT_LIST = {
+    key: error_result("invalid_input", f"{key} must be a list")
+    for key in ("serials", "resids", "calls")
+}
+
+
+def _error_payload(label: str, exc: Exception) -> Dict[str, object]:
+    """Log an exception raised by ``label`` and map it to an API error payload.
+
+    Must be called from the ``except`` block handling ``exc``.
+    """
+
+    if isinstance(exc, ModelError):
+        logger.exception("%s failed", label)
+        return exc.to_result()
+    logger.exception("%s unexpected error", label)
+    return error_result("unexpected", "Unexpected error", str(exc))
+
+
+def _invoke(label: str, fn: Callable[..., object], *args: object) -> object:
+    """Call ``fn`` and map exceptions to API error payloads.
+
+    Parameters
+    ----------
+    label
+        Operation name used in log messages.
+    fn
+        Callable to execute.
+    *args
+        Positional arguments to pass to ``fn``.
+
+    Returns
+    -------
+    object
+        Result of ``fn`` or an error payload.
+    """
+
+    try:
+        return fn(*args)
+    except Exception as exc:
+        return _error_payload(label, exc)
+
+
+def _validated(*required: str, optional: bool = False):
+    """Validate a bridge payload and map exceptions to error payloads.
+
+    The wrapper is specialized when the method is decorated: optional methods
+    skip validation entirely, and the missing-key error payloads are built
+    once, so a call only pays one type check and one lookup per required key.
+
+    Parameters
+    ----------
+    *required
+        Payload keys that must be present and not None.
+    optional
+        When true, a missing or non-object payload is passed through as-is.
+
+    Returns
+    -------
+    callable
+        Decorator for ``Api`` methods taking a single payload argument.
+    """
+
+    missing = tuple(
+        (key, error_result("invalid_input", f"{key} is required")) for key in required
+    )
+
+    def decorator(fn):
+        label = fn.__name__
+
+        if optional:
+
+            @functools.wraps(fn)
+            def wrapper(self, payload=None):
+                try:
+                    return fn(self, payload)
+                except Exception as exc:
+                    return _error_payload(label, exc)
+
+            return wrapper
+
+        @functools.wraps(fn)
+        def wrapper(self, payload=None):
+            if not isinstance(payload, dict):
+                return _ERR_PAYLOAD_NOT_OBJECT
+            for key, error in missing:
+                if payload.get(key) is None:
+                    return error
+            try:
+                return fn(self, payload)
+            except Exception as exc:
+                return _error_payload(label, exc)
+
+        return wrapper
+
+    return decorator
+
 
 class Api:
     """Pywebview API surface for the frontend.
@@ -37,6 +196,15 @@ class Api:
         Optional residue name for parm7-only depictions.
     _ui_config
         UI configuration payload for the frontend.
+    _ui_config_result
+        Prebuilt ``get_ui_config`` response; the config never changes.
+    _lookup_cache
+        Memoized successful lookup payloads for the loaded system.
+    _cache_generation
+        Counter bumped on every load so in-flight lookups never repopulate
+        the cache with results from a previous system.
+    _batch_methods
+        Bound handlers reachable through ``batch``, keyed by method name.
     """
 
     def __init__(
@@ -78,6 +246,17 @@ class Api:
         self._initial_resname = initial_resname
         self._initial_nmr_path = initial_nmr_path
         self._ui_config = ui_config or {}
+        self._ui_config_result = {"ok": True, "config": self._ui_config}
+        self._lookup_cache: Dict[Tuple[str, object], Dict[str, object]] = {}
+        self._cache_generation = 0
+        self._cache_lock = threading.Lock()
+        # Bound methods live in the instance dict so pywebview's per-call
+        # attribute lookup skips descriptor resolution on the class.
+        for name in EXPOSED_METHODS:
+            self.__dict__[name] = getattr(self, name)
+        self._batch_methods: Dict[str, Callable[..., object]] = {
+            name: self.__dict__[name] for name in BATCH_METHODS
+        }
 
     def set_window(self, window) -> None:
         """Bind the pywebview window for dialog usage.
@@ -146,8 +325,9 @@ class Api:
             Payload with UI configuration.
         """
 
-        return {"ok": True, "config": self._ui_config}
+        return self._ui_config_result
 
+    @_validated()
     def load_system(self, payload: Dict[str, object]):
         """Load a parm7/rst7 pair or parm7-only system.
 
@@ -155,41 +335,46 @@ class Api:
         ----------
         payload
             Payload containing parm7_path, optional rst7_path, and optional resname.
+            When ``async`` is true the call returns a task id immediately and the
+            result is delivered through ``window.__topviewTaskDone``. When
+            ``include_initial`` is true the ``get_parm7_text`` and
+            ``get_parm7_sections`` payloads are attached as ``parm7_text`` and
+            ``parm7_sections``.
 
         Returns
         -------
         dict
-            Load response payload.
+            Load response payload, or a task id payload for async calls.
         """
 
-        if not isinstance(payload, dict):
-            return error_result("invalid_input", "payload must be an object")
         parm7_path = payload.get("parm7_path") or None
         rst7_path = payload.get("rst7_path") or None
         resname = payload.get("resname")
         nmr_path = payload.get("nmr_path") or None
-        try:
-            logger.debug(
-                "load_system requested parm7=%s rst7=%s nmr=%s",
-                parm7_path,
-                rst7_path,
-                nmr_path,
-            )
-            future = self._worker.submit(
-                self._model.load_system,
+        include_initial = bool(payload.get("include_initial"))
+        logger.debug(
+            "load_system requested parm7=%s rst7=%s nmr=%s",
+            parm7_path,
+            rst7_path,
+            nmr_path,
+        )
+        if self._wants_task(payload):
+            return self._submit_task(
+                "load_system",
+                self._load_system,
                 parm7_path,
                 rst7_path,
                 resname,
                 nmr_path,
+                include_initial,
             )
-            return future.result()
-        except ModelError as exc:
-            logger.exception("load_system failed")
-            return exc.to_result()
-        except Exception as exc:
-            logger.exception("load_system unexpected error")
-            return error_result("unexpected", "Unexpected error", str(exc))
+        # The bridge thread would only block on the pool, so synchronous
+        # calls run inline; the Model guards its own state with a lock.
+        return self._load_system(
+            parm7_path, rst7_path, resname, nmr_path, include_initial
+        )
 
+    @_validated("serial")
     def get_atom_info(self, payload: Dict[str, object]):
         """Return atom metadata for a serial.
 
@@ -204,21 +389,12 @@ class Api:
             Atom metadata payload.
         """
 
-        if not isinstance(payload, dict):
-            return error_result("invalid_input", "payload must be an object")
-        serial = payload.get("serial")
-        if serial is None:
-            return error_result("invalid_input", "serial is required")
-        try:
+        serial = payload["serial"]
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("get_atom_info serial=%s", serial)
-            return self._model.get_atom_info(serial)
-        except ModelError as exc:
-            logger.exception("get_atom_info failed")
-            return exc.to_result()
-        except Exception as exc:
-            logger.exception("get_atom_info unexpected error")
-            return error_result("unexpected", "Unexpected error", str(exc))
+        return self._lookup_atom_info(serial)
 
+    @_validated(optional=True)
     def get_all_charges(self, payload: Optional[Dict[str, object]] = None):
         """Return per-atom charges for all atoms, optionally filtered by residue name.
 
@@ -236,16 +412,11 @@ class Api:
         resname = None
         if isinstance(payload, dict):
             resname = payload.get("resname") or None
-        try:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("get_all_charges requested resname=%s", resname)
-            return self._model.get_all_charges(resname)
-        except ModelError as exc:
-            logger.exception("get_all_charges failed")
-            return exc.to_result()
-        except Exception as exc:
-            logger.exception("get_all_charges unexpected error")
-            return error_result("unexpected", "Unexpected error", str(exc))
+        return self._model.get_all_charges(resname)
 
+    @_validated("serial")
     def get_atom_bundle(self, payload: Dict[str, object]):
         """Return atom metadata plus parm7 highlights.
 
@@ -260,21 +431,250 @@ class Api:
             Atom bundle payload.
         """
 
-        if not isinstance(payload, dict):
-            return error_result("invalid_input", "payload must be an object")
-        serial = payload.get("serial")
-        if serial is None:
-            return error_result("invalid_input", "serial is required")
-        try:
+        serial = payload["serial"]
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("get_atom_bundle serial=%s", serial)
-            return self._model.get_atom_bundle(serial)
+        return self._lookup_atom_bundle(serial)
+
+    @_validated("serials")
+    def get_atom_bundles(self, payload: Dict[str, object]):
+        """Return atom bundles for several serials in one bridge call.
+
+        Parameters
+        ----------
+        payload
+            Payload containing a list of atom serials.
+
+        Returns
+        -------
+        dict
+            Payload with one bundle or error payload per serial, in order.
+        """
+
+        serials = _batch_values(payload, "serials")
+        if isinstance(serials, dict):
+            return serials
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("get_atom_bundles count=%d", len(serials))
+        items = [
+            self._batch_item("get_atom_bundle", self._lookup_atom_bundle, serial)
+            for serial in serials
+        ]
+        return {"ok": True, "items": items}
+
+    @_validated("serials")
+    def get_atom_infos(self, payload: Dict[str, object]):
+        """Return atom metadata for several serials in one bridge call.
+
+        Parameters
+        ----------
+        payload
+            Payload containing a list of atom serials.
+
+        Returns
+        -------
+        dict
+            Payload with one atom info or error payload per serial, in order.
+        """
+
+        serials = _batch_values(payload, "serials")
+        if isinstance(serials, dict):
+            return serials
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("get_atom_infos count=%d", len(serials))
+        items = [
+            self._batch_item("get_atom_info", self._lookup_atom_info, serial)
+            for serial in serials
+        ]
+        return {"ok": True, "items": items}
+
+    @_validated("resids")
+    def get_residue_infos(self, payload: Dict[str, object]):
+        """Return residue metadata for several residue ids in one bridge call.
+
+        Parameters
+        ----------
+        payload
+            Payload containing a list of residue ids.
+
+        Returns
+        -------
+        dict
+            Payload with one residue info or error payload per resid, in order.
+        """
+
+        resids = _batch_values(payload, "resids")
+        if isinstance(resids, dict):
+            return resids
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("get_residue_infos count=%d", len(resids))
+        items = [
+            self._batch_item("get_residue_info", self._lookup_residue_info, resid)
+            for resid in resids
+        ]
+        return {"ok": True, "items": items}
+
+    @_validated("calls")
+    def batch(self, payload: Dict[str, object]):
+        """Run several API calls in one bridge round-trip.
+
+        Parameters
+        ----------
+        payload
+            Payload containing ``calls``, a list of ``{method, payload}``
+            entries naming methods from ``BATCH_METHODS``.
+
+        Returns
+        -------
+        dict
+            Payload with one result or error payload per call, in order.
+        """
+
+        calls = _batch_values(payload, "calls")
+        if isinstance(calls, dict):
+            return calls
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("batch count=%d", len(calls))
+        return {"ok": True, "results": [self._batch_call(call) for call in calls]}
+
+    def _batch_call(self, call: object) -> object:
+        if not isinstance(call, dict):
+            return _ERR_BATCH_CALL_NOT_OBJECT
+        name = call.get("method")
+        handler = self._batch_methods.get(name) if isinstance(name, str) else None
+        if handler is None:
+            return error_result("invalid_input", f"Unknown batch method: {name}")
+        return _invoke(name, handler, call.get("payload"))
+
+    def _load_system(
+        self,
+        parm7_path: Optional[str],
+        rst7_path: Optional[str],
+        resname: Optional[str],
+        nmr_path: Optional[str],
+        include_initial: bool = False,
+    ) -> Dict[str, object]:
+        self._invalidate_lookups()
+        try:
+            result = self._model.load_system(parm7_path, rst7_path, resname, nmr_path)
+        finally:
+            self._invalidate_lookups()
+        if isinstance(result, dict) and result.get("ok"):
+            self._worker.submit(self._prefetch_highlight_indices)
+        if not include_initial:
+            self._worker.submit(self._prefetch_parm7_payloads)
+            return result
+        if isinstance(result, dict) and result.get("ok"):
+            result = dict(result)
+            result["parm7_text"] = _invoke("get_parm7_text", self._model.get_parm7_text)
+            result["parm7_sections"] = _invoke(
+                "get_parm7_sections",
+                self._cached,
+                "parm7_sections",
+                None,
+                self._model.get_parm7_sections,
+            )
+        return result
+
+    def _prefetch_parm7_payloads(self) -> None:
+        """Build the parm7 section payload ahead of the frontend asking.
+
+        The parm7 text is deliberately not prefetched: it is read from disk on
+        demand so a large topology is never held in memory as base64.
+        """
+
+        try:
+            self._cached("parm7_sections", None, self._model.get_parm7_sections)
         except ModelError as exc:
-            logger.exception("get_atom_bundle failed")
-            return exc.to_result()
+            logger.debug("Skipping parm7 payload prefetch: %s", exc.message)
+        except Exception:
+            logger.exception("parm7 payload prefetch failed")
+
+    def _prefetch_highlight_indices(self) -> None:
+        """Build the highlight term indices before the first selection."""
+
+        try:
+            self._model.warm_highlight_indices()
+        except ModelError as exc:
+            logger.debug("Skipping highlight index prefetch: %s", exc.message)
+        except Exception:
+            logger.exception("highlight index prefetch failed")
+
+    def _invalidate_lookups(self) -> None:
+        with self._cache_lock:
+            self._cache_generation += 1
+            self._lookup_cache.clear()
+
+    def _cached(
+        self, kind: str, key: object, fn: Callable[..., Dict[str, object]], *args: object
+    ) -> Dict[str, object]:
+        cache_key = (kind, key)
+        cached = self._lookup_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        generation = self._cache_generation
+        result = fn(*args)
+        if isinstance(result, dict) and result.get("ok"):
+            with self._cache_lock:
+                if generation == self._cache_generation:
+                    if len(self._lookup_cache) >= LOOKUP_CACHE_LIMIT:
+                        self._lookup_cache.pop(next(iter(self._lookup_cache)))
+                    self._lookup_cache[cache_key] = result
+        return result
+
+    def _lookup_atom_info(self, serial: object) -> Dict[str, object]:
+        key = _cache_key(serial)
+        if key is None:
+            return self._model.get_atom_info(serial)
+        return self._cached("atom_info", key, self._model.get_atom_info, key)
+
+    def _lookup_atom_bundle(self, serial: object) -> Dict[str, object]:
+        key = _cache_key(serial)
+        if key is None:
+            return self._model.get_atom_bundle(serial)
+        return self._cached("atom_bundle", key, self._model.get_atom_bundle, key)
+
+    def _lookup_residue_info(self, resid: object) -> Dict[str, object]:
+        key = _cache_key(resid)
+        if key is None:
+            return self._model.get_residue_info(resid)
+        return self._cached("residue_info", key, self._model.get_residue_info, key)
+
+    def _wants_task(self, payload: Dict[str, object]) -> bool:
+        return bool(payload.get("async")) and self._window is not None
+
+    def _submit_task(self, label: str, fn, *args: object) -> Dict[str, object]:
+        task_id = uuid.uuid4().hex
+        future = self._worker.submit(fn, *args)
+        future.add_done_callback(
+            lambda done: self._deliver_task(label, task_id, done)
+        )
+        return {"ok": True, "task_id": task_id}
+
+    def _deliver_task(self, label: str, task_id: str, future) -> None:
+        result = _invoke(label, future.result)
+        window = self._window
+        if window is None:
+            return
+        try:
+            payload = _dumps_js(result)
         except Exception as exc:
-            logger.exception("get_atom_bundle unexpected error")
-            return error_result("unexpected", "Unexpected error", str(exc))
+            # The JS promise waits on this task id; answer it with an error
+            # instead of leaving it pending forever.
+            payload = json.dumps(_error_payload(f"{label} serialize", exc))
+        script = f"window.__topviewTaskDone({json.dumps(task_id)}, {payload})"
+        try:
+            window.evaluate_js(script)
+        except Exception:
+            logger.exception("Failed to deliver %s result", label)
+
+    @staticmethod
+    def _batch_item(label: str, fn, value: object) -> Dict[str, object]:
+        if value is None:
+            return _ERR_VALUE_REQUIRED
+        return _invoke(label, fn, value)
 
+    @_validated()
     def query_atoms(self, payload: Dict[str, object]):
         """Query atoms by filter criteria.
 
@@ -289,20 +689,14 @@ class Api:
             Query response payload.
         """
 
-        if not isinstance(payload, dict):
-            return error_result("invalid_input", "payload must be an object")
         filters = payload.get("filters", {})
-        try:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("query_atoms filters=%s", filters)
-            future = self._worker.submit(self._model.query_atoms, filters)
-            return future.result()
-        except ModelError as exc:
-            logger.exception("query_atoms failed")
-            return exc.to_result()
-        except Exception as exc:
-            logger.exception("query_atoms unexpected error")
-            return error_result("unexpected", "Unexpected error", str(exc))
+        if self._wants_task(payload):
+            return self._submit_task("query_atoms", self._model.query_atoms, filters)
+        return self._model.query_atoms(filters)
 
+    @_validated("resid")
     def get_residue_info(self, payload: Dict[str, object]):
         """Return residue metadata for a residue id.
 
@@ -317,21 +711,12 @@ class Api:
             Residue metadata payload.
         """
 
-        if not isinstance(payload, dict):
-            return error_result("invalid_input", "payload must be an object")
-        resid = payload.get("resid")
-        if resid is None:
-            return error_result("invalid_input", "resid is required")
-        try:
+        resid = payload["resid"]
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("get_residue_info resid=%s", resid)
-            return self._model.get_residue_info(resid)
-        except ModelError as exc:
-            logger.exception("get_residue_info failed")
-            return exc.to_result()
-        except Exception as exc:
-            logger.exception("get_residue_info unexpected error")
-            return error_result("unexpected", "Unexpected error", str(exc))
+        return self._lookup_residue_info(resid)
 
+    @_validated(optional=True)
     def get_parm7_text(self, payload: Optional[Dict[str, object]] = None):
         """Return base64-encoded parm7 text.
 
@@ -346,16 +731,31 @@ class Api:
             Payload containing parm7 text.
         """
 
-        try:
-            logger.debug("get_parm7_text requested")
-            return self._model.get_parm7_text()
-        except ModelError as exc:
-            logger.exception("get_parm7_text failed")
-            return exc.to_result()
-        except Exception as exc:
-            logger.exception("get_parm7_text unexpected error")
-            return error_result("unexpected", "Unexpected error", str(exc))
+        logger.debug("get_parm7_text requested")
+        return self._model.get_parm7_text()
 
+    @_validated("offset", "length")
+    def get_parm7_chunk(self, payload: Dict[str, object]):
+        """Return a base64-encoded byte range of the parm7 file.
+
+        Parameters
+        ----------
+        payload
+            Payload containing ``offset`` and ``length`` in bytes.
+
+        Returns
+        -------
+        dict
+            Payload containing ``offset``, ``size`` and ``data_b64``.
+        """
+
+        offset = payload["offset"]
+        length = payload["length"]
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("get_parm7_chunk offset=%s length=%s", offset, length)
+        return self._model.get_parm7_chunk(offset, length)
+
+    @_validated(optional=True)
     def get_parm7_sections(self, payload: Optional[Dict[str, object]] = None):
         """Return parm7 section metadata.
 
@@ -370,27 +770,15 @@ class Api:
             Payload containing parm7 sections.
         """
 
-        try:
-            logger.debug("get_parm7_sections requested")
-            return self._model.get_parm7_sections()
-        except ModelError as exc:
-            logger.exception("get_parm7_sections failed")
-            return exc.to_result()
-        except Exception as exc:
-            logger.exception("get_parm7_sections unexpected error")
-            return error_result("unexpected", "Unexpected error", str(exc))
+        logger.debug("get_parm7_sections requested")
+        return self._cached("parm7_sections", None, self._model.get_parm7_sections)
 
+    @_validated(optional=True)
     def get_parm7_pointers(self, payload: Optional[Dict[str, object]] = None):
-        try:
-            logger.debug("get_parm7_pointers requested")
-            return self._model.get_parm7_pointers()
-        except ModelError as exc:
-            logger.exception("get_parm7_pointers failed")
-            return exc.to_result()
-        except Exception as exc:
-            logger.exception("get_parm7_pointers unexpected error")
-            return error_result("unexpected", "Unexpected error", str(exc))
+        logger.debug("get_parm7_pointers requested")
+        return self._cached("parm7_pointers", None, self._model.get_parm7_pointers)
 
+    @_validated(optional=True)
     def get_system_info(self, payload: Optional[Dict[str, object]] = None):
         """Return system info tables for the Info panel.
 
@@ -405,16 +793,10 @@ class Api:
             Payload containing system info tables.
         """
 
-        try:
-            logger.debug("get_system_info requested")
-            return self._model.get_system_info()
-        except ModelError as exc:
-            logger.exception("get_system_info failed")
-            return exc.to_result()
-        except Exception as exc:
-            logger.exception("get_system_info unexpected error")
-            return error_result("unexpected", "Unexpected error", str(exc))
+        logger.debug("get_system_info requested")
+        return self._cached("system_info", None, self._model.get_system_info)
 
+    @_validated()
     def get_system_info_selection(self, payload: Dict[str, object]):
         """Return a selection for a system info table row.
 
@@ -429,8 +811,6 @@ class Api:
             Selection payload.
         """
 
-        if not isinstance(payload, dict):
-            return error_result("invalid_input", "payload must be an object")
         table = payload.get("table")
         row_index = payload.get("row_index")
         cursor = payload.get("cursor", 0)
@@ -446,23 +826,14 @@ class Api:
             )
         if row_idx < 0 or cursor_idx < 0:
             return error_result("invalid_input", "row_index and cursor must be >= 0")
-        try:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug(
                 "get_system_info_selection table=%s row=%s cursor=%s",
                 table_name,
                 row_idx,
                 cursor_idx,
             )
-            future = self._worker.submit(
-                self._model.get_system_info_selection, table_name, row_idx, cursor_idx
-            )
-            return future.result()
-        except ModelError as exc:
-            logger.exception("get_system_info_selection failed")
-            return exc.to_result()
-        except Exception as exc:
-            logger.exception("get_system_info_selection unexpected error")
-            return error_result("unexpected", "Unexpected error", str(exc))
+        return self._model.get_system_info_selection(table_name, row_idx, cursor_idx)
 
     def save_system_info_csv(self, payload: Dict[str, object]):
         """Save a CSV payload to disk via a save dialog.
@@ -470,7 +841,9 @@ class Api:
         Parameters
         ----------
         payload
-            Payload containing csv_text and optional name.
+            Payload containing csv_text and optional name. ``csv_chunks``, a
+            list of strings written back to back, may be sent instead of
+            ``csv_text`` so the file is streamed without joining the text.
 
         Returns
         -------
@@ -479,14 +852,17 @@ class Api:
         """
 
         if not self._window:
-            return error_result("no_window", "Window is not available")
+            return _ERR_NO_WINDOW
         if webview is None:
-            return error_result("missing_dependency", "pywebview is not available")
+            return _ERR_NO_WEBVIEW
         if not isinstance(payload, dict):
-            return error_result("invalid_input", "payload must be an object")
+            return _ERR_PAYLOAD_NOT_OBJECT
         csv_text = payload.get("csv_text")
+        csv_chunks = payload.get("csv_chunks")
         name = payload.get("name") or "topview-system-info.csv"
-        if csv_text is None:
+        if csv_chunks is not None and not isinstance(csv_chunks, (list, tuple)):
+            return error_result("invalid_input", "csv_chunks must be a list")
+        if csv_text is None and csv_chunks is None:
             return error_result("invalid_input", "csv_text is required")
         if not isinstance(name, str):
             name = str(name)
@@ -505,10 +881,15 @@ class Api:
                 file_types=("CSV (*.csv)", "All files (*.*)"),
             )
             if not selection:
-                return error_result("cancelled", "Save cancelled")
+                return _ERR_SAVE_CANCELLED
             path = selection[0] if isinstance(selection, (list, tuple)) else selection
-            with open(path, "w", encoding="utf-8", newline="") as handle:
-                handle.write(str(csv_text))
+            with open(
+                path, "w", encoding="utf-8", newline="", buffering=CSV_WRITE_BUFFER
+            ) as handle:
+                if csv_chunks is not None:
+                    handle.writelines(map(str, csv_chunks))
+                else:
+                    handle.write(str(csv_text))
             return {"ok": True, "path": path}
         except Exception as exc:
             logger.exception("save_system_info_csv failed")
@@ -529,11 +910,11 @@ class Api:
         """
 
         if not self._window:
-            return error_result("no_window", "Window is not available")
+            return _ERR_NO_WINDOW
         if webview is None:
-            return error_result("missing_dependency", "pywebview is not available")
+            return _ERR_NO_WEBVIEW
         if not isinstance(payload, dict):
-            return error_result("invalid_input", "payload must be an object")
+            return _ERR_PAYLOAD_NOT_OBJECT
         data = payload.get("data")
         fmt = str(payload.get("format") or "png").lower()
         if fmt != "png":
@@ -558,7 +939,7 @@ class Api:
                 file_types=file_types,
             )
             if not selection:
-                return error_result("cancelled", "Save cancelled")
+                return _ERR_SAVE_CANCELLED
             path = selection[0] if isinstance(selection, (list, tuple)) else selection
             raw = data if isinstance(data, str) else str(data)
             if raw.startswith("data:"):
@@ -574,6 +955,7 @@ class Api:
             logger.exception("save_viewer_image failed")
             return error_result("save_failed", "Failed to save image", str(exc))
 
+    @_validated()
     def get_parm7_highlights(self, payload: Dict[str, object]):
         """Return parm7 highlight spans.
 
@@ -588,29 +970,47 @@ class Api:
             Payload containing highlights and interactions.
         """
 
-        if not isinstance(payload, dict):
-            return error_result("invalid_input", "payload must be an object")
         serials = payload.get("serials")
         serial = payload.get("serial")
         mode = payload.get("mode")
         if serials is None:
             if serial is None:
-                return error_result("invalid_input", "serial or serials is required")
+                return _ERR_SERIAL_REQUIRED
+            key = _cache_key(serial)
+            cacheable = key is not None and (mode is None or isinstance(mode, str))
+            if cacheable and not self._wants_task(payload):
+                # Hover fires single-serial requests; they skip the list
+                # normalization and repeat hovers are served from the cache.
+                return self._cached(
+                    "parm7_highlights",
+                    (key, mode),
+                    self._model.get_parm7_highlights,
+                    [key],
+                    mode,
+                )
             serials = [serial]
         if not isinstance(serials, (list, tuple)):
-            return error_result("invalid_input", "serials must be a list")
-        try:
+            return _ERR_SERIALS_NOT_LIST
+        serials = _unique_serials(serials)
+        if len(serials) > MAX_HIGHLIGHT_SERIALS:
+            return _ERR_TOO_MANY_SERIALS
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("get_parm7_highlights serials=%s mode=%s", serials, mode)
-            return self._model.get_parm7_highlights(serials, mode=mode)
-        except ModelError as exc:
-            logger.exception("get_parm7_highlights failed")
-            return exc.to_result()
-        except Exception as exc:
-            logger.exception("get_parm7_highlights unexpected error")
-            return error_result("unexpected", "Unexpected error", str(exc))
+        if self._wants_task(payload):
+            return self._submit_task(
+                "get_parm7_highlights",
+                self._model.get_parm7_highlights,
+                serials,
+                mode,
+            )
+        return self._model.get_parm7_highlights(serials, mode=mode)
 
     def select_files(self, payload: Optional[Dict[str, object]] = None):
-        """Open native file dialog for parm7/rst7 selection.
+        """Open a native file dialog for parm7/rst7 selection.
+
+        Both files are picked in one multi-select dialog and classified by
+        suffix; separate parm7 and rst7 dialogs are used only when the
+        selection is ambiguous.
 
         Parameters
         ----------
@@ -624,40 +1024,60 @@ class Api:
         """
 
         if not self._window:
-            return error_result("no_window", "Window is not available")
+            return _ERR_NO_WINDOW
         if webview is None:
-            return error_result("missing_dependency", "pywebview is not available")
+            return _ERR_NO_WEBVIEW
         try:
             logger.debug("select_files dialog opened")
-            parm7 = self._window.create_file_dialog(
+            paths = self._window.create_file_dialog(
                 webview.OPEN_DIALOG,
-                allow_multiple=False,
-                file_types=("Parm7 (*.parm7 *.prmtop)", "All files (*.*)"),
+                allow_multiple=True,
+                file_types=(
+                    "Parm7/Rst7 files (*.parm7 *.prmtop *.rst7 *.rst *.inpcrd)",
+                    "All files (*.*)",
+                ),
             )
-            if not parm7:
-                logger.debug("select_files cancelled at parm7")
-                return error_result("cancelled", "No parm7 file selected")
-            rst7 = self._window.create_file_dialog(
-                webview.OPEN_DIALOG,
-                allow_multiple=False,
-                file_types=("Rst7 (*.rst7 *.rst *.inpcrd)", "All files (*.*)"),
-            )
-            if not rst7:
-                logger.debug("select_files returned without rst7")
-                return {
-                    "ok": True,
-                    "parm7_path": parm7[0],
-                    "rst7_path": None,
-                }
+            if not paths:
+                logger.debug("select_files cancelled")
+                return _ERR_NO_PARM7_SELECTED
+            classified = _classify_selected_files(paths)
+            if classified is not None:
+                parm7_path, rst7_path = classified
+                return {"ok": True, "parm7_path": parm7_path, "rst7_path": rst7_path}
+            logger.debug("select_files selection ambiguous; asking per file")
+            return self._select_files_sequential()
+        except Exception as exc:
+            logger.exception("select_files failed")
+            return error_result("dialog_failed", "File dialog failed", str(exc))
+
+    def _select_files_sequential(self) -> Dict[str, object]:
+        parm7 = self._window.create_file_dialog(
+            webview.OPEN_DIALOG,
+            allow_multiple=False,
+            file_types=("Parm7 (*.parm7 *.prmtop)", "All files (*.*)"),
+        )
+        if not parm7:
+            logger.debug("select_files cancelled at parm7")
+            return _ERR_NO_PARM7_SELECTED
+        rst7 = self._window.create_file_dialog(
+            webview.OPEN_DIALOG,
+            allow_multiple=False,
+            file_types=("Rst7 (*.rst7 *.rst *.inpcrd)", "All files (*.*)"),
+        )
+        if not rst7:
+            logger.debug("select_files returned without rst7")
             return {
                 "ok": True,
                 "parm7_path": parm7[0],
-                "rst7_path": rst7[0],
+                "rst7_path": None,
             }
-        except Exception as exc:
-            logger.exception("select_files failed")
-            return error_result("dialog_failed", "File dialog failed", str(exc))
+        return {
+            "ok": True,
+            "parm7_path": parm7[0],
+            "rst7_path": rst7[0],
+        }
 
+    @_validated()
     def log_client_error(self, payload: Dict[str, object]):
         """Log a frontend error into the Python logs.
 
@@ -672,10 +1092,121 @@ class Api:
             Acknowledgement payload.
         """
 
-        if not isinstance(payload, dict):
-            return error_result("invalid_input", "payload must be an object")
         message = payload.get("message")
         if not message:
             return error_result("invalid_input", "message is required")
         logger.error("Client error: %s", message)
         return {"ok": True}
+
+
+_PARM7_SUFFIXES = (".parm7", ".prmtop")
+_RST7_SUFFIXES = (".rst7", ".rst", ".inpcrd")
+
+
+def _classify_selected_files(paths) -> Optional[Tuple[str, Optional[str]]]:
+    """Split a multi-file dialog selection into parm7 and rst7 paths.
+
+    Parameters
+    ----------
+    paths
+        Paths returned by the file dialog.
+
+    Returns
+    -------
+    tuple or None
+        ``(parm7_path, rst7_path)`` or None when the selection is ambiguous.
+    """
+
+    parm7 = []
+    rst7 = []
+    for path in paths:
+        lowered = str(path).lower()
+        if lowered.endswith(_PARM7_SUFFIXES):
+            parm7.append(path)
+        elif lowered.endswith(_RST7_SUFFIXES):
+            rst7.append(path)
+        else:
+            return None
+    if len(parm7) != 1 or len(rst7) > 1:
+        return None
+    return parm7[0], (rst7[0] if rst7 else None)
+
+
+def _batch_values(payload: Dict[str, object], key: str):
+    values = payload[key]
+    if not isinstance(values, (list, tuple)):
+        error = _ERR_NOT_LIST.get(key)
+        return error or error_result("invalid_input", f"{key} must be a list")
+    return list(values)
+
+
+def _unique_serials(values) -> list:
+    """Coerce serials to int and drop duplicates, keeping first-seen order.
+
+    Order is preserved because angle/dihedral matching depends on it. Values
+    that are not integers are kept so the model can report them.
+    """
+
+    unique = {}
+    for value in values:
+        try:
+            value = int(value)
+        except (TypeError, ValueError):
+            pass
+        unique.setdefault(value, None)
+    return list(unique)
+
+
+def _dumps_js(value: object) -> str:
+    """Serialize a bridge payload for embedding in evaluated JavaScript.
+
+    Uses orjson when installed and falls back to the standard library encoder.
+    Both paths give the same output: numpy scalars/arrays are converted,
+    non-finite floats become ``null``, int/float/bool/None dict keys become
+    strings, and anything else raises ``TypeError``.
+    """
+
+    if orjson is not None:
+        return orjson.dumps(
+            value,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        ).decode("utf-8")
+    try:
+        return json.dumps(value, **_JSON_OPTIONS)
+    except ValueError:
+        # Rare: only payloads holding NaN/inf pay for the rewrite.
+        return json.dumps(_finite_floats(value), **_JSON_OPTIONS)
+
+
+def _json_default(value: object) -> object:
+    """Convert numpy scalars and arrays for the stdlib encoder, like orjson."""
+
+    tolist = getattr(value, "tolist", None)
+    if tolist is None:
+        raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+    return tolist()
+
+
+_JSON_OPTIONS = dict(separators=(",", ":"), allow_nan=False, default=_json_default)
+
+
+def _finite_floats(value: object) -> object:
+    """Return ``value`` with NaN/inf floats replaced by None, as orjson does."""
+
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _finite_floats(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite_floats(item) for item in value]
+    tolist = getattr(value, "tolist", None)
+    if tolist is not None:
+        return _finite_floats(tolist())
+    return value
+
+
+def _cache_key(value: object) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
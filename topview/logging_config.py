@@ -3,10 +3,28 @@
 from __future__ import annotations
 
 import logging
+import logging.handlers
 import sys
 import warnings
 from typing import Optional
 
+# MDAnalysis loggers and topology warnings that are noise for Topview users.
+_QUIET_LOGGERS = (
+    "MDAnalysis",
+    "MDAnalysis.topology",
+    "MDAnalysis.core",
+    "MDAnalysis.guesser",
+)
+_QUIET_WARNING = dict(
+    action="ignore",
+    message="Unknown ATOMIC_NUMBER value found for some atoms*",
+    category=UserWarning,
+    module=r"MDAnalysis\.topology\.TOPParser",
+)
+_LOG_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+# Records buffered before a log file write; errors flush immediately.
+LOG_BUFFER_CAPACITY = 1024
+
 
 def configure_logging(log_file: Optional[str]) -> None:
     """Configure application logging.
@@ -14,7 +32,9 @@ def configure_logging(log_file: Optional[str]) -> None:
     Parameters
     ----------
     log_file
-        Optional path to a log file. When omitted, logs to stdout.
+        Optional path to a log file. When omitted, logs to stdout. File
+        records are buffered and written in batches of
+        ``LOG_BUFFER_CAPACITY``, on ERROR records, and at interpreter exit.
 
     Returns
     -------
@@ -26,26 +46,29 @@ def configure_logging(log_file: Optional[str]) -> None:
     handlers = []
     if log_file:
         try:
-            handlers.append(logging.FileHandler(log_file, encoding="utf-8"))
+            file_handler = logging.FileHandler(log_file, encoding="utf-8")
         except OSError as exc:
             handler_error = exc
+        else:
+            # basicConfig only formats the handlers it is given.
+            file_handler.setFormatter(logging.Formatter(_LOG_FORMAT))
+            handlers.append(
+                logging.handlers.MemoryHandler(
+                    LOG_BUFFER_CAPACITY,
+                    flushLevel=logging.ERROR,
+                    target=file_handler,
+                )
+            )
     if not handlers:
         handlers.append(logging.StreamHandler(sys.stdout))
     logging.basicConfig(
         level=logging.DEBUG,
         handlers=handlers,
-        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
-    )
-    logging.getLogger("MDAnalysis").setLevel(logging.ERROR)
-    logging.getLogger("MDAnalysis.topology").setLevel(logging.ERROR)
-    logging.getLogger("MDAnalysis.core").setLevel(logging.ERROR)
-    logging.getLogger("MDAnalysis.guesser").setLevel(logging.ERROR)
-    warnings.filterwarnings(
-        "ignore",
-        message="Unknown ATOMIC_NUMBER value found for some atoms*",
-        category=UserWarning,
-        module=r"MDAnalysis\\.topology\\.TOPParser",
+        format=_LOG_FORMAT,
     )
+    for name in _QUIET_LOGGERS:
+        logging.getLogger(name).setLevel(logging.ERROR)
+    warnings.filterwarnings(**_QUIET_WARNING)
     if handler_error is not None:
         logging.getLogger(__name__).warning(
             "Failed to open log file '%s': %s", log_file, handler_error
@@ -7,9 +7,10 @@ from typing import TYPE_CHECKING
 from topview.model.state import AtomMeta, Parm7Section, Parm7Token, ResidueMeta
 
 if TYPE_CHECKING:
+    from topview.model.lazy import LazyModel
     from topview.model.model import Model
 
-__all__ = ["AtomMeta", "Model", "Parm7Section", "Parm7Token", "ResidueMeta"]
+__all__ = ["AtomMeta", "LazyModel", "Model", "Parm7Section", "Parm7Token", "ResidueMeta"]
 
 
 def __getattr__(name: str):
@@ -17,4 +18,8 @@ def __getattr__(name: str):
         from topview.model.model import Model
 
         return Model
+    if name == "LazyModel":
+        from topview.model.lazy import LazyModel
+
+        return LazyModel
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
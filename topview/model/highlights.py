@@ -3,11 +3,48 @@
 from __future__ import annotations
 
 import math
-from typing import Dict, List, Optional, Sequence, Tuple
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
 
 from topview.errors import ModelError
-from topview.model.state import AtomMeta, Parm7Section
-from topview.services.parm7 import parse_float_tokens, parse_int_tokens
+from topview.model.state import (
+    AtomMeta,
+    AtomTable,
+    Parm7Section,
+    Parm7TokenArray,
+    lookup_meta,
+)
+from topview.services.parm7 import (
+    parse_float_array,
+    token_int_array,
+    token_values,
+)
+
+_PER_ATOM_SECTIONS = (
+    "ATOM_NAME",
+    "CHARGE",
+    "ATOMIC_NUMBER",
+    "MASS",
+    "ATOM_TYPE_INDEX",
+    "AMBER_ATOM_TYPE",
+)
+_RESIDUE_SECTIONS = ("RESIDUE_LABEL", "RESIDUE_POINTER")
+BOND_SECTIONS = ("BONDS_INC_HYDROGEN", "BONDS_WITHOUT_HYDROGEN")
+_ANGLE_SECTIONS = ("ANGLES_INC_HYDROGEN", "ANGLES_WITHOUT_HYDROGEN")
+_DIHEDRAL_SECTIONS = ("DIHEDRALS_INC_HYDROGEN", "DIHEDRALS_WITHOUT_HYDROGEN")
+# (sections, record width, atom slots) for every term index the scanners use.
+_TERM_INDEX_LAYOUTS = (
+    (BOND_SECTIONS, 3, (0, 1)),
+    (_ANGLE_SECTIONS, 4, (0, 1, 2)),
+    (_DIHEDRAL_SECTIONS, 5, (0, 1, 2, 3)),
+    (_DIHEDRAL_SECTIONS, 5, (0, 3)),
+)
+
+TokenSpans = Tuple[List[int], List[int], List[int]]
+TermRows = List[Tuple[int, List[int]]]
+NonbondTable = Tuple[Parm7Section, int, List[int]]
+_NONBOND_TABLE_KEY = ("NONBONDED_PARM_INDEX", "table")
 
 
 class HighlightEngine:
@@ -19,19 +56,41 @@ class HighlightEngine:
         Parm7 sections keyed by flag name.
     _meta_by_serial
         Atom metadata keyed by serial.
+    _meta_list
+        Atom metadata in serial order, used for direct serial indexing.
+    _type_column
+        Atom type index per serial (row ``serial - 1``) when ``_meta_list``
+        is an ``AtomTable``, else None.
     _int_cache
-        Cached integer section values.
+        Cached read-only integer section arrays.
     _float_cache
-        Cached float section values.
+        Cached read-only float section arrays.
+    _index_cache
+        Cached term-record indices keyed by section and atom slots, plus the
+        parsed NONBONDED_PARM_INDEX table.
+    _span_cache
+        Cached ``(lines, starts, ends)`` token spans keyed by section name.
+    _atom_highlight_cache
+        Cached base highlights keyed by atom serial.
+    _param_cache
+        Cached parameter values keyed by ``(section name, parameter index)``.
+    _term_row_cache
+        Matching term records per ``(section, slots, serials)`` query, kept
+        for this engine only.
     """
 
     def __init__(
         self,
-        sections: Dict[str, Parm7Section],
-        meta_by_serial: Dict[int, AtomMeta],
-        int_cache: Dict[str, List[int]],
-        float_cache: Dict[str, List[float]],
+        sections: Mapping[str, Parm7Section],
+        meta_by_serial: Mapping[int, AtomMeta],
+        int_cache: Dict[str, np.ndarray],
+        float_cache: Dict[str, np.ndarray],
         bond_adjacency: Optional[Dict[int, set[int]]] = None,
+        index_cache: Optional[Dict[object, "TermIndex"]] = None,
+        span_cache: Optional[Dict[str, TokenSpans]] = None,
+        meta_list: Optional[Sequence[AtomMeta]] = None,
+        atom_highlight_cache: Optional[Dict[int, List[Dict[str, object]]]] = None,
+        param_cache: Optional[Dict[Tuple[str, int], Optional[float]]] = None,
     ) -> None:
         """Initialize the highlight engine.
 
@@ -42,18 +101,43 @@ class HighlightEngine:
         meta_by_serial
             Atom metadata keyed by serial.
         int_cache
-            Cached integer section values.
+            Cached read-only integer section arrays.
         float_cache
-            Cached float section values.
+            Cached read-only float section arrays.
         bond_adjacency
             Optional adjacency map for bonded atoms.
+        index_cache
+            Optional cache of term-record indices and the nonbond table,
+            shared across engines for the same loaded system.
+        span_cache
+            Optional cache of per-section token spans, shared the same way.
+        meta_list
+            Optional atom metadata in serial order; lookups fall back to
+            ``meta_by_serial`` when it is missing or does not match.
+        atom_highlight_cache
+            Optional cache of per-atom base highlights, shared like
+            ``span_cache``. Cached entries must be treated as read-only.
+        param_cache
+            Optional cache of parameter values, shared like ``span_cache``.
         """
 
         self._sections = sections
         self._meta_by_serial = meta_by_serial
+        self._meta_list = meta_list if meta_list is not None else ()
+        # A plain list index beats a NumPy scalar load for single lookups.
+        self._type_column: Optional[List[Optional[int]]] = (
+            meta_list.atom_type_indices if isinstance(meta_list, AtomTable) else None
+        )
         self._int_cache = int_cache
         self._float_cache = float_cache
         self._bond_adjacency = bond_adjacency
+        self._index_cache = index_cache if index_cache is not None else {}
+        self._span_cache = span_cache if span_cache is not None else {}
+        self._atom_highlight_cache = (
+            atom_highlight_cache if atom_highlight_cache is not None else {}
+        )
+        self._term_row_cache: Dict[Tuple[object, ...], TermRows] = {}
+        self._param_cache = param_cache if param_cache is not None else {}
 
     def build_atom_highlights(self, meta: AtomMeta) -> List[Dict[str, object]]:
         """Compute base parm7 highlights for a single atom.
@@ -69,38 +153,106 @@ class HighlightEngine:
             Highlight spans for the atom.
         """
 
-        highlights: List[Dict[str, object]] = []
-        per_atom_sections = [
-            "ATOM_NAME",
-            "CHARGE",
-            "ATOMIC_NUMBER",
-            "MASS",
-            "ATOM_TYPE_INDEX",
-            "AMBER_ATOM_TYPE",
+        return self.build_atom_highlights_many([meta])[0]
+
+    def build_atom_highlights_many(
+        self, metas: Sequence[AtomMeta]
+    ) -> List[List[Dict[str, object]]]:
+        """Compute base parm7 highlights for several atoms in one pass.
+
+        Sections are visited once for the whole batch rather than once per
+        atom; each atom's spans come out in the same order as
+        ``build_atom_highlights``.
+
+        Parameters
+        ----------
+        metas
+            Atom metadata.
+
+        Returns
+        -------
+        list
+            Highlight spans per atom, in input order.
+        """
+
+        return self._build_row_highlights(
+            [(meta.serial, meta.residue_index) for meta in metas]
+        )
+
+    def _build_row_highlights(
+        self, rows: Sequence[Tuple[int, int]]
+    ) -> List[List[Dict[str, object]]]:
+        results: List[List[Dict[str, object]]] = [[] for _ in rows]
+        layouts = (
+            (_PER_ATOM_SECTIONS, [serial - 1 for serial, _ in rows]),
+            (_RESIDUE_SECTIONS, [residue_index - 1 for _, residue_index in rows]),
+        )
+        for names, indices in layouts:
+            for name in names:
+                section = self._sections.get(name)
+                if not section:
+                    continue
+                lines, starts, ends = self._section_spans(section)
+                count = len(lines)
+                for highlights, index in zip(results, indices):
+                    if 0 <= index < count:
+                        highlights.append(
+                            {
+                                "line": lines[index],
+                                "start": starts[index],
+                                "end": ends[index],
+                                "section": name,
+                            }
+                        )
+        return results
+
+    def _atom_rows(
+        self, serials: Sequence[Optional[int]]
+    ) -> List[Optional[Tuple[int, int]]]:
+        # ``(serial, residue_index)`` per serial, or None when it is not found.
+        table = self._meta_list
+        if not isinstance(table, AtomTable):
+            rows: List[Optional[Tuple[int, int]]] = []
+            for serial in serials:
+                meta = self._meta(serial) if serial is not None else None
+                rows.append((meta.serial, meta.residue_index) if meta else None)
+            return rows
+        # Read the residue column directly; no AtomMeta is built per serial.
+        natoms = len(table)
+        found = [serial is not None and 0 < serial <= natoms for serial in serials]
+        positions = [serial - 1 for serial, ok in zip(serials, found) if ok]
+        residue_indices = iter(table.residue_indices[positions].tolist())
+        return [
+            (serial, next(residue_indices)) if ok else None
+            for serial, ok in zip(serials, found)
         ]
-        for name in per_atom_sections:
-            section = self._sections.get(name)
-            if not section:
-                continue
-            index = meta.serial - 1
-            if 0 <= index < len(section.tokens):
-                token = section.tokens[index]
-                highlights.append(
-                    {"line": token.line, "start": token.start, "end": token.end, "section": name}
-                )
 
-        residue_sections = ["RESIDUE_LABEL", "RESIDUE_POINTER"]
-        residue_index = meta.residue_index - 1
-        for name in residue_sections:
-            section = self._sections.get(name)
-            if not section:
-                continue
-            if 0 <= residue_index < len(section.tokens):
-                token = section.tokens[residue_index]
-                highlights.append(
-                    {"line": token.line, "start": token.start, "end": token.end, "section": name}
+    def _cache_atom_highlights(self, rows: Sequence[Tuple[int, int]]) -> None:
+        cache = self._atom_highlight_cache
+        pending = list({row[0]: row for row in rows if row[0] not in cache}.values())
+        if not pending:
+            return
+        for row, highlights in zip(pending, self._build_row_highlights(pending)):
+            cache[row[0]] = highlights
+
+    def _section_spans(self, section: Parm7Section) -> TokenSpans:
+        spans = self._span_cache.get(section.name)
+        if spans is None:
+            tokens = section.tokens
+            if isinstance(tokens, Parm7TokenArray):
+                spans = (
+                    tokens.lines.tolist(),
+                    tokens.starts.tolist(),
+                    tokens.ends.tolist(),
+                )
+            else:
+                spans = (
+                    [token.line for token in tokens],
+                    [token.start for token in tokens],
+                    [token.end for token in tokens],
                 )
-        return highlights
+            self._span_cache[section.name] = spans
+        return spans
 
     def get_highlights(
         self, serials: Sequence[int], mode: Optional[str] = None
@@ -129,36 +281,34 @@ class HighlightEngine:
             return [], None
         highlights: List[Dict[str, object]] = []
         seen: set = set()
-        missing: List[str] = []
+        # Serials are normalized to ints once here; the scanners below take
+        # them as-is instead of coercing per record or per pair.
+        serial_ints: List[Optional[int]] = []
         for serial in serials:
             try:
-                serial_int = int(serial)
+                serial_ints.append(int(serial))
             except (TypeError, ValueError):
-                missing.append(str(serial))
-                continue
-            meta = self._meta_by_serial.get(serial_int)
-            if meta is None:
-                missing.append(str(serial))
-                continue
-            for hl in self.build_atom_highlights(meta):
-                key = (hl["line"], hl["start"], hl["end"])
-                if key in seen:
-                    continue
-                seen.add(key)
-                highlights.append(hl)
+                serial_ints.append(None)
+        rows = self._atom_rows(serial_ints)
+        missing = [str(serial) for serial, row in zip(serials, rows) if row is None]
         if missing:
             raise ModelError(
                 "not_found", f"Atom serial(s) {', '.join(missing)} not found"
             )
+        self._cache_atom_highlights(rows)
+        for serial, _ in rows:
+            for hl in self._atom_highlight_cache[serial]:
+                key = _span_key(hl["line"], hl["start"], hl["end"])
+                if key in seen:
+                    continue
+                seen.add(key)
+                highlights.append(hl)
+        serials = [serial for serial, _ in rows]
         normalized_mode = (mode or "Atom").strip()
         interaction: Optional[Dict[str, object]] = None
         if normalized_mode == "Atom":
             for serial in serials:
-                try:
-                    serial_int = int(serial)
-                except (TypeError, ValueError):
-                    continue
-                self._highlight_atom_lj(highlights, seen, serial_int)
+                self._highlight_atom_lj(highlights, seen, serial)
         elif normalized_mode == "Bond":
             self._highlight_bond_entries(highlights, seen, serials)
             interaction = {
@@ -208,16 +358,21 @@ class HighlightEngine:
             }
         return highlights, interaction
 
-    def _get_int_section(self, name: str, section: Parm7Section) -> List[int]:
+    def _meta(self, serial: int) -> Optional[AtomMeta]:
+        return lookup_meta(self._meta_list, self._meta_by_serial, serial)
+
+    def _get_int_array(self, name: str, section: Parm7Section) -> np.ndarray:
         cached = self._int_cache.get(name)
-        if cached is not None:
-            return cached
-        values = parse_int_tokens(section.tokens)
-        self._int_cache[name] = values
-        return values
+        if cached is None:
+            cached = self._int_cache[name] = token_int_array(section.tokens)
+        return cached
 
     def _get_atom_type_index(self, serial: int) -> Optional[int]:
-        meta = self._meta_by_serial.get(int(serial))
+        column = self._type_column
+        if column is not None:
+            # The column already holds ints or None; no AtomMeta is built.
+            return column[serial - 1] if 0 < serial <= len(column) else None
+        meta = self._meta(serial)
         if not meta:
             return None
         value = meta.parm7.get("atom_type_index")
@@ -237,19 +392,13 @@ class HighlightEngine:
         type_index = self._get_atom_type_index(serial)
         if not type_index:
             return
-        section = self._sections.get("NONBONDED_PARM_INDEX")
-        if not section or not section.tokens:
+        table = self._nonbond_table()
+        if table is None:
             return
-        values = self._get_int_section("NONBONDED_PARM_INDEX", section)
-        if not values:
+        entry = self._nonbond_index(table, type_index, type_index)
+        if entry is None:
             return
-        ntypes = self._get_ntypes(values)
-        if not ntypes:
-            return
-        index = (int(type_index) - 1) * ntypes + (int(type_index) - 1)
-        if index < 0 or index >= len(values):
-            return
-        nb_index = values[index]
+        nb_index = entry[1]
         if nb_index > 0:
             self._add_param_highlight(
                 highlights, seen, "LENNARD_JONES_ACOEF", nb_index
@@ -259,13 +408,85 @@ class HighlightEngine:
                 highlights, seen, "HBOND_ACOEF", abs(nb_index)
             )
 
-    def _get_float_section(self, name: str, section: Parm7Section) -> List[float]:
+    def _get_float_array(self, name: str, section: Parm7Section) -> np.ndarray:
         cached = self._float_cache.get(name)
-        if cached is not None:
-            return cached
-        values = parse_float_tokens(section.tokens)
-        self._float_cache[name] = values
-        return values
+        if cached is None:
+            cached = parse_float_array(token_values(section.tokens))
+            cached.flags.writeable = False
+            self._float_cache[name] = cached
+        return cached
+
+    def _term_rows(
+        self,
+        name: str,
+        section: Parm7Section,
+        width: int,
+        slots: Tuple[int, ...],
+        serials: Sequence[int],
+    ) -> TermRows:
+        """Return ``(offset, record)`` pairs whose ``slots`` atoms equal ``serials``.
+
+        The atom-set index for each section is built once and cached, so
+        lookups touch only candidate records; callers still apply their exact
+        (ordered or unordered) match on the returned records. Only those
+        records are converted to Python ints. Results are memoized for the
+        engine's lifetime, since the highlight and interaction passes of one
+        request (and their ordered/unordered fallbacks) repeat the same query.
+        """
+
+        cache_key = (name, slots, tuple(serials))
+        rows = self._term_row_cache.get(cache_key)
+        if rows is not None:
+            return rows
+        index = self._term_index(name, section, width, slots)
+        offsets = index.lookup(_atom_set_key(serials))
+        if offsets.size:
+            values = self._get_int_array(name, section)
+            # Gather every matching record with one fancy index.
+            records = values[offsets[:, None] + np.arange(width)]
+            rows = list(zip(offsets.tolist(), records.tolist()))
+        else:
+            rows = []
+        self._term_row_cache[cache_key] = rows
+        return rows
+
+    def _term_index(
+        self,
+        name: str,
+        section: Parm7Section,
+        width: int,
+        slots: Tuple[int, ...],
+    ) -> "TermIndex":
+        cache_key = (name, slots)
+        index = self._index_cache.get(cache_key)
+        if index is None:
+            values = self._get_int_array(name, section)
+            record_count = values.size // width
+            records = values[: record_count * width].reshape(record_count, width)
+            atoms = np.abs(records[:, list(slots)]) // 3 + 1
+            index = TermIndex(_atom_set_keys(atoms), width)
+            self._index_cache[cache_key] = index
+        return index
+
+    def build_term_indices(self) -> int:
+        """Build every bond/angle/dihedral/1-4 term index and the nonbond table.
+
+        Highlight requests then resolve terms with a single dict probe instead
+        of paying for the index build on the first selection.
+
+        Returns
+        -------
+        int
+            Number of indices available in the shared cache.
+        """
+
+        for names, width, slots in _TERM_INDEX_LAYOUTS:
+            for name in names:
+                section = self._sections.get(name)
+                if section and section.tokens:
+                    self._term_index(name, section, width, slots)
+        self._nonbond_table()
+        return len(self._index_cache)
 
     @staticmethod
     def _pointer_to_serial(value: int) -> int:
@@ -302,33 +523,19 @@ class HighlightEngine:
     def _get_bond_adjacency(self) -> Dict[int, set[int]]:
         if self._bond_adjacency is not None:
             return self._bond_adjacency
-        adjacency: Dict[int, set[int]] = {}
-        for name in ("BONDS_INC_HYDROGEN", "BONDS_WITHOUT_HYDROGEN"):
-            section = self._sections.get(name)
-            if not section or not section.tokens:
-                continue
-            values = self._get_int_section(name, section)
-            for idx in range(0, len(values) - 2, 3):
-                atom_a = self._pointer_to_serial(values[idx])
-                atom_b = self._pointer_to_serial(values[idx + 1])
-                adjacency.setdefault(atom_a, set()).add(atom_b)
-                adjacency.setdefault(atom_b, set()).add(atom_a)
+        sections = [self._sections.get(name) for name in BOND_SECTIONS]
+        adjacency = build_bond_adjacency(
+            self._get_int_array(section.name, section)
+            for section in sections
+            if section and section.tokens
+        )
         self._bond_adjacency = adjacency
         return adjacency
 
     @staticmethod
     def _order_improper(central: int, serials: Sequence[int]) -> List[int]:
-        others: List[int] = []
-        for value in serials:
-            try:
-                serial = int(value)
-            except (TypeError, ValueError):
-                continue
-            if serial == central:
-                continue
-            others.append(serial)
-        others.sort()
-        return [int(central)] + others
+        others = sorted(serial for serial in serials if serial != central)
+        return [central] + others
 
     def _infer_improper_central(self, serials: Sequence[int]) -> Optional[int]:
         if len(serials) < 4:
@@ -336,12 +543,7 @@ class HighlightEngine:
         adjacency = self._get_bond_adjacency()
         if not adjacency:
             return None
-        clean: List[int] = []
-        for value in serials[:4]:
-            try:
-                clean.append(int(value))
-            except (TypeError, ValueError):
-                return None
+        clean = serials[:4]
         candidates: List[int] = []
         for candidate in clean:
             neighbors = adjacency.get(candidate, set())
@@ -355,9 +557,9 @@ class HighlightEngine:
         adjacency = self._get_bond_adjacency()
         if not adjacency:
             return False
-        neighbors = adjacency.get(int(central), set())
+        neighbors = adjacency.get(central, set())
         return all(
-            int(other) in neighbors for other in record_serials if int(other) != int(central)
+            other in neighbors for other in record_serials if other != central
         )
 
     def _add_highlight(
@@ -367,15 +569,18 @@ class HighlightEngine:
         section: Parm7Section,
         token_index: int,
     ) -> None:
-        if token_index < 0 or token_index >= len(section.tokens):
+        lines, starts, ends = self._section_spans(section)
+        if token_index < 0 or token_index >= len(lines):
             return
-        token = section.tokens[token_index]
-        key = (token.line, token.start, token.end)
+        line = lines[token_index]
+        start = starts[token_index]
+        end = ends[token_index]
+        key = _span_key(line, start, end)
         if key in seen:
             return
         seen.add(key)
         highlights.append(
-            {"line": token.line, "start": token.start, "end": token.end, "section": section.name}
+            {"line": line, "start": start, "end": end, "section": section.name}
         )
 
     def _add_param_highlight(
@@ -397,21 +602,24 @@ class HighlightEngine:
         section_name: str,
         param_index: int,
     ) -> Optional[float]:
-        if param_index <= 0:
-            return None
-        section = self._sections.get(section_name)
-        if not section:
-            return None
-        values = self._get_float_section(section_name, section)
-        index = param_index - 1
-        if index < 0 or index >= len(values):
-            return None
-        return values[index]
+        key = (section_name, param_index)
+        try:
+            return self._param_cache[key]
+        except KeyError:
+            pass
+        value = None
+        section = self._sections.get(section_name) if param_index > 0 else None
+        if section:
+            values = self._get_float_array(section_name, section)
+            if param_index <= values.size:
+                value = float(values[param_index - 1])
+        self._param_cache[key] = value
+        return value
 
     def _get_ntypes(
         self, values: Sequence[int]
     ) -> Optional[int]:
-        if not values:
+        if len(values) == 0:
             return None
         ntypes = int(math.sqrt(len(values)))
         if ntypes > 0 and ntypes * ntypes == len(values):
@@ -427,32 +635,56 @@ class HighlightEngine:
             return estimate
         return None
 
+    def _nonbond_table(self) -> Optional[NonbondTable]:
+        """Return ``(section, ntypes, values)`` for NONBONDED_PARM_INDEX.
+
+        The type count and the values, as a flat row-major ``ntypes x ntypes``
+        list of Python ints, are cached with the term indices, so pair lookups
+        are a single list index per request.
+        """
+
+        cached = self._index_cache.get(_NONBOND_TABLE_KEY)
+        if cached is not None:
+            return cached
+        section = self._sections.get("NONBONDED_PARM_INDEX")
+        if not section or not section.tokens:
+            return None
+        values = self._get_int_array("NONBONDED_PARM_INDEX", section)
+        ntypes = self._get_ntypes(values)
+        if not ntypes:
+            return None
+        # A list index is several times cheaper than a NumPy scalar load.
+        table = (section, ntypes, values.tolist())
+        self._index_cache[_NONBOND_TABLE_KEY] = table
+        return table
+
+    @staticmethod
     def _nonbond_index(
-        self, values: Sequence[int], ntypes: int, type_a: int, type_b: int
+        table: NonbondTable, type_a: int, type_b: int
     ) -> Optional[Tuple[int, int]]:
+        _, ntypes, values = table
         idx = (type_a - 1) * ntypes + (type_b - 1)
         if idx < 0 or idx >= len(values):
             return None
-        return idx, int(values[idx])
+        return idx, values[idx]
 
     def _extract_bond_params(
         self, serials: Sequence[int]
     ) -> List[Dict[str, object]]:
         if len(serials) < 2:
             return []
-        target = {int(serials[0]), int(serials[1])}
+        target = _pair_key(serials[0], serials[1])
         results: List[Dict[str, object]] = []
         for name in ("BONDS_INC_HYDROGEN", "BONDS_WITHOUT_HYDROGEN"):
             section = self._sections.get(name)
             if not section or not section.tokens:
                 continue
-            values = self._get_int_section(name, section)
-            for idx in range(0, len(values) - 2, 3):
-                atom_a = self._pointer_to_serial(values[idx])
-                atom_b = self._pointer_to_serial(values[idx + 1])
-                if {atom_a, atom_b} != target:
+            for idx, row in self._term_rows(name, section, 3, (0, 1), serials[:2]):
+                atom_a = self._pointer_to_serial(row[0])
+                atom_b = self._pointer_to_serial(row[1])
+                if _pair_key(atom_a, atom_b) != target:
                     continue
-                param_index = abs(values[idx + 2])
+                param_index = abs(row[2])
                 type_a = self._get_atom_type_index(atom_a)
                 type_b = self._get_atom_type_index(atom_b)
                 results.append(
@@ -485,15 +717,14 @@ class HighlightEngine:
             section = self._sections.get(name)
             if not section or not section.tokens:
                 continue
-            values = self._get_int_section(name, section)
-            for idx in range(0, len(values) - 3, 4):
-                atom_a = self._pointer_to_serial(values[idx])
-                atom_b = self._pointer_to_serial(values[idx + 1])
-                atom_c = self._pointer_to_serial(values[idx + 2])
+            for idx, row in self._term_rows(name, section, 4, (0, 1, 2), serials[:3]):
+                atom_a = self._pointer_to_serial(row[0])
+                atom_b = self._pointer_to_serial(row[1])
+                atom_c = self._pointer_to_serial(row[2])
                 if not self._match_triplet(atom_a, atom_b, atom_c, serials):
                     continue
                 ordered_found = True
-                param_index = abs(values[idx + 3])
+                param_index = abs(row[3])
                 type_a = self._get_atom_type_index(atom_a)
                 type_b = self._get_atom_type_index(atom_b)
                 type_c = self._get_atom_type_index(atom_c)
@@ -522,14 +753,13 @@ class HighlightEngine:
             section = self._sections.get(name)
             if not section or not section.tokens:
                 continue
-            values = self._get_int_section(name, section)
-            for idx in range(0, len(values) - 3, 4):
-                atom_a = self._pointer_to_serial(values[idx])
-                atom_b = self._pointer_to_serial(values[idx + 1])
-                atom_c = self._pointer_to_serial(values[idx + 2])
+            for idx, row in self._term_rows(name, section, 4, (0, 1, 2), serials[:3]):
+                atom_a = self._pointer_to_serial(row[0])
+                atom_b = self._pointer_to_serial(row[1])
+                atom_c = self._pointer_to_serial(row[2])
                 if not self._match_triplet_unordered(atom_a, atom_b, atom_c, serials):
                     continue
-                param_index = abs(values[idx + 3])
+                param_index = abs(row[3])
                 type_a = self._get_atom_type_index(atom_a)
                 type_b = self._get_atom_type_index(atom_b)
                 type_c = self._get_atom_type_index(atom_c)
@@ -565,9 +795,10 @@ class HighlightEngine:
             section = self._sections.get(name)
             if not section or not section.tokens:
                 continue
-            values = self._get_int_section(name, section)
-            for idx in range(0, len(values) - 4, 5):
-                raw_i, raw_j, raw_k, raw_l, raw_param = values[idx : idx + 5]
+            for idx, row in self._term_rows(
+                name, section, 5, (0, 1, 2, 3), serials[:4]
+            ):
+                raw_i, raw_j, raw_k, raw_l, raw_param = row
                 atom_i = self._pointer_to_serial(raw_i)
                 atom_j = self._pointer_to_serial(raw_j)
                 atom_k = self._pointer_to_serial(raw_k)
@@ -603,9 +834,10 @@ class HighlightEngine:
             section = self._sections.get(name)
             if not section or not section.tokens:
                 continue
-            values = self._get_int_section(name, section)
-            for idx in range(0, len(values) - 4, 5):
-                raw_i, raw_j, raw_k, raw_l, raw_param = values[idx : idx + 5]
+            for idx, row in self._term_rows(
+                name, section, 5, (0, 1, 2, 3), serials[:4]
+            ):
+                raw_i, raw_j, raw_k, raw_l, raw_param = row
                 atom_i = self._pointer_to_serial(raw_i)
                 atom_j = self._pointer_to_serial(raw_j)
                 atom_k = self._pointer_to_serial(raw_k)
@@ -643,15 +875,16 @@ class HighlightEngine:
     ) -> List[Dict[str, object]]:
         if len(serials) < 4:
             return []
-        target_set = {int(value) for value in serials[:4]}
+        target_set = set(serials[:4])
         results: List[Dict[str, object]] = []
         for name in ("DIHEDRALS_INC_HYDROGEN", "DIHEDRALS_WITHOUT_HYDROGEN"):
             section = self._sections.get(name)
             if not section or not section.tokens:
                 continue
-            values = self._get_int_section(name, section)
-            for idx in range(0, len(values) - 4, 5):
-                raw_i, raw_j, raw_k, raw_l, raw_param = values[idx : idx + 5]
+            for idx, row in self._term_rows(
+                name, section, 5, (0, 1, 2, 3), serials[:4]
+            ):
+                raw_i, raw_j, raw_k, raw_l, raw_param = row
                 if raw_l >= 0:
                     continue
                 atom_i = self._pointer_to_serial(raw_i)
@@ -690,20 +923,19 @@ class HighlightEngine:
     ) -> List[Dict[str, object]]:
         if len(serials) < 2:
             return []
-        target = {int(serials[0]), int(serials[1])}
+        target = _pair_key(serials[0], serials[1])
         results: List[Dict[str, object]] = []
         for name in ("DIHEDRALS_INC_HYDROGEN", "DIHEDRALS_WITHOUT_HYDROGEN"):
             section = self._sections.get(name)
             if not section or not section.tokens:
                 continue
-            values = self._get_int_section(name, section)
-            for idx in range(0, len(values) - 4, 5):
-                raw_i, raw_j, raw_k, raw_l, raw_param = values[idx : idx + 5]
+            for idx, row in self._term_rows(name, section, 5, (0, 3), serials[:2]):
+                raw_i, raw_j, raw_k, raw_l, raw_param = row
                 if raw_k < 0 or raw_l < 0:
                     continue
                 atom_i = self._pointer_to_serial(raw_i)
                 atom_l = self._pointer_to_serial(raw_l)
-                if {atom_i, atom_l} != target:
+                if _pair_key(atom_i, atom_l) != target:
                     continue
                 param_index = abs(raw_param)
                 type_i = self._get_atom_type_index(atom_i)
@@ -733,25 +965,15 @@ class HighlightEngine:
     ) -> Optional[Dict[str, object]]:
         if len(serials) < 2:
             return None
-        meta_a = self._meta_by_serial.get(int(serials[0]))
-        meta_b = self._meta_by_serial.get(int(serials[1]))
-        if not meta_a or not meta_b:
-            return None
-        type_a = meta_a.parm7.get("atom_type_index")
-        type_b = meta_b.parm7.get("atom_type_index")
+        type_a = self._get_atom_type_index(serials[0])
+        type_b = self._get_atom_type_index(serials[1])
         if not type_a or not type_b:
             return None
-        section = self._sections.get("NONBONDED_PARM_INDEX")
-        if not section or not section.tokens:
-            return None
-        values = self._get_int_section("NONBONDED_PARM_INDEX", section)
-        if not values:
-            return None
-        ntypes = self._get_ntypes(values)
-        if not ntypes:
+        table = self._nonbond_table()
+        if table is None:
             return None
-        primary = self._nonbond_index(values, ntypes, int(type_a), int(type_b))
-        secondary = self._nonbond_index(values, ntypes, int(type_b), int(type_a))
+        primary = self._nonbond_index(table, type_a, type_b)
+        secondary = self._nonbond_index(table, type_b, type_a)
         nb_index = primary[1] if primary else 0
         if nb_index == 0 and secondary:
             nb_index = secondary[1]
@@ -766,8 +988,8 @@ class HighlightEngine:
                 epsilon = (bcoef * bcoef) / (4.0 * acoef)
                 rmin = pow(2.0 * acoef / bcoef, 1.0 / 6.0)
         return {
-            "serials": [int(serials[0]), int(serials[1])],
-            "type_indices": [int(type_a), int(type_b)],
+            "serials": [serials[0], serials[1]],
+            "type_indices": [type_a, type_b],
             "nb_index": nb_index,
             "acoef": acoef,
             "bcoef": bcoef,
@@ -784,31 +1006,27 @@ class HighlightEngine:
     ) -> None:
         if len(serials) < 2 and not pairs:
             return
-        section = self._sections.get("NONBONDED_PARM_INDEX")
-        if not section or not section.tokens:
-            return
-        values = self._get_int_section("NONBONDED_PARM_INDEX", section)
-        if not values:
-            return
-        ntypes = self._get_ntypes(values)
-        if not ntypes:
+        table = self._nonbond_table()
+        if table is None:
             return
+        section = table[0]
         serial_pairs = pairs or [serials[:2]]
         nb_indices: set = set()
+        type_pairs: set = set()
         for pair in serial_pairs:
             if len(pair) < 2:
                 continue
-            meta_a = self._meta_by_serial.get(int(pair[0]))
-            meta_b = self._meta_by_serial.get(int(pair[1]))
-            if not meta_a or not meta_b:
-                continue
-            type_a = meta_a.parm7.get("atom_type_index")
-            type_b = meta_b.parm7.get("atom_type_index")
+            type_a = self._get_atom_type_index(pair[0])
+            type_b = self._get_atom_type_index(pair[1])
             if not type_a or not type_b:
                 continue
+            type_pair = (type_a, type_b)
+            if type_pair in type_pairs:
+                continue
+            type_pairs.add(type_pair)
             candidates = [
-                self._nonbond_index(values, ntypes, int(type_a), int(type_b)),
-                self._nonbond_index(values, ntypes, int(type_b), int(type_a)),
+                self._nonbond_index(table, type_pair[0], type_pair[1]),
+                self._nonbond_index(table, type_pair[1], type_pair[0]),
             ]
             for candidate in candidates:
                 if not candidate:
@@ -845,21 +1063,20 @@ class HighlightEngine:
     ) -> None:
         if len(serials) < 2:
             return
-        target = {int(serials[0]), int(serials[1])}
+        target = _pair_key(serials[0], serials[1])
         for name in ("BONDS_INC_HYDROGEN", "BONDS_WITHOUT_HYDROGEN"):
             section = self._sections.get(name)
             if not section or not section.tokens:
                 continue
-            values = self._get_int_section(name, section)
-            for idx in range(0, len(values) - 2, 3):
-                atom_a = self._pointer_to_serial(values[idx])
-                atom_b = self._pointer_to_serial(values[idx + 1])
-                if {atom_a, atom_b} != target:
+            for idx, row in self._term_rows(name, section, 3, (0, 1), serials[:2]):
+                atom_a = self._pointer_to_serial(row[0])
+                atom_b = self._pointer_to_serial(row[1])
+                if _pair_key(atom_a, atom_b) != target:
                     continue
                 self._add_highlight(highlights, seen, section, idx)
                 self._add_highlight(highlights, seen, section, idx + 1)
                 self._add_highlight(highlights, seen, section, idx + 2)
-                param_index = abs(values[idx + 2])
+                param_index = abs(row[2])
                 self._add_param_highlight(
                     highlights, seen, "BOND_FORCE_CONSTANT", param_index
                 )
@@ -880,11 +1097,10 @@ class HighlightEngine:
             section = self._sections.get(name)
             if not section or not section.tokens:
                 continue
-            values = self._get_int_section(name, section)
-            for idx in range(0, len(values) - 3, 4):
-                atom_a = self._pointer_to_serial(values[idx])
-                atom_b = self._pointer_to_serial(values[idx + 1])
-                atom_c = self._pointer_to_serial(values[idx + 2])
+            for idx, row in self._term_rows(name, section, 4, (0, 1, 2), serials[:3]):
+                atom_a = self._pointer_to_serial(row[0])
+                atom_b = self._pointer_to_serial(row[1])
+                atom_c = self._pointer_to_serial(row[2])
                 if not self._match_triplet(atom_a, atom_b, atom_c, serials):
                     continue
                 ordered_found = True
@@ -892,7 +1108,7 @@ class HighlightEngine:
                 self._add_highlight(highlights, seen, section, idx + 1)
                 self._add_highlight(highlights, seen, section, idx + 2)
                 self._add_highlight(highlights, seen, section, idx + 3)
-                param_index = abs(values[idx + 3])
+                param_index = abs(row[3])
                 self._add_param_highlight(
                     highlights, seen, "ANGLE_FORCE_CONSTANT", param_index
                 )
@@ -905,18 +1121,17 @@ class HighlightEngine:
             section = self._sections.get(name)
             if not section or not section.tokens:
                 continue
-            values = self._get_int_section(name, section)
-            for idx in range(0, len(values) - 3, 4):
-                atom_a = self._pointer_to_serial(values[idx])
-                atom_b = self._pointer_to_serial(values[idx + 1])
-                atom_c = self._pointer_to_serial(values[idx + 2])
+            for idx, row in self._term_rows(name, section, 4, (0, 1, 2), serials[:3]):
+                atom_a = self._pointer_to_serial(row[0])
+                atom_b = self._pointer_to_serial(row[1])
+                atom_c = self._pointer_to_serial(row[2])
                 if not self._match_triplet_unordered(atom_a, atom_b, atom_c, serials):
                     continue
                 self._add_highlight(highlights, seen, section, idx)
                 self._add_highlight(highlights, seen, section, idx + 1)
                 self._add_highlight(highlights, seen, section, idx + 2)
                 self._add_highlight(highlights, seen, section, idx + 3)
-                param_index = abs(values[idx + 3])
+                param_index = abs(row[3])
                 self._add_param_highlight(
                     highlights, seen, "ANGLE_FORCE_CONSTANT", param_index
                 )
@@ -938,9 +1153,10 @@ class HighlightEngine:
             section = self._sections.get(name)
             if not section or not section.tokens:
                 continue
-            values = self._get_int_section(name, section)
-            for idx in range(0, len(values) - 4, 5):
-                raw_i, raw_j, raw_k, raw_l, raw_param = values[idx : idx + 5]
+            for idx, row in self._term_rows(
+                name, section, 5, (0, 1, 2, 3), serials[:4]
+            ):
+                raw_i, raw_j, raw_k, raw_l, raw_param = row
                 atom_i = self._pointer_to_serial(raw_i)
                 atom_j = self._pointer_to_serial(raw_j)
                 atom_k = self._pointer_to_serial(raw_k)
@@ -975,9 +1191,10 @@ class HighlightEngine:
             section = self._sections.get(name)
             if not section or not section.tokens:
                 continue
-            values = self._get_int_section(name, section)
-            for idx in range(0, len(values) - 4, 5):
-                raw_i, raw_j, raw_k, raw_l, raw_param = values[idx : idx + 5]
+            for idx, row in self._term_rows(
+                name, section, 5, (0, 1, 2, 3), serials[:4]
+            ):
+                raw_i, raw_j, raw_k, raw_l, raw_param = row
                 atom_i = self._pointer_to_serial(raw_i)
                 atom_j = self._pointer_to_serial(raw_j)
                 atom_k = self._pointer_to_serial(raw_k)
@@ -1016,14 +1233,15 @@ class HighlightEngine:
     ) -> None:
         if len(serials) < 4:
             return
-        target_set = {int(value) for value in serials[:4]}
+        target_set = set(serials[:4])
         for name in ("DIHEDRALS_INC_HYDROGEN", "DIHEDRALS_WITHOUT_HYDROGEN"):
             section = self._sections.get(name)
             if not section or not section.tokens:
                 continue
-            values = self._get_int_section(name, section)
-            for idx in range(0, len(values) - 4, 5):
-                raw_i, raw_j, raw_k, raw_l, raw_param = values[idx : idx + 5]
+            for idx, row in self._term_rows(
+                name, section, 5, (0, 1, 2, 3), serials[:4]
+            ):
+                raw_i, raw_j, raw_k, raw_l, raw_param = row
                 if raw_l >= 0:
                     continue
                 atom_i = self._pointer_to_serial(raw_i)
@@ -1058,19 +1276,18 @@ class HighlightEngine:
     ) -> None:
         if len(serials) < 2:
             return
-        target = {int(serials[0]), int(serials[1])}
+        target = _pair_key(serials[0], serials[1])
         for name in ("DIHEDRALS_INC_HYDROGEN", "DIHEDRALS_WITHOUT_HYDROGEN"):
             section = self._sections.get(name)
             if not section or not section.tokens:
                 continue
-            values = self._get_int_section(name, section)
-            for idx in range(0, len(values) - 4, 5):
-                raw_i, raw_j, raw_k, raw_l, raw_param = values[idx : idx + 5]
+            for idx, row in self._term_rows(name, section, 5, (0, 3), serials[:2]):
+                raw_i, raw_j, raw_k, raw_l, raw_param = row
                 if raw_k < 0 or raw_l < 0:
                     continue
                 atom_i = self._pointer_to_serial(raw_i)
                 atom_l = self._pointer_to_serial(raw_l)
-                if {atom_i, atom_l} != target:
+                if _pair_key(atom_i, atom_l) != target:
                     continue
                 self._add_highlight(highlights, seen, section, idx)
                 self._add_highlight(highlights, seen, section, idx + 1)
@@ -1082,3 +1299,160 @@ class HighlightEngine:
                     self._add_param_highlight(
                         highlights, seen, param_section, param_index
                     )
+
+
+def build_bond_adjacency(bond_values: Iterable[Sequence[int]]) -> Dict[int, set[int]]:
+    """Build a serial -> bonded serials map from BONDS_* integer values.
+
+    Parameters
+    ----------
+    bond_values
+        Flattened ``(i, j, param)`` records per bond section, with atoms as
+        parm7 coordinate pointers.
+
+    Returns
+    -------
+    dict
+        Bonded neighbor serials keyed by atom serial.
+    """
+
+    adjacency: Dict[int, set[int]] = {}
+    for values in bond_values:
+        values = np.asarray(values, dtype=np.int64)
+        record_count = values.size // 3
+        if not record_count:
+            continue
+        records = values[: record_count * 3].reshape(record_count, 3)
+        pairs = np.abs(records[:, :2]) // 3 + 1
+        for atom_a, atom_b in pairs.tolist():
+            adjacency.setdefault(atom_a, set()).add(atom_b)
+            adjacency.setdefault(atom_b, set()).add(atom_a)
+    return adjacency
+
+
+class TermIndex:
+    """Sorted atom-set keys of a term section for binary-search lookups.
+
+    Building is a single stable argsort and a lookup is two ``searchsorted``
+    calls, so neither touches records in Python.
+
+    Attributes
+    ----------
+    keys
+        Atom-set keys (see ``_atom_set_keys``) in sorted order.
+    offsets
+        Token offset of the record behind each sorted key.
+    """
+
+    __slots__ = ("keys", "offsets")
+
+    def __init__(self, keys: np.ndarray, width: int) -> None:
+        """Sort the per-record keys.
+
+        Parameters
+        ----------
+        keys
+            One atom-set key per record, in record order.
+        width
+            Number of tokens per record.
+
+        Returns
+        -------
+        None
+            This method does not return a value.
+        """
+
+        order = np.argsort(keys, kind="stable")
+        self.keys = keys[order]
+        self.offsets = order * width
+
+    def __len__(self) -> int:
+        return int(self.keys.size)
+
+    def lookup(self, key: np.generic) -> np.ndarray:
+        """Return the record offsets sharing ``key``, in record order.
+
+        Parameters
+        ----------
+        key
+            Atom-set key built with the same number of slots.
+
+        Returns
+        -------
+        numpy.ndarray
+            Token offsets of the matching records.
+        """
+
+        keys = self.keys
+        if key.dtype != keys.dtype:
+            return self.offsets[:0]
+        lo = keys.searchsorted(key, side="left")
+        hi = keys.searchsorted(key, side="right")
+        return self.offsets[lo:hi]
+
+
+def _span_key(line: int, start: int, end: int) -> int:
+    """Pack a ``(line, start, end)`` text span into one integer for dedupe sets."""
+
+    return (line << 40) | (start << 20) | end
+
+
+def _pair_key(serial_a: int, serial_b: int) -> int:
+    """Pack an unordered serial pair into one integer (``min << 32 | max``)."""
+
+    if serial_a > serial_b:
+        serial_a, serial_b = serial_b, serial_a
+    return (serial_a << 32) | serial_b
+
+
+def _atom_set_key(serials: Sequence[int]) -> np.generic:
+    """Encode one atom set like a row of ``_atom_set_keys``.
+
+    Built in plain Python: running the array version on a single row costs
+    more than the index lookup it feeds.
+
+    Parameters
+    ----------
+    serials
+        Atom serials of one query.
+
+    Returns
+    -------
+    numpy.generic
+        The int64 or void key matching ``_atom_set_keys`` for the same row.
+    """
+
+    atoms = sorted(set(serials))
+    row = [0] * (len(serials) - len(atoms)) + atoms
+    if len(row) == 2:
+        return np.int64((row[0] << 32) | row[1])
+    packed = np.array(row, dtype=np.int64)
+    return packed.view(np.dtype((np.void, packed.itemsize * packed.size)))[0]
+
+
+def _atom_set_keys(atoms: np.ndarray) -> np.ndarray:
+    """Encode the atom set of each row as a fixed-width key.
+
+    Rows are sorted with repeated serials zeroed out, so two rows share a key
+    exactly when they contain the same set of atoms.
+
+    Parameters
+    ----------
+    atoms
+        Atom serials per row, shape ``(n_rows, n_slots)``.
+
+    Returns
+    -------
+    numpy.ndarray
+        One void (bytes) key per row; rows of two serials are packed into a
+        single int64 (``min << 32 | max``) instead.
+    """
+
+    rows = np.sort(np.asarray(atoms, dtype=np.int64), axis=1)
+    repeated = np.zeros(rows.shape, dtype=bool)
+    repeated[:, 1:] = rows[:, 1:] == rows[:, :-1]
+    rows = np.ascontiguousarray(np.sort(np.where(repeated, 0, rows), axis=1))
+    if rows.shape[1] == 2:
+        # Pairs pack into one int64, which sorts and searches faster than bytes.
+        return (rows[:, 0] << 32) | rows[:, 1]
+    return rows.view(np.dtype((np.void, rows.dtype.itemsize * rows.shape[1]))).reshape(-1)
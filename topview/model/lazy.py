@@ -0,0 +1,62 @@
+"""Deferred model construction."""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Callable, Optional
+
+if TYPE_CHECKING:
+    from topview.model.model import Model
+
+
+class LazyModel:
+    """Proxy that builds the real model on first attribute access.
+
+    Attributes
+    ----------
+    _factory
+        Callable returning the model instance.
+    _instance
+        Model instance once built.
+    _init_lock
+        Lock guarding construction.
+    """
+
+    def __init__(self, factory: Callable[[], Model]) -> None:
+        """Initialize the proxy.
+
+        Parameters
+        ----------
+        factory
+            Callable returning the model instance.
+
+        Returns
+        -------
+        None
+            This method does not return a value.
+        """
+
+        self._factory = factory
+        self._instance: Optional[Model] = None
+        self._init_lock = threading.Lock()
+
+    def resolve(self) -> Model:
+        """Return the model, building it if needed.
+
+        Returns
+        -------
+        Model
+            Underlying model instance.
+        """
+
+        instance = self._instance
+        if instance is None:
+            with self._init_lock:
+                instance = self._instance
+                if instance is None:
+                    instance = self._factory()
+                    self._instance = instance
+        return instance
+
+    def __getattr__(self, name: str):
+        return getattr(self.resolve(), name)
@@ -2,24 +2,31 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import threading
 import time
 from concurrent.futures import Future
+from types import MappingProxyType
 from typing import Callable, Dict, Optional, Sequence, Tuple
 
 from topview.errors import ModelError
-from topview.model.highlights import HighlightEngine
-from topview.model.query import query_atoms
-from topview.model.state import ModelState
+from topview.model.highlights import (
+    BOND_SECTIONS,
+    HighlightEngine,
+    build_bond_adjacency,
+)
+from topview.model.query import iter_atom_rows, query_atoms
+from topview.model.state import LoadedSnapshot, ModelState
 from topview.services.loader import load_system_data
 from topview.services.parm7 import (
     POINTER_DESCRIPTIONS,
     POINTER_NAMES,
     load_parm7_deprecated_flags,
     load_parm7_descriptions,
-    parse_int_tokens,
     parse_pointers,
+    read_parm7_b64,
+    token_int_array,
 )
 from topview.services.system_info import (
     build_system_info_tables,
@@ -33,6 +40,22 @@ from topview.services.system_info_selection import (
 
 logger = logging.getLogger(__name__)
 
+PARM7_CHUNK_MAX_BYTES = 1 << 20
+PARM7_CHUNK_CACHE_SIZE = 16
+
+_read_parm7_chunk_cached = functools.lru_cache(maxsize=PARM7_CHUNK_CACHE_SIZE)(
+    read_parm7_b64
+)
+
+
+def _read_parm7(read: Callable[..., str], path: str, *args: object) -> str:
+    try:
+        return read(path, *args)
+    except (OSError, ValueError) as exc:
+        raise ModelError(
+            "parm7_changed", "parm7 file is no longer readable", str(exc)
+        ) from exc
+
 
 class Model:
     """Core application model and state store.
@@ -41,6 +64,8 @@ class Model:
     ----------
     _state
         Mutable model state.
+    _snapshot
+        Immutable view of the loaded system, read without taking ``_lock``.
     _cpu_submit
         Optional CPU executor submit function.
     """
@@ -60,12 +85,16 @@ class Model:
         """
 
         self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
         self._state = ModelState()
+        self._snapshot: Optional[LoadedSnapshot] = None
         self._cpu_submit = cpu_submit
 
     def get_parm7_text(self) -> Dict[str, object]:
         """Return base64-encoded parm7 text.
 
+        The text is read from disk on each call rather than kept in memory.
+
         Returns
         -------
         dict
@@ -74,13 +103,57 @@ class Model:
         Raises
         ------
         ModelError
-            If no parm7 text is loaded.
+            If no parm7 text is loaded or the file changed since loading.
         """
 
-        with self._lock:
-            if not self._state.loaded or not self._state.parm7_text_b64:
-                raise ModelError("not_loaded", "No parm7 text loaded")
-            return {"ok": True, "parm7_text_b64": self._state.parm7_text_b64}
+        path, stamp = self._parm7_source()
+        text_b64 = _read_parm7(read_parm7_b64, path, stamp)
+        return {"ok": True, "parm7_text_b64": text_b64}
+
+    def get_parm7_chunk(self, offset: int, length: int) -> Dict[str, object]:
+        """Return a base64-encoded byte range of the parm7 file.
+
+        Parameters
+        ----------
+        offset
+            Byte offset of the chunk.
+        length
+            Chunk length in bytes (at most ``PARM7_CHUNK_MAX_BYTES``).
+
+        Returns
+        -------
+        dict
+            Payload containing ``offset``, ``size`` (file size) and
+            ``data_b64``.
+
+        Raises
+        ------
+        ModelError
+            If the range is invalid, no parm7 is loaded, or the file changed
+            since loading.
+        """
+
+        try:
+            offset = int(offset)
+            length = int(length)
+        except (TypeError, ValueError) as exc:
+            raise ModelError(
+                "invalid_input", "offset and length must be integers"
+            ) from exc
+        if offset < 0 or not 0 < length <= PARM7_CHUNK_MAX_BYTES:
+            raise ModelError(
+                "invalid_input",
+                f"offset must be >= 0 and length in 1..{PARM7_CHUNK_MAX_BYTES}",
+            )
+        path, stamp = self._parm7_source()
+        data_b64 = _read_parm7(_read_parm7_chunk_cached, path, stamp, offset, length)
+        return {"ok": True, "offset": offset, "size": stamp[0], "data_b64": data_b64}
+
+    def _parm7_source(self) -> Tuple[str, Tuple[int, int]]:
+        snapshot = self._snapshot
+        if snapshot is None or not snapshot.parm7_path:
+            raise ModelError("not_loaded", "No parm7 text loaded")
+        return snapshot.parm7_path, snapshot.parm7_stamp
 
     def get_parm7_sections(self) -> Dict[str, object]:
         """Return parsed parm7 section metadata.
@@ -96,43 +169,43 @@ class Model:
             If sections are not loaded.
         """
 
-        with self._lock:
-            if not self._state.loaded or not self._state.parm7_sections:
-                raise ModelError("not_loaded", "No parm7 sections available")
-            descriptions = load_parm7_descriptions()
-            deprecated_flags = load_parm7_deprecated_flags()
-            sections = [
-                {
-                    "name": section.name,
-                    "line": section.flag_line,
-                    "end_line": section.end_line,
-                    "description": descriptions.get(section.name, ""),
-                    "deprecated": section.name in deprecated_flags,
-                }
-                for section in self._state.parm7_sections.values()
-            ]
+        snapshot = self._snapshot
+        if snapshot is None or not snapshot.parm7_sections:
+            raise ModelError("not_loaded", "No parm7 sections available")
+        descriptions = load_parm7_descriptions()
+        deprecated_flags = load_parm7_deprecated_flags()
+        sections = [
+            {
+                "name": section.name,
+                "line": section.flag_line,
+                "end_line": section.end_line,
+                "description": descriptions.get(section.name, ""),
+                "deprecated": section.name in deprecated_flags,
+            }
+            for section in snapshot.parm7_sections.values()
+        ]
         sections.sort(key=lambda item: item["line"])
         return {"ok": True, "sections": sections}
 
     def get_parm7_pointers(self) -> Dict[str, object]:
-        with self._lock:
-            if not self._state.loaded or not self._state.parm7_sections:
-                raise ModelError("not_loaded", "No parm7 sections available")
-            pointer_section = self._state.parm7_sections.get("POINTERS")
-            if not pointer_section or not pointer_section.tokens:
-                raise ModelError("parse_failed", "POINTERS section missing")
-            pointers = parse_pointers(pointer_section)
-            rows = [
-                {
-                    "name": name,
-                    "value": pointers.get(name, 0),
-                    "index": idx,
-                    "description": POINTER_DESCRIPTIONS.get(name, ""),
-                }
-                for idx, name in enumerate(POINTER_NAMES)
-                if name in pointers
-            ]
-            return {"ok": True, "pointers": rows}
+        snapshot = self._snapshot
+        if snapshot is None or not snapshot.parm7_sections:
+            raise ModelError("not_loaded", "No parm7 sections available")
+        pointer_section = snapshot.parm7_sections.get("POINTERS")
+        if not pointer_section or not pointer_section.tokens:
+            raise ModelError("parse_failed", "POINTERS section missing")
+        pointers = parse_pointers(pointer_section)
+        rows = [
+            {
+                "name": name,
+                "value": pointers.get(name, 0),
+                "index": idx,
+                "description": POINTER_DESCRIPTIONS.get(name, ""),
+            }
+            for idx, name in enumerate(POINTER_NAMES)
+            if name in pointers
+        ]
+        return {"ok": True, "pointers": rows}
 
     def get_parm7_highlights(
         self, serials: Sequence[int], mode: Optional[str] = None
@@ -165,8 +238,13 @@ class Model:
                 raise ModelError("not_loaded", "No parm7 sections available")
             sections = self._state.parm7_sections
             meta_by_serial = self._state.meta_by_serial
+            meta_list = self._state.meta_list
             int_cache = self._state.int_section_cache
             float_cache = self._state.float_section_cache
+            index_cache = self._state.term_index_cache
+            span_cache = self._state.token_span_cache
+            atom_highlight_cache = self._state.atom_highlight_cache
+            param_cache = self._state.param_value_cache
         bond_adjacency = self._get_bond_adjacency() if mode_name == "Improper" else None
         engine = HighlightEngine(
             sections,
@@ -174,6 +252,11 @@ class Model:
             int_cache,
             float_cache,
             bond_adjacency=bond_adjacency,
+            index_cache=index_cache,
+            span_cache=span_cache,
+            meta_list=meta_list,
+            atom_highlight_cache=atom_highlight_cache,
+            param_cache=param_cache,
         )
         highlights, interaction = engine.get_highlights(serials, mode=mode)
         return {
@@ -182,6 +265,38 @@ class Model:
             "interaction": interaction,
         }
 
+    def warm_highlight_indices(self) -> Dict[str, object]:
+        """Build the term indices and bond adjacency used by highlights.
+
+        Meant to run off the request path right after a load, so the first
+        selection does not pay for scanning every bonded section.
+
+        Returns
+        -------
+        dict
+            Payload with the number of term indices built.
+
+        Raises
+        ------
+        ModelError
+            If no system is loaded.
+        """
+
+        with self._lock:
+            if not self._state.loaded:
+                raise ModelError("not_loaded", "No system loaded")
+            engine = HighlightEngine(
+                self._state.parm7_sections,
+                self._state.meta_by_serial,
+                self._state.int_section_cache,
+                self._state.float_section_cache,
+                index_cache=self._state.term_index_cache,
+                meta_list=self._state.meta_list,
+            )
+        count = engine.build_term_indices()
+        self._get_bond_adjacency()
+        return {"ok": True, "indices": count}
+
     def get_atom_bundle(self, serial: int) -> Dict[str, object]:
         """Return atom metadata plus base parm7 highlights.
 
@@ -204,15 +319,26 @@ class Model:
         with self._lock:
             if not self._state.loaded:
                 raise ModelError("not_loaded", "No system loaded")
-            meta = self._state.meta_by_serial.get(int(serial))
-            sections = dict(self._state.parm7_sections)
+            meta = self._state.meta_for_serial(int(serial))
+            sections = self._state.parm7_sections
             int_cache = self._state.int_section_cache
             float_cache = self._state.float_section_cache
+            index_cache = self._state.term_index_cache
+            span_cache = self._state.token_span_cache
+            atom_highlight_cache = self._state.atom_highlight_cache
         if meta is None:
             raise ModelError("not_found", f"Atom serial {serial} not found")
         if not sections:
             raise ModelError("not_loaded", "No parm7 sections available")
-        engine = HighlightEngine(sections, {meta.serial: meta}, int_cache, float_cache)
+        engine = HighlightEngine(
+            sections,
+            {meta.serial: meta},
+            int_cache,
+            float_cache,
+            index_cache=index_cache,
+            span_cache=span_cache,
+            atom_highlight_cache=atom_highlight_cache,
+        )
         highlights, _ = engine.get_highlights([meta.serial], mode="Atom")
         return {"ok": True, "atom": meta.to_dict(), "highlights": highlights}
 
@@ -234,11 +360,12 @@ class Model:
             if not self._state.loaded:
                 raise ModelError("not_loaded", "No system loaded")
             charges = {}
-            for meta in self._state.meta_list:
-                if resname and resname.lower() != "all" and meta.residue.resname != resname:
+            for serial, atom_resname, _, _, charge in iter_atom_rows(
+                self._state.meta_list
+            ):
+                if resname and resname.lower() != "all" and atom_resname != resname:
                     continue
-                charge = meta.parm7.get("charge")
-                charges[str(meta.serial)] = charge
+                charges[str(serial)] = charge
         return {"ok": True, "charges": charges}
 
     def load_system(
@@ -270,6 +397,16 @@ class Model:
             If loading fails or files are missing.
         """
 
+        with self._load_lock:
+            return self._load_system(parm7_path, rst7_path, resname, nmr_path)
+
+    def _load_system(
+        self,
+        parm7_path: str,
+        rst7_path: Optional[str],
+        resname: Optional[str],
+        nmr_path: Optional[str],
+    ) -> Dict[str, object]:
         load_started_at = time.perf_counter()
         result = load_system_data(
             parm7_path,
@@ -287,15 +424,23 @@ class Model:
                 )
             except Exception:
                 logger.exception("Failed to schedule system info build")
+        # Sections are never mutated after a load; readers share this read-only
+        # view instead of copying the dict per call.
+        parm7_sections = MappingProxyType(result.parm7_sections)
         with self._lock:
             self._state.meta_list = result.meta_list
             self._state.meta_by_serial = result.meta_by_serial
             self._state.residue_index = result.residue_index
             self._state.residue_keys_by_resid = result.residue_keys_by_resid
-            self._state.parm7_text_b64 = result.parm7_text_b64
-            self._state.parm7_sections = result.parm7_sections
+            self._state.parm7_path = result.parm7_path
+            self._state.parm7_stamp = result.parm7_stamp
+            self._state.parm7_sections = parm7_sections
             self._state.int_section_cache = {}
             self._state.float_section_cache = {}
+            self._state.term_index_cache = {}
+            self._state.token_span_cache = {}
+            self._state.atom_highlight_cache = {}
+            self._state.param_value_cache = {}
             self._state.system_info = None
             self._state.system_info_future = info_future
             self._state.system_info_selection_index = None
@@ -306,6 +451,13 @@ class Model:
             self._state.nmr_restraints = list(result.nmr_restraints)
             self._state.nmr_summary = dict(result.nmr_summary)
             self._state.loaded = True
+            self._snapshot = LoadedSnapshot(
+                parm7_path=result.parm7_path,
+                parm7_stamp=result.parm7_stamp,
+                parm7_sections=parm7_sections,
+                meta_list=result.meta_list,
+                meta_by_serial=result.meta_by_serial,
+            )
         payload = {
             "ok": True,
             "view_mode": result.view_mode,
@@ -340,13 +492,14 @@ class Model:
             If no system is loaded or the serial is missing.
         """
 
-        with self._lock:
-            if not self._state.loaded:
-                raise ModelError("not_loaded", "No system loaded")
-            meta = self._state.meta_by_serial.get(int(serial))
+        snapshot = self._snapshot
+        if snapshot is None:
+            raise ModelError("not_loaded", "No system loaded")
+        meta = snapshot.meta_for_serial(int(serial))
         if meta is None:
             raise ModelError("not_found", f"Atom serial {serial} not found")
-        logger.debug("Atom info requested serial=%s", serial)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Atom info requested serial=%s", serial)
         return {"ok": True, "atom": meta.to_dict()}
 
     def query_atoms(
@@ -375,7 +528,8 @@ class Model:
         with self._lock:
             if not self._state.loaded:
                 raise ModelError("not_loaded", "No system loaded")
-            meta_list = list(self._state.meta_list)
+            # Loads replace meta_list wholesale, so no copy is needed.
+            meta_list = self._state.meta_list
         return query_atoms(meta_list, filters, max_results=max_results)
 
     def get_residue_info(self, resid: int) -> Dict[str, object]:
@@ -401,18 +555,20 @@ class Model:
             if not self._state.loaded:
                 raise ModelError("not_loaded", "No system loaded")
             keys = self._state.residue_keys_by_resid.get(int(resid), [])
-            residue_index = dict(self._state.residue_index)
+            serials = (
+                self._state.residue_index.get(keys[0], []) if len(keys) == 1 else []
+            )
         if not keys:
             raise ModelError("not_found", f"Residue {resid} not found")
         if len(keys) > 1:
             raise ModelError("ambiguous", "Residue id is not unique", keys)
         key = keys[0]
-        serials = residue_index.get(key, [])
         parts = key.split(":")
         segid = parts[0] or None
         resid_str = parts[1]
         resname = parts[2] if len(parts) > 2 else ""
-        logger.debug("Residue info requested resid=%s", resid)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Residue info requested resid=%s", resid)
         return {
             "ok": True,
             "residue": {
@@ -442,7 +598,7 @@ class Model:
                 raise ModelError("not_loaded", "No system loaded")
             cached = self._state.system_info
             future = self._state.system_info_future
-            sections = None if future is not None else dict(self._state.parm7_sections)
+            sections = None if future is not None else self._state.parm7_sections
             load_timings = dict(self._state.load_timings or {})
             load_started_at = self._state.load_started_at
         if cached is not None:
@@ -487,7 +643,7 @@ class Model:
             if wall_time <= 0.0:
                 wall_time = cpu_time
             logger.debug(
-                "Timings: universe=%.3fs(load_pool) parm7=%.3fs(load_pool) lj=%.3fs(main) meta_attrs=%.3fs(main) meta_build=%.3fs(main) pdb=%.3fs(main) system_info=%.3fs(cpu_worker) cpu=%.3fs wall=%.3fs",
+                "Timings: universe=%.3fs(main) parm7=%.3fs(load_pool) lj=%.3fs(main) meta_attrs=%.3fs(main) meta_build=%.3fs(main) pdb=%.3fs(main) system_info=%.3fs(cpu_worker) cpu=%.3fs wall=%.3fs",
                 load_timings.get("universe", 0.0),
                 load_timings.get("parm7", 0.0),
                 load_timings.get("lj", 0.0),
@@ -657,7 +813,7 @@ class Model:
             if future is None:
                 future = Future()
                 self._state.system_info_selection_future = future
-                sections = dict(self._state.parm7_sections)
+                sections = self._state.parm7_sections
             else:
                 sections = None
 
@@ -704,18 +860,12 @@ class Model:
             cached = self._state.bond_adjacency
             if cached is not None:
                 return cached
-            sections = dict(self._state.parm7_sections)
-        adjacency: Dict[int, set[int]] = {}
-        for name in ("BONDS_INC_HYDROGEN", "BONDS_WITHOUT_HYDROGEN"):
-            section = sections.get(name)
-            if not section or not section.tokens:
-                continue
-            values = parse_int_tokens(section.tokens)
-            for idx in range(0, len(values) - 2, 3):
-                atom_a = abs(int(values[idx])) // 3 + 1
-                atom_b = abs(int(values[idx + 1])) // 3 + 1
-                adjacency.setdefault(atom_a, set()).add(atom_b)
-                adjacency.setdefault(atom_b, set()).add(atom_a)
+            sections = self._state.parm7_sections
+        adjacency = build_bond_adjacency(
+            token_int_array(section.tokens)
+            for section in (sections.get(name) for name in BOND_SECTIONS)
+            if section and section.tokens
+        )
         with self._lock:
             if self._state.bond_adjacency is None:
                 self._state.bond_adjacency = adjacency
@@ -3,15 +3,173 @@
 from __future__ import annotations
 
 import logging
-from typing import Dict, List
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
-from topview.model.state import AtomMeta
+import numpy as np
+
+from topview.model.state import AtomMeta, AtomTable
 
 logger = logging.getLogger(__name__)
 
 
+_AtomRow = Tuple[int, str, str, Optional[str], Optional[float]]
+
+
+def iter_atom_rows(meta_list: Sequence[AtomMeta]) -> Iterator[_AtomRow]:
+    """Yield ``(serial, resname, atom_name, atom_type, charge)`` per atom.
+
+    An ``AtomTable`` is read column-wise so no ``AtomMeta`` is materialized.
+    """
+
+    if isinstance(meta_list, AtomTable):
+        residues = meta_list.residues
+        for row, (atom_name, atom_type, charge) in enumerate(
+            zip(meta_list.atom_names, meta_list.atom_types, meta_list.charges)
+        ):
+            yield row + 1, residues[row].resname, atom_name, atom_type, charge
+        return
+    for meta in meta_list:
+        yield (
+            meta.serial,
+            meta.residue.resname,
+            meta.atom_name,
+            meta.parm7.get("atom_type"),
+            meta.parm7.get("charge"),
+        )
+
+
+@dataclass(frozen=True)
+class QueryColumns:
+    """Factorized filter columns of an ``AtomTable``.
+
+    String columns are stored as lowercased unique values plus one code per
+    atom, so a substring filter tests each distinct value once and expands
+    the result with a single NumPy take.
+
+    Attributes
+    ----------
+    resnames, resname_codes
+        Lowercased residue names and per-atom codes into them.
+    atom_names, atom_name_codes
+        Lowercased atom names and per-atom codes into them.
+    atom_types, atom_type_codes
+        Lowercased atom types (``None`` when missing) and per-atom codes.
+    charges
+        Charges as float64, NaN when missing.
+    """
+
+    resnames: List[str]
+    resname_codes: np.ndarray
+    atom_names: List[str]
+    atom_name_codes: np.ndarray
+    atom_types: List[Optional[str]]
+    atom_type_codes: np.ndarray
+    charges: np.ndarray
+
+
+def _factorize(
+    values: Iterable[Optional[str]],
+) -> Tuple[List[Optional[str]], np.ndarray]:
+    codes_by_value: Dict[Optional[str], int] = {}
+    codes = np.fromiter(
+        (codes_by_value.setdefault(value, len(codes_by_value)) for value in values),
+        dtype=np.int32,
+    )
+    return list(codes_by_value), codes
+
+
+def query_columns(table: AtomTable) -> QueryColumns:
+    """Return the cached ``QueryColumns`` of a table, building them once.
+
+    Parameters
+    ----------
+    table
+        Column-wise atom metadata.
+
+    Returns
+    -------
+    QueryColumns
+        Factorized filter columns.
+    """
+
+    columns = table.query_columns
+    if columns is None:
+        resnames, resname_codes = _factorize(
+            residue.resname.lower() for residue in table.residues
+        )
+        atom_names, atom_name_codes = _factorize(
+            name.lower() for name in table.atom_names
+        )
+        atom_types, atom_type_codes = _factorize(
+            atom_type.lower() if atom_type is not None else None
+            for atom_type in table.atom_types
+        )
+        charges = np.array(
+            [np.nan if charge is None else charge for charge in table.charges],
+            dtype=np.float64,
+        )
+        columns = QueryColumns(
+            resnames=resnames,
+            resname_codes=resname_codes,
+            atom_names=atom_names,
+            atom_name_codes=atom_name_codes,
+            atom_types=atom_types,
+            atom_type_codes=atom_type_codes,
+            charges=charges,
+        )
+        table.query_columns = columns
+    return columns
+
+
+def _code_mask(
+    values: Sequence[Optional[str]],
+    codes: np.ndarray,
+    predicate: Callable[[Optional[str]], bool],
+) -> np.ndarray:
+    # Evaluate the predicate once per distinct value, then expand per atom.
+    hits = np.fromiter(map(predicate, values), dtype=bool, count=len(values))
+    return hits[codes]
+
+
+def _query_table(
+    table: AtomTable,
+    resname_contains: str,
+    atomname_contains: str,
+    atom_type_equals: str,
+    charge_min: Optional[float],
+    charge_max: Optional[float],
+) -> np.ndarray:
+    columns = query_columns(table)
+    mask = np.ones(len(table), dtype=bool)
+    if resname_contains:
+        mask &= _code_mask(
+            columns.resnames,
+            columns.resname_codes,
+            lambda value: resname_contains in value,
+        )
+    if atomname_contains:
+        mask &= _code_mask(
+            columns.atom_names,
+            columns.atom_name_codes,
+            lambda value: atomname_contains in value,
+        )
+    if atom_type_equals:
+        mask &= _code_mask(
+            columns.atom_types,
+            columns.atom_type_codes,
+            lambda value: value == atom_type_equals,
+        )
+    # NaN charges fail both comparisons, matching "missing charge" exclusion.
+    if charge_min is not None:
+        mask &= columns.charges >= charge_min
+    if charge_max is not None:
+        mask &= columns.charges <= charge_max
+    return np.flatnonzero(mask) + 1
+
+
 def query_atoms(
-    meta_list: List[AtomMeta],
+    meta_list: Sequence[AtomMeta],
     filters: Dict[str, object],
     max_results: int = 50000,
 ) -> Dict[str, object]:
@@ -20,7 +178,7 @@ def query_atoms(
     Parameters
     ----------
     meta_list
-        List of atom metadata to filter.
+        Atom metadata to filter, in serial order.
     filters
         Query filters (resname_contains, atomname_contains, atom_type_equals, charge range).
     max_results
@@ -64,27 +222,41 @@ def query_atoms(
     except (TypeError, ValueError):
         charge_max = None
 
+    if isinstance(meta_list, AtomTable):
+        matches = _query_table(
+            meta_list,
+            resname_contains,
+            atomname_contains,
+            atom_type_equals,
+            charge_min,
+            charge_max,
+        )
+        truncated = matches.size >= max_results
+        serials = matches[:max_results].tolist()
+        logger.debug("Query returned %d results", len(serials))
+        return {
+            "ok": True,
+            "serials": serials,
+            "count": len(serials),
+            "truncated": truncated,
+        }
+
     serials: List[int] = []
-    for meta in meta_list:
-        if (
-            resname_contains
-            and resname_contains not in meta.residue.resname.lower()
-        ):
+    for serial, resname, atom_name, atom_type, charge in iter_atom_rows(meta_list):
+        if resname_contains and resname_contains not in resname.lower():
             continue
-        if atomname_contains and atomname_contains not in meta.atom_name.lower():
+        if atomname_contains and atomname_contains not in atom_name.lower():
             continue
         if atom_type_equals:
-            atom_type = meta.parm7.get("atom_type")
             if atom_type is None or atom_type.lower() != atom_type_equals:
                 continue
-        charge = meta.parm7.get("charge")
         if charge_min is not None:
             if charge is None or charge < charge_min:
                 continue
         if charge_max is not None:
             if charge is None or charge > charge_max:
                 continue
-        serials.append(meta.serial)
+        serials.append(serial)
         if len(serials) >= max_results:
             logger.debug("Query truncated at %d results", len(serials))
             return {
@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
 from concurrent.futures import Future
 
+import numpy as np
+
 
 @dataclass(frozen=True)
 class ResidueMeta:
@@ -92,6 +94,189 @@ class AtomMeta:
         }
 
 
+class AtomTable(Sequence[AtomMeta]):
+    """Atom metadata stored column-wise (structure of arrays).
+
+    Row ``i`` describes serial ``i + 1``. ``AtomMeta`` objects, including
+    their ``parm7`` dict, are built only when a row is accessed; bulk
+    consumers read the columns directly.
+
+    Attributes
+    ----------
+    atom_names
+        Atom name per row.
+    elements
+        Element symbol per row.
+    residues
+        Residue metadata per row (shared between atoms of one residue).
+    residue_indices
+        1-based residue index per row.
+    coords
+        Cartesian coordinates, shape ``(n, 3)``.
+    atom_types
+        AMBER atom type per row.
+    atom_type_indices
+        Parm7 atom type index per row.
+    charges
+        Charge in elementary charges per row.
+    charges_raw
+        Raw parm7 CHARGE token per row.
+    charges_mdanalysis
+        Charge reported by the topology reader per row.
+    masses
+        Mass per row.
+    lj_by_type
+        Diagonal LJ parameters keyed by atom type index.
+    query_columns
+        Factorized, lowercased filter columns, filled on first use by
+        ``query_atoms``.
+    """
+
+    __slots__ = (
+        "atom_names",
+        "elements",
+        "residues",
+        "residue_indices",
+        "coords",
+        "atom_types",
+        "atom_type_indices",
+        "charges",
+        "charges_raw",
+        "charges_mdanalysis",
+        "masses",
+        "lj_by_type",
+        "query_columns",
+    )
+
+    def __init__(
+        self,
+        atom_names: List[str],
+        elements: List[Optional[str]],
+        residues: List[ResidueMeta],
+        residue_indices: Sequence[int],
+        coords: Sequence[Sequence[float]],
+        atom_types: List[Optional[str]],
+        atom_type_indices: List[Optional[int]],
+        charges: List[Optional[float]],
+        charges_raw: List[Optional[str]],
+        charges_mdanalysis: List[Optional[float]],
+        masses: List[Optional[float]],
+        lj_by_type: Optional[Dict[int, Dict[str, Optional[float]]]] = None,
+    ) -> None:
+        """Initialize the atom columns.
+
+        Parameters
+        ----------
+        atom_names, elements, residues, residue_indices, coords, atom_types,
+        atom_type_indices, charges, charges_raw, charges_mdanalysis, masses
+            Per-atom columns in serial order (see class attributes).
+        lj_by_type
+            Diagonal LJ parameters keyed by atom type index.
+
+        Returns
+        -------
+        None
+            This method does not return a value.
+        """
+
+        self.atom_names = atom_names
+        self.elements = elements
+        self.residues = residues
+        self.residue_indices = np.asarray(residue_indices, dtype=np.int32)
+        self.coords = np.asarray(coords, dtype=np.float64).reshape(-1, 3)
+        self.atom_types = atom_types
+        self.atom_type_indices = atom_type_indices
+        self.charges = charges
+        self.charges_raw = charges_raw
+        self.charges_mdanalysis = charges_mdanalysis
+        self.masses = masses
+        self.lj_by_type = lj_by_type or {}
+        self.query_columns: Optional[object] = None
+
+    def __len__(self) -> int:
+        return len(self.atom_names)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[AtomMeta, List[AtomMeta]]:
+        if isinstance(index, slice):
+            return [self.atom(row) for row in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("atom row out of range")
+        return self.atom(index)
+
+    def __iter__(self) -> Iterator[AtomMeta]:
+        return map(self.atom, range(len(self)))
+
+    def atom(self, row: int) -> AtomMeta:
+        """Build the ``AtomMeta`` for a row.
+
+        Parameters
+        ----------
+        row
+            0-based row index (serial - 1).
+
+        Returns
+        -------
+        AtomMeta
+            Atom metadata for the row.
+        """
+
+        atom_type_index = self.atom_type_indices[row]
+        lj_entry = self.lj_by_type.get(atom_type_index) if atom_type_index else None
+        if lj_entry is None:
+            lj_entry = {}
+        charge = self.charges[row]
+        x, y, z = self.coords[row].tolist()
+        return AtomMeta(
+            serial=row + 1,
+            atom_name=self.atom_names[row],
+            element=self.elements[row],
+            residue=self.residues[row],
+            residue_index=int(self.residue_indices[row]),
+            coords=(x, y, z),
+            parm7={
+                "atom_type": self.atom_types[row],
+                "atom_type_index": atom_type_index,
+                "charge": charge,
+                "charge_raw": self.charges_raw[row],
+                "charge_e": charge,
+                "charge_mdanalysis": self.charges_mdanalysis[row],
+                "mass": self.masses[row],
+                "lj_rmin": lj_entry.get("rmin"),
+                "lj_epsilon": lj_entry.get("epsilon"),
+                "lj_a_coef": lj_entry.get("acoef"),
+                "lj_b_coef": lj_entry.get("bcoef"),
+                "lj_pair_index": lj_entry.get("pair_index"),
+            },
+        )
+
+    def by_serial(self) -> "AtomsBySerial":
+        """Return a read-only serial -> ``AtomMeta`` mapping over the table."""
+
+        return AtomsBySerial(self)
+
+
+class AtomsBySerial(Mapping[int, AtomMeta]):
+    """Read-only ``serial -> AtomMeta`` view over an ``AtomTable``."""
+
+    __slots__ = ("_table",)
+
+    def __init__(self, table: AtomTable) -> None:
+        self._table = table
+
+    def __getitem__(self, serial: int) -> AtomMeta:
+        if isinstance(serial, int) and 0 < serial <= len(self._table):
+            return self._table.atom(serial - 1)
+        raise KeyError(serial)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(1, len(self._table) + 1))
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+
 @dataclass(frozen=True)
 class Parm7Token:
     """Token metadata for a parm7 field.
@@ -114,6 +299,111 @@ class Parm7Token:
     end: int
 
 
+class Parm7TokenArray(Sequence[Parm7Token]):
+    """Parm7 tokens stored as parallel arrays (structure of arrays).
+
+    Behaves like a read-only sequence of ``Parm7Token``; token objects are
+    only built when an element is accessed, while bulk consumers read
+    ``values`` directly.
+
+    Attributes
+    ----------
+    values
+        Raw token values.
+    lines
+        Line index of each token.
+    starts
+        Start character offset of each token.
+    ends
+        End character offset of each token.
+    int_values
+        Values parsed as integers, filled on first use by ``token_int_array``.
+    """
+
+    __slots__ = ("values", "lines", "starts", "ends", "int_values")
+
+    def __init__(
+        self,
+        values: List[str],
+        lines: Sequence[int],
+        starts: Sequence[int],
+        ends: Sequence[int],
+    ) -> None:
+        """Initialize the token arrays.
+
+        Parameters
+        ----------
+        values
+            Raw token values.
+        lines
+            Line index of each token.
+        starts
+            Start character offset of each token.
+        ends
+            End character offset of each token.
+
+        Returns
+        -------
+        None
+            This method does not return a value.
+        """
+
+        self.values = values
+        self.lines = np.asarray(lines, dtype=np.int32)
+        self.starts = np.asarray(starts, dtype=np.int32)
+        self.ends = np.asarray(ends, dtype=np.int32)
+        self.int_values: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[Parm7Token, "Parm7TokenArray"]:
+        if isinstance(index, slice):
+            return Parm7TokenArray(
+                self.values[index],
+                self.lines[index],
+                self.starts[index],
+                self.ends[index],
+            )
+        return Parm7Token(
+            self.values[index],
+            int(self.lines[index]),
+            int(self.starts[index]),
+            int(self.ends[index]),
+        )
+
+    def __iter__(self) -> Iterator[Parm7Token]:
+        return map(
+            Parm7Token,
+            self.values,
+            self.lines.tolist(),
+            self.starts.tolist(),
+            self.ends.tolist(),
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Parm7TokenArray):
+            return (
+                self.values == other.values
+                and np.array_equal(self.lines, other.lines)
+                and np.array_equal(self.starts, other.starts)
+                and np.array_equal(self.ends, other.ends)
+            )
+        if isinstance(other, (list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __reduce__(self):
+        return (Parm7TokenArray, (self.values, self.lines, self.starts, self.ends))
+
+    def __repr__(self) -> str:
+        return f"Parm7TokenArray(len={len(self)})"
+
+
 @dataclass(frozen=True)
 class Parm7Section:
     """Parsed parm7 section metadata.
@@ -131,7 +421,8 @@ class Parm7Section:
     end_line
         Line index of the last line in the section.
     tokens
-        Parsed tokens for the section.
+        Parsed tokens for the section (a ``Parm7TokenArray`` when produced by
+        the parser).
     """
 
     name: str
@@ -139,7 +430,40 @@ class Parm7Section:
     width: int
     flag_line: int
     end_line: int
-    tokens: List[Parm7Token]
+    tokens: Sequence[Parm7Token]
+
+
+@dataclass(frozen=True)
+class LoadedSnapshot:
+    """Immutable view of a loaded system for lock-free readers.
+
+    The model publishes a new snapshot by attribute assignment once a load
+    completes; readers take a reference and never see a half-updated system.
+
+    Attributes
+    ----------
+    parm7_path
+        Path of the loaded parm7 file.
+    parm7_stamp
+        ``(size, mtime_ns)`` of the parm7 file when it was parsed.
+    parm7_sections
+        Parsed parm7 sections keyed by flag.
+    meta_list
+        Atom metadata in serial order.
+    meta_by_serial
+        Atom metadata keyed by serial.
+    """
+
+    parm7_path: str
+    parm7_stamp: Tuple[int, int]
+    parm7_sections: Mapping[str, Parm7Section]
+    meta_list: Sequence[AtomMeta]
+    meta_by_serial: Mapping[int, AtomMeta]
+
+    def meta_for_serial(self, serial: int) -> Optional[AtomMeta]:
+        """Return atom metadata for a serial, or None if it is unknown."""
+
+        return lookup_meta(self.meta_list, self.meta_by_serial, serial)
 
 
 @dataclass
@@ -156,14 +480,24 @@ class ModelState:
         Mapping of resid to residue keys.
     residue_index
         Mapping of residue key to atom serials.
-    parm7_text_b64
-        Base64-encoded parm7 text.
+    parm7_path
+        Path of the loaded parm7 file (text is read on demand).
+    parm7_stamp
+        ``(size, mtime_ns)`` of the parm7 file when it was parsed.
     parm7_sections
-        Parsed parm7 sections keyed by flag.
+        Parsed parm7 sections keyed by flag (a read-only view once loaded).
     int_section_cache
-        Cached integer section values.
+        Cached read-only integer section arrays.
     float_section_cache
-        Cached float section values.
+        Cached read-only float section arrays.
+    term_index_cache
+        Cached ``TermIndex`` objects keyed by section name and atom slots.
+    token_span_cache
+        Cached ``(lines, starts, ends)`` token spans keyed by section name.
+    atom_highlight_cache
+        Cached base parm7 highlights keyed by atom serial.
+    param_value_cache
+        Cached parameter values keyed by ``(section name, parameter index)``.
     system_info
         Cached system info tables payload.
     system_info_future
@@ -180,14 +514,25 @@ class ModelState:
         Whether a system is currently loaded.
     """
 
-    meta_by_serial: Dict[int, AtomMeta] = field(default_factory=dict)
-    meta_list: List[AtomMeta] = field(default_factory=list)
+    meta_by_serial: Mapping[int, AtomMeta] = field(default_factory=dict)
+    meta_list: Sequence[AtomMeta] = field(default_factory=list)
     residue_keys_by_resid: Dict[int, List[str]] = field(default_factory=dict)
     residue_index: Dict[str, List[int]] = field(default_factory=dict)
-    parm7_text_b64: Optional[str] = None
-    parm7_sections: Dict[str, Parm7Section] = field(default_factory=dict)
-    int_section_cache: Dict[str, List[int]] = field(default_factory=dict)
-    float_section_cache: Dict[str, List[float]] = field(default_factory=dict)
+    parm7_path: Optional[str] = None
+    parm7_stamp: Optional[Tuple[int, int]] = None
+    parm7_sections: Mapping[str, Parm7Section] = field(default_factory=dict)
+    int_section_cache: Dict[str, np.ndarray] = field(default_factory=dict)
+    float_section_cache: Dict[str, np.ndarray] = field(default_factory=dict)
+    term_index_cache: Dict[object, object] = field(default_factory=dict)
+    token_span_cache: Dict[str, Tuple[List[int], List[int], List[int]]] = field(
+        default_factory=dict
+    )
+    atom_highlight_cache: Dict[int, List[Dict[str, object]]] = field(
+        default_factory=dict
+    )
+    param_value_cache: Dict[Tuple[str, int], Optional[float]] = field(
+        default_factory=dict
+    )
     system_info: Optional[Dict[str, Dict[str, object]]] = None
     system_info_future: Optional[Future] = None
     system_info_selection_index: Optional[object] = None
@@ -198,3 +543,51 @@ class ModelState:
     nmr_restraints: List[Dict[str, object]] = field(default_factory=list)
     nmr_summary: Dict[str, int] = field(default_factory=dict)
     loaded: bool = False
+
+    def meta_for_serial(self, serial: int) -> Optional[AtomMeta]:
+        """Return atom metadata for a serial, or None if it is unknown.
+
+        Parameters
+        ----------
+        serial
+            1-based atom serial.
+
+        Returns
+        -------
+        AtomMeta or None
+            Matching atom metadata.
+        """
+
+        return lookup_meta(self.meta_list, self.meta_by_serial, serial)
+
+
+def lookup_meta(
+    meta_list: Sequence[AtomMeta],
+    meta_by_serial: Mapping[int, AtomMeta],
+    serial: int,
+) -> Optional[AtomMeta]:
+    """Look up atom metadata by serial, indexing ``meta_list`` when possible.
+
+    Serials are dense ``1..N`` for loaded systems, so ``meta_list[serial - 1]``
+    is tried first; the dict is the fallback for sparse or partial lists.
+
+    Parameters
+    ----------
+    meta_list
+        Atom metadata in serial order.
+    meta_by_serial
+        Atom metadata keyed by serial.
+    serial
+        1-based atom serial.
+
+    Returns
+    -------
+    AtomMeta or None
+        Matching atom metadata.
+    """
+
+    if 0 < serial <= len(meta_list):
+        meta = meta_list[serial - 1]
+        if meta.serial == serial:
+            return meta
+    return meta_by_serial.get(serial)
@@ -8,7 +8,11 @@ from typing import Dict, List, Optional
 import numpy as np
 
 from topview.model.state import Parm7Token
-from topview.services.parm7 import parse_float_token_value, parse_int_token_value
+from topview.services.parm7 import (
+    parse_float_array,
+    token_int_array,
+    token_values,
+)
 
 LJ_MIN_COEF = 1.0e-10
 LJ_ONE_SIXTH = 1.0 / 6.0
@@ -115,7 +119,6 @@ def build_lj_by_type(
         Mapping of type index to LJ parameters.
     """
 
-    lj_by_type: Dict[int, Dict[str, float]] = {}
     ntypes = 0
     if nonbond_index:
         matrix_size = int(round(math.sqrt(len(nonbond_index))))
@@ -124,33 +127,78 @@ def build_lj_by_type(
     if not ntypes and atom_type_indices:
         ntypes = max(atom_type_indices)
     if not ntypes:
-        return lj_by_type
-    for type_index in range(1, ntypes + 1):
-        offset = (type_index - 1) * ntypes + (type_index - 1)
-        entry = {
-            "rmin": 0.0,
-            "epsilon": 0.0,
-            "acoef": None,
-            "bcoef": None,
-            "pair_index": None,
+        return {}
+    return _diagonal_lj_entries(
+        ntypes,
+        np.asarray(nonbond_index, dtype=np.int64),
+        np.asarray(acoef_values, dtype=np.float64),
+        np.asarray(bcoef_values, dtype=np.float64),
+    )
+
+
+def _diagonal_lj_entries(
+    ntypes: int, nonbond_index: np.ndarray, acoef: np.ndarray, bcoef: np.ndarray
+) -> Dict[int, Dict[str, float]]:
+    """Build per-type LJ entries from the diagonal of the nonbonded index matrix.
+
+    Parameters
+    ----------
+    ntypes
+        Number of atom types.
+    nonbond_index
+        Flattened NONBONDED_PARM_INDEX values.
+    acoef
+        LENNARD_JONES_ACOEF values.
+    bcoef
+        LENNARD_JONES_BCOEF values.
+
+    Returns
+    -------
+    dict
+        Mapping of type index to LJ parameters.
+    """
+
+    offsets = np.arange(ntypes, dtype=np.int64) * (ntypes + 1)
+    has_pair = offsets < nonbond_index.size
+    pair_index = np.zeros(ntypes, dtype=np.int64)
+    pair_index[has_pair] = nonbond_index[offsets[has_pair]]
+    pair_offset = pair_index - 1
+    has_coef = (
+        has_pair
+        & (pair_index > 0)
+        & (pair_offset < acoef.size)
+        & (pair_offset < bcoef.size)
+    )
+    type_acoef = np.zeros(ntypes, dtype=np.float64)
+    type_bcoef = np.zeros(ntypes, dtype=np.float64)
+    type_acoef[has_coef] = acoef[pair_offset[has_coef]]
+    type_bcoef[has_coef] = bcoef[pair_offset[has_coef]]
+    valid = has_coef & (type_acoef >= LJ_MIN_COEF) & (type_bcoef >= LJ_MIN_COEF)
+    factor = np.ones(ntypes, dtype=np.float64)
+    factor[valid] = 2.0 * type_acoef[valid] / type_bcoef[valid]
+    rmin = np.where(valid, np.power(factor, LJ_ONE_SIXTH) * 0.5, 0.0)
+    epsilon = np.where(valid, type_bcoef / 2.0 / factor, 0.0)
+
+    lj_by_type: Dict[int, Dict[str, float]] = {}
+    for idx, (paired, coef, pair, acoef_value, bcoef_value, rmin_value, eps_value) in enumerate(
+        zip(
+            has_pair.tolist(),
+            has_coef.tolist(),
+            pair_index.tolist(),
+            type_acoef.tolist(),
+            type_bcoef.tolist(),
+            rmin.tolist(),
+            epsilon.tolist(),
+        ),
+        start=1,
+    ):
+        lj_by_type[idx] = {
+            "rmin": rmin_value,
+            "epsilon": eps_value,
+            "acoef": acoef_value if coef else None,
+            "bcoef": bcoef_value if coef else None,
+            "pair_index": pair if paired else None,
         }
-        if offset >= len(nonbond_index):
-            lj_by_type[type_index] = entry
-            continue
-        pair_index = nonbond_index[offset]
-        entry["pair_index"] = int(pair_index)
-        if pair_index > 0:
-            pair_offset = pair_index - 1
-            if pair_offset < len(acoef_values) and pair_offset < len(bcoef_values):
-                acoef = acoef_values[pair_offset]
-                bcoef = bcoef_values[pair_offset]
-                entry["acoef"] = acoef
-                entry["bcoef"] = bcoef
-                if acoef >= LJ_MIN_COEF and bcoef >= LJ_MIN_COEF:
-                    factor = 2.0 * acoef / bcoef
-                    entry["rmin"] = pow(factor, LJ_ONE_SIXTH) * 0.5
-                    entry["epsilon"] = bcoef / 2.0 / factor
-        lj_by_type[type_index] = entry
     return lj_by_type
 
 
@@ -179,39 +227,17 @@ def build_lj_by_type_from_tokens(
         Mapping of type index to LJ parameters.
     """
 
-    lj_by_type: Dict[int, Dict[str, float]] = {}
     if not atom_type_indices:
-        return lj_by_type
+        return {}
     ntypes = max(atom_type_indices)
     if ntypes <= 0:
-        return lj_by_type
-    for type_index in range(1, ntypes + 1):
-        offset = (type_index - 1) * ntypes + (type_index - 1)
-        entry = {
-            "rmin": 0.0,
-            "epsilon": 0.0,
-            "acoef": None,
-            "bcoef": None,
-            "pair_index": None,
-        }
-        if offset >= len(nonbond_tokens):
-            lj_by_type[type_index] = entry
-            continue
-        pair_index = parse_int_token_value(nonbond_tokens[offset])
-        entry["pair_index"] = int(pair_index)
-        if pair_index > 0:
-            pair_offset = pair_index - 1
-            if pair_offset < len(acoef_tokens) and pair_offset < len(bcoef_tokens):
-                acoef = parse_float_token_value(acoef_tokens[pair_offset])
-                bcoef = parse_float_token_value(bcoef_tokens[pair_offset])
-                entry["acoef"] = acoef
-                entry["bcoef"] = bcoef
-                if acoef >= LJ_MIN_COEF and bcoef >= LJ_MIN_COEF:
-                    factor = 2.0 * acoef / bcoef
-                    entry["rmin"] = pow(factor, LJ_ONE_SIXTH) * 0.5
-                    entry["epsilon"] = bcoef / 2.0 / factor
-        lj_by_type[type_index] = entry
-    return lj_by_type
+        return {}
+    return _diagonal_lj_entries(
+        ntypes,
+        token_int_array(nonbond_tokens),
+        parse_float_array(token_values(acoef_tokens)),
+        parse_float_array(token_values(bcoef_tokens)),
+    )
 
 
 def compute_lj_tables(
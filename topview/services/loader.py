@@ -5,28 +5,42 @@ from __future__ import annotations
 import base64
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 import logging
 import os
+import sys
 import time
 import warnings
-from typing import Callable, Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Mapping, Optional, Sequence, Tuple
 
 import MDAnalysis as mda
 from MDAnalysis.exceptions import NoDataError
+import numpy as np
 
 from topview.config import CHARGE_SCALE, DEFAULT_RESNAME, RESNAME_ALL
 from topview.errors import ModelError
-from topview.model.state import AtomMeta, Parm7Section, ResidueMeta
+from topview.model.state import AtomMeta, AtomTable, Parm7Section, ResidueMeta
 from topview.services.lj import compute_lj_tables
 from topview.services.nmr_restraints import (
     parse_nmr_restraints,
     summarize_nmr_restraints,
 )
-from topview.services.parm7 import describe_section, parse_int_tokens, parse_parm7, parse_pointers
-from topview.services.pdb_writer import write_pdb
+from topview.services.parm7 import (
+    describe_section,
+    parm7_file_stamp,
+    parse_parm7,
+    parse_pointers,
+    token_int_array,
+    token_values,
+)
+from topview.services.pdb_writer import write_pdb_bytes
 
 logger = logging.getLogger(__name__)
 
+# Long-lived pool that parses parm7 alongside the Universe load. Its thread is
+# started on first use and reused by every later load.
+_LOAD_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="topview-load")
+
 _BOND_ORDER_SINGLE = 1
 _BOND_ORDER_DOUBLE = 2
 _BOND_ORDER_TRIPLE = 3
@@ -246,15 +260,17 @@ class SystemLoadResult:
     view_mode
         Viewer mode ("3d" or "2d").
     meta_list
-        List of atom metadata in serial order.
+        Atom metadata in serial order (an ``AtomTable``).
     meta_by_serial
         Atom metadata keyed by serial.
     residue_index
         Mapping of residue key to atom serials.
     residue_keys_by_resid
-        Mapping of resid to possible residue keys.
-    parm7_text_b64
-        Base64-encoded parm7 text.
+        Mapping of resid to its distinct residue keys.
+    parm7_path
+        Path of the parsed parm7 file.
+    parm7_stamp
+        ``(size, mtime_ns)`` of the parm7 file when it was parsed.
     parm7_sections
         Parsed parm7 sections keyed by flag.
     pdb_b64
@@ -272,11 +288,12 @@ class SystemLoadResult:
     """
 
     view_mode: str
-    meta_list: List[AtomMeta]
-    meta_by_serial: Dict[int, AtomMeta]
+    meta_list: Sequence[AtomMeta]
+    meta_by_serial: Mapping[int, AtomMeta]
     residue_index: Dict[str, List[int]]
     residue_keys_by_resid: Dict[int, List[str]]
-    parm7_text_b64: str
+    parm7_path: str
+    parm7_stamp: Tuple[int, int]
     parm7_sections: Dict[str, Parm7Section]
     pdb_b64: Optional[str]
     depiction: Optional[Dict[str, object]]
@@ -310,18 +327,8 @@ def _load_universe(parm7_path: str, rst7_path: str) -> mda.Universe:
         )
 
 
-def _guess_element(atom_name: str) -> Optional[str]:
-    name = (atom_name or "").strip()
-    if not name:
-        return None
-    i = 0
-    while i < len(name) and name[i].isdigit():
-        i += 1
-    name = name[i:]
-    if not name:
-        return None
-    upper = name[:2].upper()
-    two_letter = {
+_TWO_LETTER_ELEMENTS = frozenset(
+    {
         "CL",
         "BR",
         "NA",
@@ -342,7 +349,22 @@ def _guess_element(atom_name: str) -> Optional[str]:
         "AG",
         "AU",
     }
-    if upper in two_letter:
+)
+
+
+@lru_cache(maxsize=4096)
+def _guess_element(atom_name: str) -> Optional[str]:
+    name = (atom_name or "").strip()
+    if not name:
+        return None
+    i = 0
+    while i < len(name) and name[i].isdigit():
+        i += 1
+    name = name[i:]
+    if not name:
+        return None
+    upper = name[:2].upper()
+    if upper in _TWO_LETTER_ELEMENTS:
         return upper[0] + upper[1].lower()
     if len(name) > 1 and name[1].islower():
         return name[0].upper() + name[1].lower()
@@ -360,6 +382,150 @@ def _safe_attr(atoms, attr: str) -> Optional[List[object]]:
         return None
 
 
+def _float_column(
+    values: Optional[Sequence[object]], natoms: int
+) -> List[Optional[float]]:
+    if values is None:
+        return [None] * natoms
+    # NumPy would turn None into nan; missing values must stay None.
+    if not isinstance(values, np.ndarray) and any(value is None for value in values):
+        return [float(value) if value is not None else None for value in values]
+    return np.asarray(values, dtype=np.float64).tolist()
+
+
+def _atom_columns(
+    natoms: int,
+    names: Sequence[object],
+    elements: Optional[Sequence[object]],
+    types: Optional[Sequence[object]],
+    charges: Optional[Sequence[object]],
+    masses: Optional[Sequence[object]],
+    charge_tokens: Optional[Sequence[str]],
+    atom_type_indices: Sequence[int],
+) -> Dict[str, list]:
+    """Build the per-atom ``AtomTable`` columns that do not depend on residues.
+
+    Charges and masses are converted in bulk with NumPy; the string columns
+    are single comprehensions, so no per-atom branching is left in the
+    residue loop.
+    """
+
+    intern = sys.intern
+    atom_names = [intern(str(name).strip()) for name in names]
+    if elements is None:
+        elements = [None] * natoms
+    atom_elements = [
+        intern(str(element).strip().title()) if element else _guess_element(name)
+        for name, element in zip(atom_names, elements)
+    ]
+    if types is None:
+        atom_types = [None] * natoms
+    else:
+        atom_types = [
+            intern(str(atom_type).strip()) if atom_type is not None else None
+            for atom_type in types
+        ]
+    type_indices = list(atom_type_indices[:natoms])
+    type_indices.extend([None] * (natoms - len(type_indices)))
+
+    charges_mdanalysis = _float_column(charges, natoms)
+    charges_raw: List[Optional[str]] = [None] * natoms
+    charges_e: List[Optional[float]] = [None] * natoms
+    if charge_tokens:
+        count = min(natoms, len(charge_tokens))
+        charges_raw[:count] = [raw.strip() for raw in charge_tokens[:count]]
+        try:
+            scaled = np.asarray(charges_raw[:count], dtype=np.float64) / CHARGE_SCALE
+            charges_e[:count] = scaled.tolist()
+        except ValueError:
+            for idx in range(count):
+                try:
+                    charges_e[idx] = float(charges_raw[idx]) / CHARGE_SCALE
+                except ValueError:
+                    pass
+    charges_e = [
+        fallback if charge is None else charge
+        for charge, fallback in zip(charges_e, charges_mdanalysis)
+    ]
+    return {
+        "atom_names": atom_names,
+        "elements": atom_elements,
+        "atom_types": atom_types,
+        "atom_type_indices": type_indices,
+        "charges": charges_e,
+        "charges_raw": charges_raw,
+        "charges_mdanalysis": charges_mdanalysis,
+        "masses": _float_column(masses, natoms),
+    }
+
+
+def _residue_runs(natoms: int, *columns: Optional[Sequence[object]]) -> List[int]:
+    """Return the start offsets of runs where every column is constant."""
+    if natoms == 0:
+        return []
+    changed = np.zeros(natoms - 1, dtype=bool)
+    for column in columns:
+        if column is None:
+            continue
+        values = np.asarray(column, dtype=object)
+        changed |= values[1:] != values[:-1]
+    return [0] + (np.flatnonzero(changed) + 1).tolist()
+
+
+def _residue_columns(
+    natoms: int,
+    resids: Sequence[object],
+    resnames: Sequence[object],
+    resindices: Sequence[object],
+    segids: Optional[Sequence[object]] = None,
+    chains: Optional[Sequence[object]] = None,
+) -> Tuple[
+    List[ResidueMeta], List[int], Dict[str, List[int]], Dict[int, List[str]]
+]:
+    """Build per-atom residue columns and lookup maps one residue run at a time.
+
+    Consecutive atoms sharing every residue field are handled together, so the
+    Python work scales with the number of residues rather than atoms.
+    """
+    atom_residues: List[ResidueMeta] = []
+    atom_residue_indices: List[int] = []
+    residue_index_map: Dict[str, List[int]] = {}
+    residue_keys_by_resid: Dict[int, List[str]] = {}
+    residue_cache: Dict[Tuple[object, ...], ResidueMeta] = {}
+    intern = sys.intern
+
+    starts = _residue_runs(natoms, resindices, resids, resnames, segids, chains)
+    for start, stop in zip(starts, starts[1:] + [natoms]):
+        count = stop - start
+        resid = int(resids[start])
+        resname = intern(str(resnames[start]).strip())
+        segid = segids[start] if segids is not None else None
+        if segid is not None:
+            segid = intern(str(segid))
+        chain = chains[start] if chains is not None else None
+        if chain is not None:
+            chain = intern(str(chain))
+        residue_fields = (resid, resname, segid, chain)
+        residue_meta = residue_cache.get(residue_fields)
+        if residue_meta is None:
+            residue_meta = ResidueMeta(
+                resid=resid, resname=resname, segid=segid, chain=chain
+            )
+            residue_cache[residue_fields] = residue_meta
+
+        atom_residues.extend([residue_meta] * count)
+        atom_residue_indices.extend([int(resindices[start]) + 1] * count)
+
+        residue_key = intern(f"{segid or ''}:{resid}:{resname}")
+        residue_index_map.setdefault(residue_key, []).extend(
+            range(start + 1, stop + 1)
+        )
+        resid_keys = residue_keys_by_resid.setdefault(resid, [])
+        if residue_key not in resid_keys:
+            resid_keys.append(residue_key)
+    return atom_residues, atom_residue_indices, residue_index_map, residue_keys_by_resid
+
+
 def _is_resname_all(resname: Optional[str]) -> bool:
     return (resname or "").strip().lower() == RESNAME_ALL
 
@@ -372,11 +538,10 @@ def _extract_bond_pairs(
         section = parm7_sections.get(section_name)
         if not section or not section.tokens:
             continue
-        values = parse_int_tokens(section.tokens)
-        for i in range(0, len(values) - 2, 3):
-            sa = abs(values[i]) // 3 + 1
-            sb = abs(values[i + 1]) // 3 + 1
-            bonds.append((sa, sb))
+        values = token_int_array(section.tokens)
+        count = values.size // 3
+        pairs = np.abs(values[: count * 3].reshape(count, 3)[:, :2]) // 3 + 1
+        bonds.extend(map(tuple, pairs.tolist()))
     return bonds
 
 
@@ -393,18 +558,12 @@ def _compute_lj_tables(
     acoef_section = parm7_sections.get("LENNARD_JONES_ACOEF")
     bcoef_section = parm7_sections.get("LENNARD_JONES_BCOEF")
     if atom_type_index_section:
-        atom_type_values = [token.value for token in atom_type_index_section.tokens]
+        atom_type_values = token_values(atom_type_index_section.tokens)
         nonbond_values = (
-            [token.value for token in nonbond_index_section.tokens]
-            if nonbond_index_section
-            else []
-        )
-        acoef_values = (
-            [token.value for token in acoef_section.tokens] if acoef_section else []
-        )
-        bcoef_values = (
-            [token.value for token in bcoef_section.tokens] if bcoef_section else []
+            token_values(nonbond_index_section.tokens) if nonbond_index_section else []
         )
+        acoef_values = token_values(acoef_section.tokens) if acoef_section else []
+        bcoef_values = token_values(bcoef_section.tokens) if bcoef_section else []
         if not nonbond_values or not acoef_values or not bcoef_values:
             raise ModelError(
                 "parm7_parse_failed",
@@ -704,34 +863,27 @@ def load_system_data_3d(
         raise ModelError("file_not_found", "rst7 file not found", rst7_path)
 
     total_start = time.perf_counter()
+    parm7_stamp = parm7_file_stamp(parm7_path)
     logger.debug("Loading MDAnalysis Universe and parm7")
-    universe_time = 0.0
-    parm7_time = 0.0
-    with ThreadPoolExecutor(max_workers=2) as executor:
-        universe_future = executor.submit(
-            _timed_call,
-            _load_universe,
-            parm7_path,
-            rst7_path,
-        )
-        parm7_future = executor.submit(_timed_call, parse_parm7, parm7_path)
-        try:
-            universe, universe_time = universe_future.result()
-        except Exception as exc:
-            parm7_future.cancel()
-            logger.exception("MDAnalysis load failed")
-            raise ModelError(
-                "load_failed", "Failed to load MDAnalysis Universe", str(exc)
-            ) from exc
-        try:
-            (parm7_text, parm7_sections), parm7_time = parm7_future.result()
-        except Exception as exc:
-            logger.exception("Failed to parse parm7 file")
-            raise ModelError(
-                "parm7_parse_failed", "Failed to parse parm7 file", str(exc)
-            ) from exc
-
-    parm7_text_b64 = base64.b64encode(parm7_text.encode("utf-8")).decode("ascii")
+    # The parm7 parse runs on the pool while the Universe loads on this thread.
+    parm7_future = _LOAD_POOL.submit(
+        _timed_call, parse_parm7, parm7_path, include_text=False
+    )
+    try:
+        universe, universe_time = _timed_call(_load_universe, parm7_path, rst7_path)
+    except Exception as exc:
+        parm7_future.cancel()
+        logger.exception("MDAnalysis load failed")
+        raise ModelError(
+            "load_failed", "Failed to load MDAnalysis Universe", str(exc)
+        ) from exc
+    try:
+        (_, parm7_sections), parm7_time = parm7_future.result()
+    except Exception as exc:
+        logger.exception("Failed to parse parm7 file")
+        raise ModelError(
+            "parm7_parse_failed", "Failed to parse parm7 file", str(exc)
+        ) from exc
 
     pointer_section = parm7_sections.get("POINTERS")
     if not pointer_section or not pointer_section.tokens:
@@ -780,11 +932,6 @@ def load_system_data_3d(
     nmr_restraints = [record.to_dict() for record in nmr_records]
     nmr_summary = summarize_nmr_restraints(nmr_records)
 
-    meta_list: List[AtomMeta] = []
-    meta_by_serial: Dict[int, AtomMeta] = {}
-    residue_keys_by_resid: Dict[int, List[str]] = {}
-    residue_index_map: Dict[str, List[int]] = {}
-
     atoms = universe.atoms
     natoms = len(atoms)
 
@@ -800,128 +947,38 @@ def load_system_data_3d(
     meta_attrs_time = time.perf_counter() - attrs_start
 
     build_start = time.perf_counter()
-    guess_element = _guess_element
-    element_cache: Dict[str, Optional[str]] = {}
-    cache_missing = object()
-    charge_tokens = charge_section.tokens if charge_section else None
-    atom_type_indices_local = atom_type_indices
-    lj_by_type_local = lj_by_type
-    names_list = names
-    resids_list = resids
-    resnames_list = resnames
-    resindices_list = resindices
-    segids_list = segids
-    chains_list = chains
-    elements_list = elements
-    positions_arr = positions
-    charges_list = charges
-    masses_list = masses
-    types_list = types
-    ResidueMetaCls = ResidueMeta
-    AtomMetaCls = AtomMeta
-    meta_list_append = meta_list.append
-    meta_by_serial_set = meta_by_serial.__setitem__
-    residue_index_map_setdefault = residue_index_map.setdefault
-    residue_keys_by_resid_setdefault = residue_keys_by_resid.setdefault
-
-    for idx in range(natoms):
-        serial = idx + 1
-        resid = int(resids_list[idx])
-        resname = str(resnames_list[idx]).strip()
-        residue_serial_index = int(resindices_list[idx]) + 1
-        segid = segids_list[idx] if segids_list is not None else None
-        chain = chains_list[idx] if chains_list is not None else None
-        residue_meta = ResidueMetaCls(
-            resid=resid, resname=resname, segid=segid, chain=chain
-        )
-
-        name_str = str(names_list[idx]).strip()
-        element = elements_list[idx] if elements_list is not None else None
-        if element:
-            element = str(element).strip().title()
-        else:
-            cached = element_cache.get(name_str, cache_missing)
-            if cached is cache_missing:
-                cached = guess_element(name_str)
-                element_cache[name_str] = cached
-            element = cached
-
-        atom_type = types_list[idx] if types_list is not None else None
-        atom_type_index = None
-        lj_rmin = None
-        lj_epsilon = None
-        lj_acoef = None
-        lj_bcoef = None
-        lj_pair_index = None
-        if atom_type_indices_local and idx < len(atom_type_indices_local):
-            atom_type_index = atom_type_indices_local[idx]
-            if atom_type_index and atom_type_index in lj_by_type_local:
-                lj_entry = lj_by_type_local[atom_type_index]
-                lj_rmin = lj_entry.get("rmin")
-                lj_epsilon = lj_entry.get("epsilon")
-                lj_acoef = lj_entry.get("acoef")
-                lj_bcoef = lj_entry.get("bcoef")
-                lj_pair_index = lj_entry.get("pair_index")
-        charge = charges_list[idx] if charges_list is not None else None
-        charge_raw_str = None
-        charge_e = None
-        if charge_tokens and idx < len(charge_tokens):
-            charge_raw_str = charge_tokens[idx].value.strip()
-            try:
-                charge_raw_val = float(charge_raw_str)
-                charge_e = charge_raw_val / CHARGE_SCALE
-            except ValueError:
-                charge_e = None
-        if charge_e is None and charge is not None:
-            try:
-                charge_e = float(charge)
-            except (TypeError, ValueError):
-                charge_e = None
-        mass = masses_list[idx] if masses_list is not None else None
-
-        coords = (
-            float(positions_arr[idx][0]),
-            float(positions_arr[idx][1]),
-            float(positions_arr[idx][2]),
-        )
-        parm7 = {
-            "atom_type": str(atom_type).strip() if atom_type is not None else None,
-            "atom_type_index": atom_type_index,
-            "charge": charge_e,
-            "charge_raw": charge_raw_str,
-            "charge_e": charge_e,
-            "charge_mdanalysis": float(charge) if charge is not None else None,
-            "mass": float(mass) if mass is not None else None,
-            "lj_rmin": lj_rmin,
-            "lj_epsilon": lj_epsilon,
-            "lj_a_coef": lj_acoef,
-            "lj_b_coef": lj_bcoef,
-            "lj_pair_index": lj_pair_index,
-        }
-
-        meta = AtomMetaCls(
-            serial=serial,
-            atom_name=name_str,
-            element=element,
-            residue=residue_meta,
-            residue_index=residue_serial_index,
-            coords=coords,
-            parm7=parm7,
-        )
-
-        meta_list_append(meta)
-        meta_by_serial_set(serial, meta)
-
-        residue_key = f"{segid or ''}:{resid}:{resname}"
-        residue_index_map_setdefault(residue_key, []).append(serial)
-        residue_keys_by_resid_setdefault(resid, []).append(residue_key)
-
+    charge_tokens = token_values(charge_section.tokens) if charge_section else None
+    atom_columns = _atom_columns(
+        natoms,
+        names,
+        elements,
+        types,
+        charges,
+        masses,
+        charge_tokens,
+        atom_type_indices,
+    )
+    (
+        atom_residues,
+        atom_residue_indices,
+        residue_index_map,
+        residue_keys_by_resid,
+    ) = _residue_columns(natoms, resids, resnames, resindices, segids, chains)
+
+    meta_list = AtomTable(
+        residues=atom_residues,
+        residue_indices=atom_residue_indices,
+        coords=positions,
+        lj_by_type=lj_by_type,
+        **atom_columns,
+    )
+    meta_by_serial = meta_list.by_serial()
     meta_build_time = time.perf_counter() - build_start
     bond_pairs = _extract_bond_pairs(parm7_sections)
     pdb_start = time.perf_counter()
-    pdb_text = write_pdb(meta_list, bonds=bond_pairs)
+    pdb_bytes = write_pdb_bytes(meta_list, bonds=bond_pairs)
     pdb_time = time.perf_counter() - pdb_start
-    pdb_b64 = base64.b64encode(pdb_text.encode("ascii")).decode("ascii")
+    pdb_b64 = base64.b64encode(pdb_bytes).decode("ascii")
 
     total_time = time.perf_counter() - total_start
     logger.debug(
@@ -945,7 +1002,8 @@ def load_system_data_3d(
         meta_by_serial=meta_by_serial,
         residue_index=residue_index_map,
         residue_keys_by_resid=residue_keys_by_resid,
-        parm7_text_b64=parm7_text_b64,
+        parm7_path=parm7_path,
+        parm7_stamp=parm7_stamp,
         parm7_sections=parm7_sections,
         pdb_b64=pdb_b64,
         depiction=None,
@@ -978,14 +1036,14 @@ def load_system_data_2d(
     total_start = time.perf_counter()
     parse_start = time.perf_counter()
     try:
-        parm7_text, parm7_sections = parse_parm7(parm7_path)
+        parm7_stamp = parm7_file_stamp(parm7_path)
+        _, parm7_sections = parse_parm7(parm7_path, include_text=False)
     except Exception as exc:
         logger.exception("Failed to parse parm7 file")
         raise ModelError(
             "parm7_parse_failed", "Failed to parse parm7 file", str(exc)
         ) from exc
     parm7_time = time.perf_counter() - parse_start
-    parm7_text_b64 = base64.b64encode(parm7_text.encode("utf-8")).decode("ascii")
 
     pointer_section = parm7_sections.get("POINTERS")
     if not pointer_section or not pointer_section.tokens:
@@ -1048,7 +1106,7 @@ def load_system_data_2d(
     warning_messages: List[str] = []
     warnings: List[str] = []
     charge_section = parm7_sections.get("CHARGE")
-    charge_tokens = charge_section.tokens if charge_section else None
+    charge_tokens = token_values(charge_section.tokens) if charge_section else None
 
     charge_missing = any(atom.charge is None for atom in atoms)
     mass_missing = any(atom.mass is None for atom in atoms)
@@ -1095,11 +1153,6 @@ def load_system_data_2d(
             target_residue.name or normalized_resname,
         )
 
-    meta_list: List[AtomMeta] = []
-    meta_by_serial: Dict[int, AtomMeta] = {}
-    residue_keys_by_resid: Dict[int, List[str]] = {}
-    residue_index_map: Dict[str, List[int]] = {}
-
     attrs_start = time.perf_counter()
     names_list = [atom.name for atom in atoms]
     resids_list = [
@@ -1117,106 +1170,35 @@ def load_system_data_2d(
     meta_attrs_time = time.perf_counter() - attrs_start
 
     build_start = time.perf_counter()
-    guess_element = _guess_element
-    element_cache: Dict[str, Optional[str]] = {}
-    cache_missing = object()
-    atom_type_indices_local = atom_type_indices
-    lj_by_type_local = lj_by_type
-    ResidueMetaCls = ResidueMeta
-    AtomMetaCls = AtomMeta
-    meta_list_append = meta_list.append
-    meta_by_serial_set = meta_by_serial.__setitem__
-    residue_index_map_setdefault = residue_index_map.setdefault
-    residue_keys_by_resid_setdefault = residue_keys_by_resid.setdefault
-
-    for idx, atom in enumerate(atoms):
-        serial = idx + 1
-        resid = int(resids_list[idx])
-        resname_val = str(resnames_list[idx]).strip()
-        residue_serial_index = int(resindices_list[idx]) + 1
-        segid = None
-        residue_meta = ResidueMetaCls(
-            resid=resid, resname=resname_val, segid=segid, chain=None
-        )
-
-        name_str = str(names_list[idx]).strip()
-        element = elements_list[idx]
-        if element:
-            element = str(element).strip().title()
-        else:
-            cached = element_cache.get(name_str, cache_missing)
-            if cached is cache_missing:
-                cached = guess_element(name_str)
-                element_cache[name_str] = cached
-            element = cached
-
-        atom_type = types_list[idx] if types_list is not None else None
-        atom_type_index = None
-        lj_rmin = None
-        lj_epsilon = None
-        lj_acoef = None
-        lj_bcoef = None
-        lj_pair_index = None
-        if atom_type_indices_local and idx < len(atom_type_indices_local):
-            atom_type_index = atom_type_indices_local[idx]
-            if atom_type_index and atom_type_index in lj_by_type_local:
-                lj_entry = lj_by_type_local[atom_type_index]
-                lj_rmin = lj_entry.get("rmin")
-                lj_epsilon = lj_entry.get("epsilon")
-                lj_acoef = lj_entry.get("acoef")
-                lj_bcoef = lj_entry.get("bcoef")
-                lj_pair_index = lj_entry.get("pair_index")
-
-        charge = charges_list[idx] if charges_list is not None else None
-        charge_raw_str = None
-        charge_e = None
-        if charge_tokens and idx < len(charge_tokens):
-            charge_raw_str = charge_tokens[idx].value.strip()
-            try:
-                charge_raw_val = float(charge_raw_str)
-                charge_e = charge_raw_val / CHARGE_SCALE
-            except ValueError:
-                charge_e = None
-        if charge_e is None and charge is not None:
-            try:
-                charge_e = float(charge)
-            except (TypeError, ValueError):
-                charge_e = None
-        mass = masses_list[idx] if masses_list is not None else None
-
-        coords = coords_by_serial.get(serial, (0.0, 0.0, 0.0))
-        parm7 = {
-            "atom_type": str(atom_type).strip() if atom_type is not None else None,
-            "atom_type_index": atom_type_index,
-            "charge": charge_e,
-            "charge_raw": charge_raw_str,
-            "charge_e": charge_e,
-            "charge_mdanalysis": float(charge) if charge is not None else None,
-            "mass": float(mass) if mass is not None else None,
-            "lj_rmin": lj_rmin,
-            "lj_epsilon": lj_epsilon,
-            "lj_a_coef": lj_acoef,
-            "lj_b_coef": lj_bcoef,
-            "lj_pair_index": lj_pair_index,
-        }
-
-        meta = AtomMetaCls(
-            serial=serial,
-            atom_name=name_str,
-            element=element,
-            residue=residue_meta,
-            residue_index=residue_serial_index,
-            coords=coords,
-            parm7=parm7,
-        )
-
-        meta_list_append(meta)
-        meta_by_serial_set(serial, meta)
-
-        residue_key = f"{segid or ''}:{resid}:{resname_val}"
-        residue_index_map_setdefault(residue_key, []).append(serial)
-        residue_keys_by_resid_setdefault(resid, []).append(residue_key)
-
+    atom_columns = _atom_columns(
+        len(atoms),
+        names_list,
+        elements_list,
+        types_list,
+        charges_list,
+        masses_list,
+        charge_tokens,
+        atom_type_indices,
+    )
+    atom_coords = [
+        coords_by_serial.get(serial, (0.0, 0.0, 0.0))
+        for serial in range(1, len(atoms) + 1)
+    ]
+    (
+        atom_residues,
+        atom_residue_indices,
+        residue_index_map,
+        residue_keys_by_resid,
+    ) = _residue_columns(len(atoms), resids_list, resnames_list, resindices_list)
+
+    meta_list = AtomTable(
+        residues=atom_residues,
+        residue_indices=atom_residue_indices,
+        coords=atom_coords,
+        lj_by_type=lj_by_type,
+        **atom_columns,
+    )
+    meta_by_serial = meta_list.by_serial()
     meta_build_time = time.perf_counter() - build_start
     total_time = time.perf_counter() - total_start
     logger.debug(
@@ -1238,7 +1220,8 @@ def load_system_data_2d(
         meta_by_serial=meta_by_serial,
         residue_index=residue_index_map,
         residue_keys_by_resid=residue_keys_by_resid,
-        parm7_text_b64=parm7_text_b64,
+        parm7_path=parm7_path,
+        parm7_stamp=parm7_stamp,
         parm7_sections=parm7_sections,
         pdb_b64=None,
         depiction=depiction,
@@ -2,19 +2,33 @@
 
 from __future__ import annotations
 
+import base64
+import io
+import json
 import logging
-import mmap
+import os
 import re
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 import numpy as np
 
 from topview.config import PARM7_REFERENCE_PATH, PARM7_TOKEN_SECTIONS
-from topview.model.state import Parm7Section, Parm7Token
+from topview.model.state import Parm7Section, Parm7Token, Parm7TokenArray
 
 logger = logging.getLogger(__name__)
 
+_FORMAT_RE = re.compile(r"%FORMAT\((\d+)([a-zA-Z])(\d+)(?:\.(\d+))?\)")
+_FLAG_IN_LINE_RE = re.compile(r"%FLAG\s+([A-Z0-9_]+)")
+_FLAG_DESC_RE = re.compile(r"\*\*Flag:\*\*\s*`%FLAG\s+([A-Z0-9_]+)`")
+_WHITESPACE_RE = re.compile(r"\s+")
+_FORTRAN_EXPONENT = str.maketrans("Dd", "Ee")
+
+_READ_BUFFER_SIZE = 1 << 20
+
+_REFERENCE_CACHE_SUFFIX = ".cache.json"
+_REFERENCE_CACHE_VERSION = 1
+
 _PARM7_DESCRIPTIONS: Optional[Dict[str, str]] = None
 _PARM7_DEPRECATED: Optional[set] = None
 
@@ -101,13 +115,18 @@ OPTIONAL_PRMTOP_SECTIONS = frozenset(
 )
 
 
-def parse_parm7(path: str) -> Tuple[str, Dict[str, Parm7Section]]:
+def parse_parm7(
+    path: str, include_text: bool = True
+) -> Tuple[str, Dict[str, Parm7Section]]:
     """Parse a parm7 file into raw text and tokenized sections.
 
     Parameters
     ----------
     path
         Path to the parm7 file.
+    include_text
+        Whether to return the full file text. When false the file is streamed
+        line by line and an empty string is returned in its place.
 
     Returns
     -------
@@ -115,70 +134,234 @@ def parse_parm7(path: str) -> Tuple[str, Dict[str, Parm7Section]]:
         Raw text and a dict of parm7 sections keyed by flag.
     """
 
-    with open(path, "rb") as handle:
-        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mm:
-            text = mm.read().decode("utf-8", errors="replace")
-    lines = text.splitlines()
+    if include_text:
+        with open(path, "rb") as handle:
+            raw = handle.read()
+        text = raw.decode("utf-8", errors="replace")
+        # BytesIO shares ``raw`` and yields lines lazily, so no full list of
+        # line objects is built next to the file bytes and decoded text.
+        return text, _parse_parm7_lines(io.BytesIO(raw))
+    with open(path, "rb", buffering=_READ_BUFFER_SIZE) as handle:
+        return "", _parse_parm7_lines(handle)
+
+
+def _tokenize_rows(
+    rows: List[bytes], first_line: int, count: int, width: int
+) -> Tuple[List[str], Sequence[int], Sequence[int], Sequence[int]]:
+    # Rows filled to exactly ``count`` ASCII cells are sliced as one block, with
+    # token positions derived arithmetically; whatever follows (short last row,
+    # blank cells) goes through the per-line scan.
+    full_width = count * width
+    rows = [row.rstrip(b"\r\n") for row in rows]
+    block_rows = next(
+        (pos for pos, row in enumerate(rows) if len(row) != full_width), len(rows)
+    )
+    block = b"".join(rows[:block_rows])
+    values: List[str] = []
+    if block.isascii():
+        text = block.decode("ascii")
+        values = [text[start : start + width] for start in range(0, len(text), width)]
+        if any(map(str.isspace, values)):
+            values = []
+            block_rows = 0
+    else:
+        block_rows = 0
+    ntokens = len(values)
+    cells = np.arange(ntokens, dtype=np.int32)
+    token_lines: Sequence[int] = first_line + cells // count
+    starts: Sequence[int] = cells % count * width
+    ends: Sequence[int] = starts + width
+    if block_rows == len(rows):
+        return values, token_lines, starts, ends
+
+    token_lines = token_lines.tolist()
+    starts = starts.tolist()
+    ends = ends.tolist()
+    slot_starts = list(range(0, full_width, width))
+    slot_ends = [start + width for start in slot_starts]
+    for idx in range(block_rows, len(rows)):
+        line = rows[idx].decode("utf-8", errors="replace")
+        line_idx = first_line + idx
+        if len(line) >= full_width:
+            row = [line[start:end] for start, end in zip(slot_starts, slot_ends)]
+            if not any(map(str.isspace, row)):
+                values.extend(row)
+                token_lines.extend([line_idx] * count)
+                starts.extend(slot_starts)
+                ends.extend(slot_ends)
+                continue
+        line_len = len(line)
+        for start in range(0, min(line_len, full_width), width):
+            raw = line[start : start + width]
+            if raw.isspace():
+                continue
+            values.append(raw)
+            token_lines.append(line_idx)
+            starts.append(start)
+            ends.append(min(start + width, line_len))
+    return values, token_lines, starts, ends
+
+
+def _parse_parm7_lines(lines: Iterable[bytes]) -> Dict[str, Parm7Section]:
+    # Lines stay bytes until they are known to belong to a tokenized section,
+    # so untokenized sections (EXCLUDED_ATOMS_LIST, ...) are never decoded.
+    # Data rows are only collected here and tokenized per section block.
     sections: Dict[str, Parm7Section] = {}
-    fmt_re = re.compile(r"%FORMAT\((\d+)([a-zA-Z])(\d+)(?:\.(\d+))?\)")
 
     current_name: Optional[str] = None
     current_count = 0
     current_width = 0
-    current_tokens: List[Parm7Token] = []
     current_flag_line = 0
     collect_tokens = False
+    tokenizing = False
+    rows: List[bytes] = []
+    rows_start = 0
+    tokens: List[Tuple[List[str], Sequence[int], Sequence[int], Sequence[int]]] = []
+
+    def flush_rows() -> None:
+        if rows:
+            tokens.append(
+                _tokenize_rows(rows, rows_start, current_count, current_width)
+            )
+            rows.clear()
 
     def finalize_section(end_line: int) -> None:
         if current_name:
+            flush_rows()
+            if not tokens:
+                token_array = Parm7TokenArray([], [], [], [])
+            elif len(tokens) == 1:
+                token_array = Parm7TokenArray(*tokens[0])
+            else:
+                token_array = Parm7TokenArray(
+                    [value for part in tokens for value in part[0]],
+                    *(
+                        np.concatenate([np.asarray(part[field]) for part in tokens])
+                        for field in (1, 2, 3)
+                    ),
+                )
             sections[current_name] = Parm7Section(
                 name=current_name,
                 count=current_count,
                 width=current_width,
                 flag_line=current_flag_line,
                 end_line=end_line,
-                tokens=list(current_tokens),
+                tokens=token_array,
             )
 
-    for idx, line in enumerate(lines):
-        if line.startswith("%FLAG"):
-            if current_name is not None:
-                finalize_section(idx - 1)
-            parts = line.split()
-            current_name = parts[1] if len(parts) > 1 else None
-            current_count = 0
-            current_width = 0
-            current_tokens = []
-            current_flag_line = idx
-            collect_tokens = bool(current_name and current_name in PARM7_TOKEN_SECTIONS)
-            continue
-        if line.startswith("%FORMAT"):
-            match = fmt_re.search(line)
-            if match:
-                current_count = int(match.group(1))
-                current_width = int(match.group(3))
+    idx = -1
+    for idx, raw_line in enumerate(lines):
+        # Data lines dominate: dispatch on the first byte before any prefix scan.
+        if raw_line[:1] == b"%":
+            line = raw_line.rstrip(b"\r\n").decode("utf-8", errors="replace")
+            if line.startswith("%FLAG"):
+                if current_name is not None:
+                    finalize_section(idx - 1)
+                parts = line.split()
+                current_name = parts[1] if len(parts) > 1 else None
+                current_count = 0
+                current_width = 0
+                current_flag_line = idx
+                collect_tokens = bool(current_name and current_name in PARM7_TOKEN_SECTIONS)
+                tokenizing = False
+                rows.clear()
+                tokens = []
+                continue
+            if line.startswith("%FORMAT"):
+                match = _FORMAT_RE.search(line)
+                if match:
+                    flush_rows()
+                    current_count = int(match.group(1))
+                    current_width = int(match.group(3))
+                    tokenizing = bool(collect_tokens and current_count and current_width)
+                continue
+        if not tokenizing:
             continue
-        if collect_tokens and current_name and current_count and current_width:
-            for slot in range(current_count):
-                start = slot * current_width
-                end = start + current_width
-                if start >= len(line):
-                    break
-                raw = line[start:end]
-                if not raw.strip():
-                    continue
-                current_tokens.append(
-                    Parm7Token(
-                        value=raw,
-                        line=idx,
-                        start=start,
-                        end=min(end, len(line)),
-                    )
-                )
+        if not rows:
+            rows_start = idx
+        rows.append(raw_line)
 
     if current_name is not None:
-        finalize_section(len(lines) - 1)
-    return text, sections
+        finalize_section(idx)
+    return sections
+
+
+def parm7_file_stamp(path: str) -> Tuple[int, int]:
+    """Return ``(size, mtime_ns)`` identifying the on-disk parm7 contents.
+
+    Parameters
+    ----------
+    path
+        Path to the parm7 file.
+
+    Returns
+    -------
+    tuple
+        File size in bytes and modification time in nanoseconds.
+    """
+
+    return _stat_stamp(os.stat(path))
+
+
+def _stat_stamp(stat: os.stat_result) -> Tuple[int, int]:
+    return stat.st_size, stat.st_mtime_ns
+
+
+def read_parm7_b64(
+    path: str, stamp: Tuple[int, int], offset: int = 0, length: int = -1
+) -> str:
+    """Read a byte range of a parm7 file and return it base64-encoded.
+
+    Parameters
+    ----------
+    path
+        Path to the parm7 file.
+    stamp
+        ``parm7_file_stamp`` recorded when the file was parsed.
+    offset
+        Byte offset to start reading from.
+    length
+        Number of bytes to read; negative reads to the end of the file.
+
+    Returns
+    -------
+    str
+        Base64-encoded bytes.
+
+    Raises
+    ------
+    ValueError
+        If the file changed on disk since ``stamp`` was taken.
+    """
+
+    with open(path, "rb") as handle:
+        # Check the stamp on the open handle so the bytes encoded are the ones
+        # that were stamped, with no window for a swap between stat and read.
+        if _stat_stamp(os.fstat(handle.fileno())) != stamp:
+            raise ValueError(f"{path} changed on disk since it was loaded")
+        if offset:
+            handle.seek(offset)
+        data = handle.read(length)
+    return base64.b64encode(data).decode("ascii")
+
+
+def token_values(tokens: Sequence[Parm7Token]) -> List[str]:
+    """Return the raw values of a token sequence.
+
+    Parameters
+    ----------
+    tokens
+        Parm7 tokens (``Parm7TokenArray`` or a list of ``Parm7Token``).
+
+    Returns
+    -------
+    list
+        Raw token values.
+    """
+
+    if isinstance(tokens, Parm7TokenArray):
+        return tokens.values
+    return [token.value for token in tokens]
 
 
 def describe_section(section: Optional[Parm7Section]) -> str:
@@ -209,23 +392,80 @@ def load_parm7_descriptions() -> Dict[str, str]:
         Mapping of section flag to description text.
     """
 
-    global _PARM7_DESCRIPTIONS
-    if _PARM7_DESCRIPTIONS is not None:
-        return _PARM7_DESCRIPTIONS
-    if not PARM7_REFERENCE_PATH.exists():
-        _PARM7_DESCRIPTIONS = {}
-        return _PARM7_DESCRIPTIONS
+    return _load_parm7_reference()[0]
+
+
+def load_parm7_deprecated_flags() -> set:
+    """Return a set of deprecated parm7 flag names.
+
+    Returns
+    -------
+    set
+        Set of deprecated section flag names.
+    """
+
+    return _load_parm7_reference()[1]
+
+
+def _load_parm7_reference() -> Tuple[Dict[str, str], set]:
+    """Load descriptions and deprecated flags, using the on-disk cache.
+
+    The parsed reference is stored next to the markdown file as JSON keyed by
+    the file's mtime and size, so warm starts skip the regex pass. Cache
+    read/write failures fall back to parsing.
+
+    Returns
+    -------
+    tuple
+        Section descriptions and deprecated flag names.
+    """
+
+    global _PARM7_DESCRIPTIONS, _PARM7_DEPRECATED
+    if _PARM7_DESCRIPTIONS is not None and _PARM7_DEPRECATED is not None:
+        return _PARM7_DESCRIPTIONS, _PARM7_DEPRECATED
+    try:
+        stat = PARM7_REFERENCE_PATH.stat()
+    except OSError:
+        _PARM7_DESCRIPTIONS, _PARM7_DEPRECATED = {}, set()
+        return _PARM7_DESCRIPTIONS, _PARM7_DEPRECATED
+    cache_key = [_REFERENCE_CACHE_VERSION, stat.st_mtime_ns, stat.st_size]
+    cache_path = PARM7_REFERENCE_PATH.with_name(
+        PARM7_REFERENCE_PATH.name + _REFERENCE_CACHE_SUFFIX
+    )
+    try:
+        cached = json.loads(cache_path.read_text(encoding="utf-8"))
+        if cached.get("key") == cache_key:
+            _PARM7_DESCRIPTIONS = dict(cached["descriptions"])
+            _PARM7_DEPRECATED = set(cached["deprecated"])
+            return _PARM7_DESCRIPTIONS, _PARM7_DEPRECATED
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        pass
+    lines = PARM7_REFERENCE_PATH.read_text(encoding="utf-8", errors="replace").splitlines()
+    _PARM7_DESCRIPTIONS = _parse_reference_descriptions(lines)
+    _PARM7_DEPRECATED = _parse_reference_deprecated(lines)
+    payload = {
+        "key": cache_key,
+        "descriptions": _PARM7_DESCRIPTIONS,
+        "deprecated": sorted(_PARM7_DEPRECATED),
+    }
+    try:
+        cache_path.write_text(json.dumps(payload), encoding="utf-8")
+    except OSError:
+        logger.debug("Could not write parm7 reference cache %s", cache_path)
+    return _PARM7_DESCRIPTIONS, _PARM7_DEPRECATED
+
+
+def _parse_reference_descriptions(lines: List[str]) -> Dict[str, str]:
     descriptions: Dict[str, str] = {}
     current_flag = None
     capturing = False
     buffer: List[str] = []
-    lines = PARM7_REFERENCE_PATH.read_text(encoding="utf-8", errors="replace").splitlines()
     for line in lines:
-        flag_match = re.search(r"\*\*Flag:\*\*\s*`%FLAG\s+([A-Z0-9_]+)`", line)
+        flag_match = _FLAG_DESC_RE.search(line)
         if flag_match:
             if current_flag and buffer:
                 text = " ".join(buffer)
-                descriptions[current_flag] = re.sub(r"\s+", " ", text).strip()
+                descriptions[current_flag] = _WHITESPACE_RE.sub(" ", text).strip()
             current_flag = flag_match.group(1)
             capturing = False
             buffer = []
@@ -240,41 +480,25 @@ def load_parm7_descriptions() -> Dict[str, str]:
             if not line.strip():
                 if current_flag and buffer:
                     text = " ".join(buffer)
-                    descriptions[current_flag] = re.sub(r"\s+", " ", text).strip()
+                    descriptions[current_flag] = _WHITESPACE_RE.sub(" ", text).strip()
                 capturing = False
                 buffer = []
                 continue
             if line.startswith("## "):
                 if current_flag and buffer:
                     text = " ".join(buffer)
-                    descriptions[current_flag] = re.sub(r"\s+", " ", text).strip()
+                    descriptions[current_flag] = _WHITESPACE_RE.sub(" ", text).strip()
                 capturing = False
                 buffer = []
                 continue
             buffer.append(line.strip())
     if current_flag and buffer:
         text = " ".join(buffer)
-        descriptions[current_flag] = re.sub(r"\s+", " ", text).strip()
-    _PARM7_DESCRIPTIONS = descriptions
-    return _PARM7_DESCRIPTIONS
-
+        descriptions[current_flag] = _WHITESPACE_RE.sub(" ", text).strip()
+    return descriptions
 
-def load_parm7_deprecated_flags() -> set:
-    """Return a set of deprecated parm7 flag names.
 
-    Returns
-    -------
-    set
-        Set of deprecated section flag names.
-    """
-
-    global _PARM7_DEPRECATED
-    if _PARM7_DEPRECATED is not None:
-        return _PARM7_DEPRECATED
-    if not PARM7_REFERENCE_PATH.exists():
-        _PARM7_DEPRECATED = set()
-        return _PARM7_DEPRECATED
-    lines = PARM7_REFERENCE_PATH.read_text(encoding="utf-8", errors="replace").splitlines()
+def _parse_reference_deprecated(lines: List[str]) -> set:
     deprecated: set = set()
     current_flags: List[str] = []
     found_deprecated = False
@@ -287,7 +511,7 @@ def load_parm7_deprecated_flags() -> set:
         found_deprecated = False
 
     for line in lines:
-        flag_names = re.findall(r"%FLAG\s+([A-Z0-9_]+)", line)
+        flag_names = _FLAG_IN_LINE_RE.findall(line)
         if flag_names:
             flush_flags()
             current_flags = flag_names
@@ -302,8 +526,7 @@ def load_parm7_deprecated_flags() -> set:
     flush_flags()
     explicit_add = {"HBCUT", "JOIN_ARRAY", "IROTAT", "IPOL"}
     explicit_remove = {"POINTERS", "BOX_DIMENSIONS"}
-    _PARM7_DEPRECATED = (deprecated | explicit_add) - explicit_remove
-    return _PARM7_DEPRECATED
+    return (deprecated | explicit_add) - explicit_remove
 
 
 def parse_pointers(section: Parm7Section) -> Dict[str, int]:
@@ -325,7 +548,7 @@ def parse_pointers(section: Parm7Section) -> Dict[str, int]:
         If the number of pointer values is not 31 or 32.
     """
 
-    raw = " ".join(token.value for token in section.tokens)
+    raw = " ".join(token_values(section.tokens))
     values = np.fromstring(raw, sep=" ", dtype=int)
     if values.size not in (31, 32):
         logger.error(
@@ -340,6 +563,117 @@ def parse_pointers(section: Parm7Section) -> Dict[str, int]:
     return {name: int(value) for name, value in zip(names, values.tolist())}
 
 
+def parse_int_array(values: Sequence[str]) -> np.ndarray:
+    """Parse integer strings into an int64 array.
+
+    Well-formed input is converted in one NumPy call; anything else (blank
+    cells, float-formatted integers, garbage) falls back to per-value parsing
+    with the same rules as ``parse_int_token_value``.
+
+    Parameters
+    ----------
+    values
+        Raw string values to parse.
+
+    Returns
+    -------
+    numpy.ndarray
+        Parsed integer values.
+    """
+
+    if len(values) == 0:
+        return np.zeros(0, dtype=np.int64)
+    try:
+        return np.array(values, dtype=np.int64)
+    except (TypeError, ValueError, OverflowError):
+        return np.array([_parse_int_text(raw) for raw in values], dtype=np.int64)
+
+
+def parse_float_array(values: Sequence[str]) -> np.ndarray:
+    """Parse float strings into a float64 array, supporting Fortran D notation.
+
+    D exponents are rewritten in one pass before a second bulk conversion;
+    per-value parsing only runs for genuinely malformed input.
+
+    Parameters
+    ----------
+    values
+        Raw string values to parse.
+
+    Returns
+    -------
+    numpy.ndarray
+        Parsed float values.
+    """
+
+    if len(values) == 0:
+        return np.zeros(0, dtype=np.float64)
+    try:
+        return np.array(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        pass
+    try:
+        return np.array(
+            [raw.translate(_FORTRAN_EXPONENT) for raw in values], dtype=np.float64
+        )
+    except (AttributeError, TypeError, ValueError):
+        return np.array([_parse_float_text(raw) for raw in values], dtype=np.float64)
+
+
+def _parse_int_text(raw: Optional[str]) -> int:
+    text = (raw or "").strip()
+    if not text:
+        return 0
+    try:
+        return int(text)
+    except ValueError:
+        try:
+            return int(float(text))
+        except ValueError:
+            return 0
+
+
+def _parse_float_text(raw: Optional[str]) -> float:
+    text = (raw or "").strip()
+    if not text:
+        return 0.0
+    text = text.translate(_FORTRAN_EXPONENT)
+    try:
+        return float(text)
+    except ValueError:
+        return 0.0
+
+
+def token_int_array(tokens: Sequence[Parm7Token]) -> np.ndarray:
+    """Parse parm7 integer tokens into a read-only int64 array.
+
+    Only the raw values are read, never ``Parm7Token`` objects. For a
+    ``Parm7TokenArray`` the result is memoized on the array, so every
+    integer consumer of a section shares a single parse per load.
+
+    Parameters
+    ----------
+    tokens
+        Parm7 tokens to parse.
+
+    Returns
+    -------
+    numpy.ndarray
+        Parsed integer values (not writeable).
+    """
+
+    if isinstance(tokens, Parm7TokenArray):
+        cached = tokens.int_values
+        if cached is None:
+            cached = parse_int_array(tokens.values)
+            cached.flags.writeable = False
+            tokens.int_values = cached
+        return cached
+    values = parse_int_array(token_values(tokens))
+    values.flags.writeable = False
+    return values
+
+
 def parse_int_tokens(tokens: List[Parm7Token]) -> List[int]:
     """Parse parm7 integer tokens.
 
@@ -354,20 +688,7 @@ def parse_int_tokens(tokens: List[Parm7Token]) -> List[int]:
         Parsed integer values.
     """
 
-    values: List[int] = []
-    for token in tokens:
-        raw = token.value.strip()
-        if not raw:
-            values.append(0)
-            continue
-        try:
-            values.append(int(raw))
-        except ValueError:
-            try:
-                values.append(int(float(raw)))
-            except ValueError:
-                values.append(0)
-    return values
+    return token_int_array(tokens).tolist()
 
 
 def parse_float_tokens(tokens: List[Parm7Token]) -> List[float]:
@@ -384,18 +705,7 @@ def parse_float_tokens(tokens: List[Parm7Token]) -> List[float]:
         Parsed float values.
     """
 
-    values: List[float] = []
-    for token in tokens:
-        raw = token.value.strip()
-        if not raw:
-            values.append(0.0)
-            continue
-        raw = raw.replace("D", "E").replace("d", "e")
-        try:
-            values.append(float(raw))
-        except ValueError:
-            values.append(0.0)
-    return values
+    return parse_float_array(token_values(tokens)).tolist()
 
 
 def parse_int_values(values: List[str]) -> List[int]:
@@ -412,20 +722,7 @@ def parse_int_values(values: List[str]) -> List[int]:
         Parsed integer values.
     """
 
-    parsed: List[int] = []
-    for raw in values:
-        text = (raw or "").strip()
-        if not text:
-            parsed.append(0)
-            continue
-        try:
-            parsed.append(int(text))
-        except ValueError:
-            try:
-                parsed.append(int(float(text)))
-            except ValueError:
-                parsed.append(0)
-    return parsed
+    return parse_int_array(values).tolist()
 
 
 def parse_float_values(values: List[str]) -> List[float]:
@@ -442,18 +739,7 @@ def parse_float_values(values: List[str]) -> List[float]:
         Parsed float values.
     """
 
-    parsed: List[float] = []
-    for raw in values:
-        text = (raw or "").strip()
-        if not text:
-            parsed.append(0.0)
-            continue
-        text = text.replace("D", "E").replace("d", "e")
-        try:
-            parsed.append(float(text))
-        except ValueError:
-            parsed.append(0.0)
-    return parsed
+    return parse_float_array(values).tolist()
 
 
 def parse_int_token_value(token: Parm7Token) -> int:
@@ -470,16 +756,7 @@ def parse_int_token_value(token: Parm7Token) -> int:
         Parsed integer value.
     """
 
-    raw = token.value.strip()
-    if not raw:
-        return 0
-    try:
-        return int(raw)
-    except ValueError:
-        try:
-            return int(float(raw))
-        except ValueError:
-            return 0
+    return _parse_int_text(token.value)
 
 
 def parse_float_token_value(token: Parm7Token) -> float:
@@ -496,11 +773,4 @@ def parse_float_token_value(token: Parm7Token) -> float:
         Parsed float value.
     """
 
-    raw = token.value.strip()
-    if not raw:
-        return 0.0
-    raw = raw.replace("D", "E").replace("d", "e")
-    try:
-        return float(raw)
-    except ValueError:
-        return 0.0
+    return _parse_float_text(token.value)
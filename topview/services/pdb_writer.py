@@ -2,10 +2,18 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
 from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
+import numpy as np
+
 from topview.errors import PdbWriterError
+from topview.model.state import AtomTable
+
+# Fixed-column ATOM record; occupancy 1.00 and B-factor 0.00 are constant.
+# Records are formatted as bytes so the loader can base64 them without an
+# intermediate str; string fields are encoded once per distinct value.
+_ATOM_RECORD = b"ATOM  %5d %s %s %s%4d    %8.3f%8.3f%8.3f  1.00  0.00          %s"
+_CONECT_RECORDS = [b"CONECT%5d" + b"%5d" * count for count in range(5)]
 
 
 def _format_atom_name(name: str) -> str:
@@ -31,6 +39,162 @@ def _format_element(element: str) -> str:
     return element[0].upper() + element[1].lower()
 
 
+def _format_chain(chain: Optional[str]) -> bytes:
+    return (chain or " ")[:1].encode()
+
+
+def _atom_meta_records(atom_metas: Iterable[object]) -> List[bytes]:
+    lines: List[bytes] = []
+    append = lines.append
+    # Names, residue names and elements repeat heavily; format each once.
+    name_cache: Dict[str, bytes] = {}
+    resname_cache: Dict[str, bytes] = {}
+    element_cache: Dict[Optional[str], bytes] = {}
+    for meta in atom_metas:
+        try:
+            atom_name = meta.atom_name
+            name = name_cache.get(atom_name)
+            if name is None:
+                name = name_cache[atom_name] = _format_atom_name(atom_name).encode()
+            residue = meta.residue
+            raw_resname = residue.resname
+            resname = resname_cache.get(raw_resname)
+            if resname is None:
+                resname = resname_cache[raw_resname] = _format_resname(
+                    raw_resname
+                ).encode()
+            raw_element = meta.element
+            element = element_cache.get(raw_element)
+            if element is None:
+                element = element_cache[raw_element] = _format_element(
+                    raw_element
+                ).encode()
+            x, y, z = meta.coords
+            append(
+                _ATOM_RECORD
+                % (
+                    int(meta.serial),
+                    name,
+                    resname,
+                    _format_chain(residue.chain),
+                    int(residue.resid),
+                    x,
+                    y,
+                    z,
+                    element,
+                )
+            )
+        except (AttributeError, TypeError, ValueError) as exc:
+            raise PdbWriterError("pdb_format_failed", "Invalid atom metadata", str(exc)) from exc
+    return lines
+
+
+def _atom_table_records(table: AtomTable) -> List[bytes]:
+    # Columns are zipped directly, so no AtomMeta is built; residue fields are
+    # formatted once per shared ResidueMeta.
+    lines: List[bytes] = []
+    append = lines.append
+    name_cache: Dict[str, bytes] = {}
+    element_cache: Dict[Optional[str], bytes] = {}
+    residue_cache: Dict[int, Tuple[bytes, bytes, int]] = {}
+    try:
+        for row, (atom_name, raw_element, residue, (x, y, z)) in enumerate(
+            zip(table.atom_names, table.elements, table.residues, table.coords.tolist())
+        ):
+            name = name_cache.get(atom_name)
+            if name is None:
+                name = name_cache[atom_name] = _format_atom_name(atom_name).encode()
+            element = element_cache.get(raw_element)
+            if element is None:
+                element = element_cache[raw_element] = _format_element(
+                    raw_element
+                ).encode()
+            residue_fields = residue_cache.get(id(residue))
+            if residue_fields is None:
+                residue_fields = residue_cache[id(residue)] = (
+                    _format_resname(residue.resname).encode(),
+                    _format_chain(residue.chain),
+                    int(residue.resid),
+                )
+            append(
+                _ATOM_RECORD
+                % ((row + 1, name) + residue_fields + (x, y, z, element))
+            )
+    except (AttributeError, TypeError, ValueError) as exc:
+        raise PdbWriterError("pdb_format_failed", "Invalid atom metadata", str(exc)) from exc
+    return lines
+
+
+def _conect_block(bonds: Sequence[Tuple[int, int]]) -> bytes:
+    """Format the CONECT records, up to four sorted partners per record.
+
+    Both bond directions are packed into ``owner << 32 | partner`` keys, so a
+    single ``np.unique`` dedupes and orders them. Records are cut at owner
+    changes and every fourth partner, and the whole block is rendered with
+    one ``%`` over the flattened fields instead of one per record.
+    """
+
+    pairs = np.asarray(bonds, dtype=np.int64).reshape(-1, 2)
+    keys = np.unique(
+        np.concatenate(
+            [(pairs[:, 0] << 32) | pairs[:, 1], (pairs[:, 1] << 32) | pairs[:, 0]]
+        )
+    )
+    owners = keys >> 32
+    owner_starts = np.flatnonzero(np.r_[True, owners[1:] != owners[:-1]])
+    rank = np.arange(keys.size) - np.repeat(
+        owner_starts, np.diff(np.r_[owner_starts, keys.size])
+    )
+    record_starts = rank % 4 == 0
+    # Each record contributes its owner followed by its partners.
+    fields = np.empty(keys.size + int(record_starts.sum()), dtype=np.int64)
+    owner_slots = np.flatnonzero(record_starts) + np.arange(int(record_starts.sum()))
+    partner_slots = np.ones(fields.size, dtype=bool)
+    partner_slots[owner_slots] = False
+    fields[owner_slots] = owners[record_starts]
+    fields[partner_slots] = keys & 0xFFFFFFFF
+    counts = np.diff(np.r_[np.flatnonzero(record_starts), keys.size])
+    template = b"\n".join([_CONECT_RECORDS[count] for count in counts.tolist()])
+    return template % tuple(fields.tolist())
+
+
+def write_pdb_bytes(
+    atom_metas: Iterable[object],
+    bonds: Optional[Sequence[Tuple[int, int]]] = None,
+) -> bytes:
+    """Build a UTF-8 encoded PDB block for a sequence of atom metadata.
+
+    Parameters
+    ----------
+    atom_metas
+        Iterable of AtomMeta-like objects with serial, atom_name, residue, coords, element.
+        An ``AtomTable`` is formatted straight from its columns.
+    bonds
+        Optional sequence of (serial_a, serial_b) tuples for CONECT records.
+
+    Returns
+    -------
+    bytes
+        PDB text ending in a newline.
+
+    Raises
+    ------
+    PdbWriterError
+        If atom metadata is missing required attributes.
+    """
+
+    if isinstance(atom_metas, AtomTable):
+        lines = _atom_table_records(atom_metas)
+    else:
+        lines = _atom_meta_records(atom_metas)
+    if bonds:
+        lines.append(_conect_block(bonds))
+
+    lines.append(b"END")
+    lines.append(b"")
+    return b"\n".join(lines)
+
+
 def write_pdb(
     atom_metas: Iterable[object],
     bonds: Optional[Sequence[Tuple[int, int]]] = None,
@@ -41,6 +205,7 @@ def write_pdb(
     ----------
     atom_metas
         Iterable of AtomMeta-like objects with serial, atom_name, residue, coords, element.
+        An ``AtomTable`` is formatted straight from its columns.
     bonds
         Optional sequence of (serial_a, serial_b) tuples for CONECT records.
 
@@ -55,50 +220,4 @@ def write_pdb(
         If atom metadata is missing required attributes.
     """
 
-    lines: List[str] = []
-    for meta in atom_metas:
-        try:
-            serial = int(meta.serial)
-            name = _format_atom_name(meta.atom_name)
-            resname = _format_resname(meta.residue.resname)
-            chain = (meta.residue.chain or " ")[:1]
-            resid = int(meta.residue.resid)
-            x, y, z = meta.coords
-            element = _format_element(meta.element)
-        except (AttributeError, TypeError, ValueError) as exc:
-            raise PdbWriterError("pdb_format_failed", "Invalid atom metadata", str(exc)) from exc
-
-        occ = 1.00
-        temp = 0.00
-        line = (
-            f"ATOM  "
-            f"{serial:5d} "
-            f"{name}"
-            f" "
-            f"{resname} "
-            f"{chain}"
-            f"{resid:4d}"
-            f"    "
-            f"{x:8.3f}{y:8.3f}{z:8.3f}"
-            f"{occ:6.2f}{temp:6.2f}"
-            f"          "
-            f"{element:>2}"
-        )
-        lines.append(line)
-
-    if bonds:
-        adjacency: Dict[int, List[int]] = defaultdict(list)
-        for sa, sb in bonds:
-            adjacency[sa].append(sb)
-            adjacency[sb].append(sa)
-        for sa in sorted(adjacency):
-            partners = sorted(set(adjacency[sa]))
-            for i in range(0, len(partners), 4):
-                chunk = partners[i:i + 4]
-                conect = f"CONECT{sa:5d}"
-                for sb in chunk:
-                    conect += f"{sb:5d}"
-                lines.append(conect)
-
-    lines.append("END")
-    return "\n".join(lines) + "\n"
+    return write_pdb_bytes(atom_metas, bonds=bonds).decode("utf-8")
@@ -11,7 +11,7 @@ import numpy as np
 import pandas as pd
 
 from topview.model.state import Parm7Section
-from topview.services.parm7 import describe_section, parse_pointers
+from topview.services.parm7 import describe_section, parse_pointers, token_values
 
 logger = logging.getLogger(__name__)
 
@@ -103,7 +103,6 @@ def build_system_info_tables(
         bond_force,
         bond_equil,
     )
-    bond_adjacency = _build_bond_adjacency(sections, nbondh, mbona)
     angle_df = _build_angle_table(
         sections,
         atom_type_indices,
@@ -139,7 +138,6 @@ def build_system_info_tables(
         dihedral_phase,
         scee_scale,
         scnb_scale,
-        bond_adjacency,
     )
     one_four_df = _build_one_four_table(
         sections,
@@ -243,7 +241,7 @@ def _parse_int_section(
         raise ValueError(
             f"{name} length {len(section.tokens)} does not match expected {expected}"
         )
-    raw = " ".join(token.value for token in section.tokens)
+    raw = " ".join(token_values(section.tokens))
     values = np.fromstring(raw, sep=" ", dtype=int)
     if values.size != expected:
         logger.error(
@@ -294,7 +292,7 @@ def _parse_float_section(
         raise ValueError(
             f"{name} length {len(section.tokens)} does not match expected {expected}"
         )
-    raw = " ".join(token.value for token in section.tokens)
+    raw = " ".join(token_values(section.tokens))
     raw = raw.replace("D", "E").replace("d", "e")
     values = np.fromstring(raw, sep=" ", dtype=float)
     if values.size != expected:
@@ -381,7 +379,7 @@ def _parse_string_section(
         raise ValueError(
             f"{name} length {len(section.tokens)} does not match expected {expected}"
         )
-    return [token.value.strip() for token in section.tokens]
+    return [value.strip() for value in token_values(section.tokens)]
 
 
 def _build_type_name_map(
@@ -538,27 +536,6 @@ def _build_bond_table(
     ].sort_values(["type_a", "type_b", "param_index"])
 
 
-def _build_bond_adjacency(
-    sections: Dict[str, Parm7Section], nbondh: int, mbona: int
-) -> Dict[int, set[int]]:
-    adjacency: Dict[int, set[int]] = {}
-    for name, count in (
-        ("BONDS_INC_HYDROGEN", nbondh),
-        ("BONDS_WITHOUT_HYDROGEN", mbona),
-    ):
-        values = _parse_int_section(sections, name, count * 3)
-        if values.size == 0:
-            continue
-        records = values.reshape(-1, 3)
-        atom_serials = _pointer_to_serial(records[:, :2])
-        for row in atom_serials:
-            atom_a = int(row[0])
-            atom_b = int(row[1])
-            adjacency.setdefault(atom_a, set()).add(atom_b)
-            adjacency.setdefault(atom_b, set()).add(atom_a)
-    return adjacency
-
-
 def _build_rotatable_bonds(
     sections: Dict[str, Parm7Section],
     nbondh: int,
@@ -846,7 +823,6 @@ def _build_improper_table(
     dihedral_phase: np.ndarray,
     scee_scale: np.ndarray,
     scnb_scale: np.ndarray,
-    adjacency: Dict[int, set[int]],
 ) -> pd.DataFrame:
     entries: List[Tuple[int, int, int, int, int, int]] = []
     term_idx = 1
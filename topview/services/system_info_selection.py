@@ -5,8 +5,10 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Sequence, Tuple
 
+import numpy as np
+
 from topview.model.state import Parm7Section
-from topview.services.parm7 import parse_int_tokens, parse_pointers
+from topview.services.parm7 import parse_pointers, token_int_array
 
 
 @dataclass
@@ -49,6 +51,7 @@ def build_system_info_selection_index(
         sections, "ATOM_TYPE_INDEX", natom
     )
     atom_serials_by_type = _build_atom_serials_by_type(atom_type_indices)
+    type_lookup = _type_lookup(atom_type_indices)
 
     bonds_by_key: Dict[Tuple[int, int, int], List[Tuple[int, int]]] = {}
     adjacency: Dict[int, set[int]] = {}
@@ -59,7 +62,7 @@ def build_system_info_selection_index(
         ("BONDS_WITHOUT_HYDROGEN", mbona),
     ):
         values = _parse_int_section(sections, name, count * 3)
-        _accumulate_bond_records(values, atom_type_indices, bonds_by_key, adjacency)
+        _accumulate_bond_records(values, type_lookup, bonds_by_key, adjacency)
 
     angles_by_key: Dict[Tuple[int, int, int, int], List[Tuple[int, int, int]]] = {}
     nth_eth = _pointer_value(pointers, "NTHETH")
@@ -69,7 +72,7 @@ def build_system_info_selection_index(
         ("ANGLES_WITHOUT_HYDROGEN", mtheta),
     ):
         values = _parse_int_section(sections, name, count * 4)
-        _accumulate_angle_records(values, atom_type_indices, angles_by_key)
+        _accumulate_angle_records(values, type_lookup, angles_by_key)
 
     dihedrals_by_idx: Dict[int, Tuple[int, int, int, int]] = {}
     impropers_by_idx: Dict[int, Tuple[int, int, int, int]] = {}
@@ -84,7 +87,7 @@ def build_system_info_selection_index(
         values = _parse_int_section(sections, name, count * 5)
         term_idx = _accumulate_dihedral_records(
             values,
-            atom_type_indices,
+            type_lookup,
             term_idx,
             dihedrals_by_idx,
             one_four_by_key,
@@ -161,7 +164,7 @@ def _parse_int_section(
         raise ValueError(
             f"{name} length {len(section.tokens)} does not match expected {expected}"
         )
-    return parse_int_tokens(section.tokens)
+    return token_int_array(section.tokens)
 
 
 def _build_atom_serials_by_type(
@@ -182,89 +185,119 @@ def _build_atom_serials_by_type(
     return atom_serials_by_type
 
 
+def _type_lookup(atom_type_indices: Sequence[int]) -> np.ndarray:
+    # Index 0 and non-positive types map to 0, meaning "no type".
+    lookup = np.zeros(len(atom_type_indices) + 1, dtype=np.int64)
+    lookup[1:] = np.maximum(np.asarray(atom_type_indices, dtype=np.int64), 0)
+    return lookup
+
+
+def _term_columns(
+    values: np.ndarray, width: int, type_lookup: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Split term records into atom serials, atom types and parameter indices.
+
+    Records are reshaped to ``(n, width)`` so pointer conversion and type
+    lookups run as array operations; serials outside the topology get type 0.
+    """
+
+    count = len(values) // width
+    records = np.asarray(values, dtype=np.int64)[: count * width].reshape(count, width)
+    serials = np.abs(records[:, : width - 1]) // 3 + 1
+    in_range = serials < type_lookup.size
+    types = np.where(in_range, type_lookup[np.where(in_range, serials, 0)], 0)
+    return serials, types, np.abs(records[:, width - 1])
+
+
 def _accumulate_bond_records(
     values: Sequence[int],
-    atom_type_indices: Sequence[int],
+    type_lookup: np.ndarray,
     bonds_by_key: Dict[Tuple[int, int, int], List[Tuple[int, int]]],
     adjacency: Optional[Dict[int, set[int]]] = None,
 ) -> None:
-    if not values:
+    if len(values) < 3:
         return
-    for idx in range(0, len(values) - 2, 3):
-        raw_a, raw_b, raw_param = values[idx : idx + 3]
-        serial_a = _pointer_to_serial(raw_a)
-        serial_b = _pointer_to_serial(raw_b)
+    serials, types, params = _term_columns(values, 3, type_lookup)
+    typed = (types > 0).all(axis=1)
+    type_min = types.min(axis=1)
+    type_max = types.max(axis=1)
+    for (serial_a, serial_b), ok, tmin, tmax, param_index in zip(
+        serials.tolist(),
+        typed.tolist(),
+        type_min.tolist(),
+        type_max.tolist(),
+        params.tolist(),
+    ):
         if adjacency is not None:
             adjacency.setdefault(serial_a, set()).add(serial_b)
             adjacency.setdefault(serial_b, set()).add(serial_a)
-        type_a = _type_index(atom_type_indices, serial_a)
-        type_b = _type_index(atom_type_indices, serial_b)
-        if type_a is None or type_b is None:
+        if not ok:
             continue
-        param_index = abs(int(raw_param))
-        type_min, type_max = _sorted_pair(type_a, type_b)
-        bonds_by_key.setdefault((type_min, type_max, param_index), []).append(
+        bonds_by_key.setdefault((tmin, tmax, param_index), []).append(
             (serial_a, serial_b)
         )
 
 
 def _accumulate_angle_records(
     values: Sequence[int],
-    atom_type_indices: Sequence[int],
+    type_lookup: np.ndarray,
     angles_by_key: Dict[Tuple[int, int, int, int], List[Tuple[int, int, int]]],
 ) -> None:
-    if not values:
+    if len(values) < 4:
         return
-    for idx in range(0, len(values) - 3, 4):
-        raw_i, raw_j, raw_k, raw_param = values[idx : idx + 4]
-        serial_i = _pointer_to_serial(raw_i)
-        serial_j = _pointer_to_serial(raw_j)
-        serial_k = _pointer_to_serial(raw_k)
-        type_i = _type_index(atom_type_indices, serial_i)
-        type_j = _type_index(atom_type_indices, serial_j)
-        type_k = _type_index(atom_type_indices, serial_k)
-        if type_i is None or type_j is None or type_k is None:
+    serials, types, params = _term_columns(values, 4, type_lookup)
+    typed = (types > 0).all(axis=1)
+    outer_min = np.minimum(types[:, 0], types[:, 2])
+    outer_max = np.maximum(types[:, 0], types[:, 2])
+    for serial_row, ok, type_i, type_j, type_k, param_index in zip(
+        serials.tolist(),
+        typed.tolist(),
+        outer_min.tolist(),
+        types[:, 1].tolist(),
+        outer_max.tolist(),
+        params.tolist(),
+    ):
+        if not ok:
             continue
-        param_index = abs(int(raw_param))
-        type_i_c, type_k_c = (type_i, type_k)
-        if type_i_c > type_k_c:
-            type_i_c, type_k_c = type_k_c, type_i_c
-        angles_by_key.setdefault(
-            (type_i_c, type_j, type_k_c, param_index), []
-        ).append((serial_i, serial_j, serial_k))
+        angles_by_key.setdefault((type_i, type_j, type_k, param_index), []).append(
+            tuple(serial_row)
+        )
 
 
 def _accumulate_dihedral_records(
     values: Sequence[int],
-    atom_type_indices: Sequence[int],
+    type_lookup: np.ndarray,
     term_idx: int,
     dihedrals_by_idx: Dict[int, Tuple[int, int, int, int]],
     one_four_by_key: Dict[Tuple[int, int, int], List[Tuple[int, int]]],
     adjacency: Optional[Dict[int, set[int]]] = None,
     impropers_by_idx: Optional[Dict[int, Tuple[int, int, int, int]]] = None,
 ) -> int:
-    if not values:
+    if len(values) < 5:
         return term_idx
-    for idx in range(0, len(values) - 4, 5):
-        raw_i, raw_j, raw_k, raw_l, raw_param = values[idx : idx + 5]
-        serial_i = _pointer_to_serial(raw_i)
-        serial_j = _pointer_to_serial(raw_j)
-        serial_k = _pointer_to_serial(raw_k)
-        serial_l = _pointer_to_serial(raw_l)
-        dihedrals_by_idx[term_idx] = (serial_i, serial_j, serial_k, serial_l)
-        if impropers_by_idx is not None and raw_l < 0:
-            impropers_by_idx[term_idx] = (serial_i, serial_j, serial_k, serial_l)
+    serials, types, params = _term_columns(values, 5, type_lookup)
+    records = np.asarray(values, dtype=np.int64)[: serials.shape[0] * 5].reshape(-1, 5)
+    improper = records[:, 3] < 0
+    one_four = ~((records[:, 2] < 0) | improper) & (types[:, [0, 3]] > 0).all(axis=1)
+    type_min = np.minimum(types[:, 0], types[:, 3])
+    type_max = np.maximum(types[:, 0], types[:, 3])
+    for serial_row, is_improper, is_one_four, tmin, tmax, param_index in zip(
+        serials.tolist(),
+        improper.tolist(),
+        one_four.tolist(),
+        type_min.tolist(),
+        type_max.tolist(),
+        params.tolist(),
+    ):
+        record = tuple(serial_row)
+        dihedrals_by_idx[term_idx] = record
+        if impropers_by_idx is not None and is_improper:
+            impropers_by_idx[term_idx] = record
         term_idx += 1
-        if raw_k < 0 or raw_l < 0:
-            continue
-        type_i = _type_index(atom_type_indices, serial_i)
-        type_l = _type_index(atom_type_indices, serial_l)
-        if type_i is None or type_l is None:
+        if not is_one_four:
             continue
-        param_index = abs(int(raw_param))
-        type_min, type_max = _sorted_pair(type_i, type_l)
-        one_four_by_key.setdefault((type_min, type_max, param_index), []).append(
-            (serial_i, serial_l)
+        one_four_by_key.setdefault((tmin, tmax, param_index), []).append(
+            (record[0], record[3])
         )
     return term_idx
 
@@ -293,30 +326,6 @@ def _order_improper(central: int, serials: Sequence[int]) -> Tuple[int, int, int
     return (ordered[0], ordered[1], ordered[2], ordered[3])
 
 
-def _pointer_to_serial(value: int) -> int:
-    return abs(int(value)) // 3 + 1
-
-
-def _type_index(atom_type_indices: Sequence[int], serial: int) -> Optional[int]:
-    idx = serial - 1
-    if idx < 0 or idx >= len(atom_type_indices):
-        return None
-    value = atom_type_indices[idx]
-    if value is None:
-        return None
-    try:
-        type_index = int(value)
-    except (TypeError, ValueError):
-        return None
-    if type_index <= 0:
-        return None
-    return type_index
-
-
-def _sorted_pair(a: int, b: int) -> Tuple[int, int]:
-    return (a, b) if a <= b else (b, a)
-
-
 def _combination_pair_index(count: int, idx: int) -> Tuple[int, int]:
     if count < 2:
         raise ValueError("Need at least two atoms to form a pair")
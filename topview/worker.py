@@ -4,24 +4,63 @@ from __future__ import annotations
 
 from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import multiprocessing as mp
+import importlib
+import os
 import signal
-from typing import Any, Callable, Optional
+import threading
+from typing import Any, Callable, Optional, Sequence
+
+
+MAX_THREAD_WORKERS = 8
+
+_shared_worker: Optional["Worker"] = None
+_shared_lock = threading.Lock()
 
 
 def _ignore_sigint() -> None:
     signal.signal(signal.SIGINT, signal.SIG_IGN)
 
 
+def _import_modules(names: Sequence[str]) -> None:
+    for name in names:
+        importlib.import_module(name)
+
+
+def default_thread_workers() -> int:
+    """Return the thread pool size for the current machine.
+
+    Returns
+    -------
+    int
+        CPU count capped at ``MAX_THREAD_WORKERS``.
+    """
+
+    return max(1, min(MAX_THREAD_WORKERS, os.cpu_count() or 4))
+
+
 class Worker:
-    """Thread and process pools for background work."""
+    """Thread and process pools for background work.
 
-    def __init__(self, max_workers: int = 1, max_processes: int = 0) -> None:
+    Thread work is handed off through ``ThreadPoolExecutor``, whose work
+    queue is a ``queue.SimpleQueue`` (a C-level queue without the
+    ``queue.Queue`` condition variables), so submissions stay cheap with
+    several producers (bridge calls) and several consumer threads.
+    """
+
+    def __init__(
+        self, max_workers: Optional[int] = None, max_processes: int = 0
+    ) -> None:
         """Initialize executors.
 
+        Threads are started on demand: a new thread is only spawned when a
+        task is submitted and no idle worker is available, up to
+        ``max_workers``.
+
         Parameters
         ----------
         max_workers
-            Number of thread pool workers.
+            Maximum number of thread pool workers (defaults to the CPU count,
+            capped at ``MAX_THREAD_WORKERS``).
         max_processes
             Number of process pool workers (0 disables process pool).
 
@@ -31,6 +70,10 @@ class Worker:
             This method does not return a value.
         """
 
+        if max_workers is None:
+            max_workers = default_thread_workers()
+        self._max_workers = max_workers
+        self._max_processes = max(0, max_processes or 0)
         self._executor = ThreadPoolExecutor(max_workers=max_workers)
         self._process_executor: Optional[ProcessPoolExecutor] = None
         if max_processes and max_processes > 0:
@@ -41,6 +84,90 @@ class Worker:
                 initializer=_ignore_sigint,
             )
 
+    @classmethod
+    def shared(
+        cls, max_workers: Optional[int] = None, max_processes: Optional[int] = None
+    ) -> Worker:
+        """Return the process-wide worker, creating it on first use.
+
+        Parameters
+        ----------
+        max_workers
+            Thread pool size used when the shared worker is created.
+        max_processes
+            Process pool size used when the shared worker is created
+            (defaults to 0, no process pool).
+
+        Returns
+        -------
+        Worker
+            The shared worker.
+
+        Raises
+        ------
+        ValueError
+            If a sizing argument passed after creation differs from the size
+            the shared worker was created with.
+        """
+
+        global _shared_worker
+        with _shared_lock:
+            if _shared_worker is None:
+                _shared_worker = cls(
+                    max_workers=max_workers, max_processes=max_processes or 0
+                )
+                return _shared_worker
+            worker = _shared_worker
+        if max_workers is not None and max_workers != worker._max_workers:
+            raise ValueError(
+                f"shared worker already has {worker._max_workers} threads, "
+                f"not {max_workers}"
+            )
+        if max_processes is not None and max_processes != worker._max_processes:
+            raise ValueError(
+                f"shared worker already has {worker._max_processes} processes, "
+                f"not {max_processes}"
+            )
+        return worker
+
+    @classmethod
+    def reset_shared(cls) -> None:
+        """Shut down and forget the process-wide worker, if one exists.
+
+        The next ``shared`` call creates a fresh worker with its own sizing.
+
+        Returns
+        -------
+        None
+            This method does not return a value.
+        """
+
+        global _shared_worker
+        with _shared_lock:
+            worker, _shared_worker = _shared_worker, None
+        if worker is not None:
+            worker.shutdown()
+
+    def prewarm(self, modules: Sequence[str] = ()) -> None:
+        """Start the process pool worker and import ``modules`` in it.
+
+        Spawned workers otherwise start, and import their task's modules, on
+        the first ``submit_cpu`` call. Does nothing without a process pool.
+
+        Parameters
+        ----------
+        modules
+            Module names to import in the worker process.
+
+        Returns
+        -------
+        None
+            This method does not return a value.
+        """
+
+        if self._process_executor is not None:
+            self._process_executor.submit(_import_modules, tuple(modules))
+
     def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any):
         """Run work in the thread pool.
 
@@ -80,3 +207,21 @@ class Worker:
         if self._process_executor is None:
             return self.submit(fn, *args, **kwargs)
         return self._process_executor.submit(fn, *args, **kwargs)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the thread pool and the process pool.
+
+        Parameters
+        ----------
+        wait
+            Whether to block until running work has finished.
+
+        Returns
+        -------
+        None
+            This method does not return a value.
+        """
+
+        self._executor.shutdown(wait=wait)
+        if self._process_executor is not None:
+            self._process_executor.shutdown(wait=wait)
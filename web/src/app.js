@@ -1,4 +1,5 @@
 import {
+  callApiBatch,
   getInitialPaths,
   getParm7Sections,
   getParm7Text,
@@ -123,6 +124,8 @@ async function loadSystem(parm7Path, rst7Path, resname, nmrPath) {
   setLoading(true);
   setStatus("loading", "Loading system...");
 
+  let initialText = null;
+  let initialSections = null;
   try {
     const result = await apiLoadSystem(parm7Path, rst7Path, resname, nmrPath);
     if (!result || !result.ok) {
@@ -131,6 +134,8 @@ async function loadSystem(parm7Path, rst7Path, resname, nmrPath) {
       setLoading(false);
       return;
     }
+    initialText = result.parm7_text || null;
+    initialSections = result.parm7_sections || null;
     state.nmrRestraints = result.nmr_restraints || [];
     state.nmrSummary = result.nmr_summary || emptyNmrSummary();
     state.nmrFilter = "show_all";
@@ -186,9 +191,9 @@ async function loadSystem(parm7Path, rst7Path, resname, nmrPath) {
     return;
   }
 
-  if (hasApiMethod("get_parm7_text")) {
+  if (initialText || hasApiMethod("get_parm7_text")) {
     try {
-      const textResult = await getParm7Text();
+      const textResult = initialText || (await getParm7Text());
       if (!textResult || !textResult.ok) {
         const msg =
           textResult && textResult.error
@@ -205,9 +210,9 @@ async function loadSystem(parm7Path, rst7Path, resname, nmrPath) {
     }
   }
 
-  if (hasApiMethod("get_parm7_sections")) {
+  if (initialSections || hasApiMethod("get_parm7_sections")) {
     try {
-      const sectionResult = await getParm7Sections();
+      const sectionResult = initialSections || (await getParm7Sections());
       if (!sectionResult || !sectionResult.ok) {
         const msg =
           sectionResult && sectionResult.error
@@ -443,28 +448,35 @@ window.addEventListener("pywebviewready", async function () {
   await ensureViewer();
   setStatus("success", "Ready", "");
   applyTheme(state.darkMode);
-  if (hasApiMethod("get_ui_config")) {
-    getUiConfig()
-      .then((result) => {
-        if (result && result.ok) {
-          applyUiConfig(result.config);
-        }
-      })
-      .catch(() => {});
-  }
-  if (hasApiMethod("get_initial_paths")) {
-    getInitialPaths()
-      .then((result) => {
-        if (result && result.ok && result.parm7_path) {
-          setInitialPaths({
-            parm7: result.parm7_path,
-            rst7: result.rst7_path,
-            resname: result.resname,
-            nmr_path: result.nmr_path,
-          });
-        }
+  const applyStartupConfig = (result) => {
+    if (result && result.ok) {
+      applyUiConfig(result.config);
+    }
+  };
+  const applyStartupPaths = (result) => {
+    if (result && result.ok && result.parm7_path) {
+      setInitialPaths({
+        parm7: result.parm7_path,
+        rst7: result.rst7_path,
+        resname: result.resname,
+        nmr_path: result.nmr_path,
+      });
+    }
+  };
+  if (hasApiMethod("batch")) {
+    callApiBatch([{ method: "get_ui_config" }, { method: "get_initial_paths" }])
+      .then(([configResult, pathsResult]) => {
+        applyStartupConfig(configResult);
+        applyStartupPaths(pathsResult);
       })
       .catch(() => {});
+  } else {
+    if (hasApiMethod("get_ui_config")) {
+      getUiConfig().then(applyStartupConfig).catch(() => {});
+    }
+    if (hasApiMethod("get_initial_paths")) {
+      getInitialPaths().then(applyStartupPaths).catch(() => {});
+    }
   }
   if (state.pendingLoad) {
     const payload = state.pendingLoad;
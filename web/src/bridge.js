@@ -33,6 +33,70 @@ export function callApi(name, payload) {
   return api[name](payload);
 }
 
+/**
+ * Run several pywebview API calls in one bridge round-trip. Each entry is
+ * `{method, payload}`; results come back in order. Falls back to individual
+ * calls when the backend has no `batch` method.
+ * @param {Array<{method: string, payload: (object|undefined)}>} calls
+ * @returns {Promise<Array<any>>}
+ */
+export function callApiBatch(calls) {
+  if (!hasApiMethod("batch")) {
+    return Promise.all(calls.map((call) => callApi(call.method, call.payload)));
+  }
+  return callApi("batch", { calls: calls }).then((result) => {
+    if (!result || !result.ok || !Array.isArray(result.results)) {
+      return calls.map(() => result);
+    }
+    return result.results;
+  });
+}
+
+const pendingTasks = new Map();
+const finishedTasks = new Map();
+
+/**
+ * Receive the result of a background task started with callApiTask.
+ * Called from Python via window.evaluate_js.
+ * @param {string} taskId
+ * @param {any} result
+ */
+window.__topviewTaskDone = function (taskId, result) {
+  const resolve = pendingTasks.get(taskId);
+  if (resolve) {
+    pendingTasks.delete(taskId);
+    resolve(result);
+    return;
+  }
+  finishedTasks.set(taskId, result);
+};
+
+/**
+ * Call a pywebview API method as a background task. The Python side returns a
+ * task id right away and delivers the result through __topviewTaskDone, so the
+ * bridge thread is not held for the duration of the work. Backends that answer
+ * synchronously are handled transparently.
+ * @param {string} name
+ * @param {object=} payload
+ * @returns {Promise<any>}
+ */
+export function callApiTask(name, payload) {
+  return callApi(name, Object.assign({}, payload, { async: true })).then((result) => {
+    if (!result || !result.ok || !result.task_id) {
+      return result;
+    }
+    const taskId = result.task_id;
+    if (finishedTasks.has(taskId)) {
+      const done = finishedTasks.get(taskId);
+      finishedTasks.delete(taskId);
+      return done;
+    }
+    return new Promise((resolve) => {
+      pendingTasks.set(taskId, resolve);
+    });
+  });
+}
+
 /** @returns {Promise<any>} */
 export function getUiConfig() {
   return callApi("get_ui_config");
@@ -44,6 +108,8 @@ export function getInitialPaths() {
 }
 
 /**
+ * The response carries the parm7 text and section payloads inline
+ * (`parm7_text`, `parm7_sections`) when the backend supports it.
  * @param {string} parm7Path
  * @param {string=} rst7Path
  * @param {string=} resname
@@ -51,7 +117,7 @@ export function getInitialPaths() {
  * @returns {Promise<any>}
  */
 export function loadSystem(parm7Path, rst7Path, resname, nmrPath) {
-  const payload = { parm7_path: parm7Path };
+  const payload = { parm7_path: parm7Path, include_initial: true };
   if (rst7Path) {
     payload.rst7_path = rst7Path;
   }
@@ -61,7 +127,7 @@ export function loadSystem(parm7Path, rst7Path, resname, nmrPath) {
   if (nmrPath) {
     payload.nmr_path = nmrPath;
   }
-  return callApi("load_system", payload);
+  return callApiTask("load_system", payload);
 }
 
 /** @returns {Promise<any>} */
@@ -69,6 +135,16 @@ export function getParm7Text() {
   return callApi("get_parm7_text");
 }
 
+/**
+ * Fetch a byte range of the parm7 file (`{ok, offset, size, data_b64}`).
+ * @param {number} offset
+ * @param {number} length
+ * @returns {Promise<any>}
+ */
+export function getParm7Chunk(offset, length) {
+  return callApi("get_parm7_chunk", { offset: offset, length: length });
+}
+
 /** @returns {Promise<any>} */
 export function getParm7Sections() {
   return callApi("get_parm7_sections");
@@ -99,12 +175,15 @@ export function getSystemInfoSelection(table, rowIndex, cursor) {
 }
 
 /**
- * @param {string} csvText
+ * @param {string|Array<string>} csv CSV text, or chunks written back to back.
  * @param {string} name
  * @returns {Promise<any>}
  */
-export function saveSystemInfoCsv(csvText, name) {
-  return callApi("save_system_info_csv", { csv_text: csvText, name: name });
+export function saveSystemInfoCsv(csv, name) {
+  if (Array.isArray(csv)) {
+    return callApi("save_system_info_csv", { csv_chunks: csv, name: name });
+  }
+  return callApi("save_system_info_csv", { csv_text: csv, name: name });
 }
 
 /**
@@ -134,6 +213,97 @@ export function getAtomBundle(serial) {
   return callApi("get_atom_bundle", { serial: serial });
 }
 
+/**
+ * Build a dispatcher that coalesces single-serial lookups issued before the
+ * next flush into one batched API call returning `{ok, items}` in order.
+ * @param {string} batchName Batched API method name.
+ * @param {function(number): Promise<any>} fallback Single-serial call.
+ * @param {function(function): void} schedule Flush scheduler.
+ * @returns {function(number): Promise<any>}
+ */
+function createSerialBatcher(batchName, fallback, schedule) {
+  const pending = new Map();
+  let scheduled = false;
+
+  function flush() {
+    scheduled = false;
+    const waiting = new Map(pending);
+    pending.clear();
+    const serials = Array.from(waiting.keys());
+    callApi(batchName, { serials: serials })
+      .then((result) => {
+        const items = result && result.ok && Array.isArray(result.items) ? result.items : null;
+        serials.forEach((serial, idx) => {
+          const item = items ? items[idx] : result;
+          waiting.get(serial).forEach(({ resolve }) => resolve(item));
+        });
+      })
+      .catch((err) => {
+        waiting.forEach((waiters) => waiters.forEach(({ reject }) => reject(err)));
+      });
+  }
+
+  return function (serial) {
+    if (!hasApiMethod(batchName)) {
+      return fallback(serial);
+    }
+    return new Promise((resolve, reject) => {
+      if (!pending.has(serial)) {
+        pending.set(serial, []);
+      }
+      pending.get(serial).push({ resolve, reject });
+      if (!scheduled) {
+        scheduled = true;
+        schedule(flush);
+      }
+    });
+  };
+}
+
+function scheduleFrame(fn) {
+  if (typeof window.requestAnimationFrame === "function") {
+    window.requestAnimationFrame(() => fn());
+    return;
+  }
+  window.setTimeout(fn, 16);
+}
+
+/**
+ * Fetch an atom bundle, coalescing requests issued in the same tick into a
+ * single get_atom_bundles call.
+ * @param {number} serial
+ * @returns {Promise<any>}
+ */
+export const getAtomBundleBatched = createSerialBatcher(
+  "get_atom_bundles",
+  getAtomBundle,
+  queueMicrotask
+);
+
+/**
+ * @param {Array<number>} serials
+ * @returns {Promise<any>}
+ */
+export function getAtomBundles(serials) {
+  return callApi("get_atom_bundles", { serials: serials });
+}
+
+/**
+ * @param {Array<number>} serials
+ * @returns {Promise<any>}
+ */
+export function getAtomInfos(serials) {
+  return callApi("get_atom_infos", { serials: serials });
+}
+
+/**
+ * @param {Array<number>} resids
+ * @returns {Promise<any>}
+ */
+export function getResidueInfos(resids) {
+  return callApi("get_residue_infos", { resids: resids });
+}
+
 /**
  * @param {number} serial
  * @returns {Promise<any>}
@@ -142,13 +312,25 @@ export function getAtomInfo(serial) {
   return callApi("get_atom_info", { serial: serial });
 }
 
+/**
+ * Fetch atom info, coalescing requests issued within one animation frame
+ * into a single get_atom_infos call (rapid hover/selection bursts).
+ * @param {number} serial
+ * @returns {Promise<any>}
+ */
+export const getAtomInfoBatched = createSerialBatcher(
+  "get_atom_infos",
+  getAtomInfo,
+  scheduleFrame
+);
+
 /**
  * @param {Array<number>} serials
  * @param {string} mode
  * @returns {Promise<any>}
  */
 export function getParm7Highlights(serials, mode) {
-  return callApi("get_parm7_highlights", { serials: serials, mode: mode });
+  return callApiTask("get_parm7_highlights", { serials: serials, mode: mode });
 }
 
 /**
@@ -156,7 +338,7 @@ export function getParm7Highlights(serials, mode) {
  * @returns {Promise<any>}
  */
 export function queryAtoms(filters) {
-  return callApi("query_atoms", { filters: filters });
+  return callApiTask("query_atoms", { filters: filters });
 }
 
 /** @returns {Promise<any>} */
@@ -2,7 +2,7 @@ import {
   DEFAULT_SELECTION_MODE,
   MAX_ATOM_CACHE,
 } from "./constants.js";
-import { getAtomBundle, getAtomInfo } from "./bridge.js";
+import { getAtomBundle, getAtomBundleBatched, getAtomInfoBatched } from "./bridge.js";
 import { state } from "./state.js";
 import {
   bondDistance,
@@ -115,7 +115,7 @@ function applyInteractionDetails(nonce, mode, serials) {
       ? serials.filter((s) => !state.atomCache.has(s))
       : [];
     const fetchUncached = uncached.map((s) =>
-      getAtomBundle(s)
+      getAtomBundleBatched(s)
         .then((result) => {
           if (result && result.ok) {
             cacheAtom(s, { atom: result.atom, highlights: result.highlights || [] });
@@ -232,7 +232,7 @@ function runAtomSelection(serial, nonce) {
         setStatus("success", `Selected atom ${serial}`);
       })
       .catch(() => {
-        getAtomInfo(serial)
+        getAtomInfoBatched(serial)
           .then((fallback) => {
             if (!fallback || !fallback.ok) {
               const msg =
@@ -318,7 +318,7 @@ function fetchAtomForMultiSelect(serial, nonce) {
         setStatus("success", `Selected atom ${serial}`);
       })
       .catch(() => {
-        getAtomInfo(serial)
+        getAtomInfoBatched(serial)
           .then((fallback) => {
             if (!fallback || !fallback.ok) {
               const msg =
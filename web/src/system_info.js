@@ -746,10 +746,10 @@ async function exportSystemInfoCsv() {
     reportError("No system info data available for export.");
     return;
   }
-  const csvText = buildCsvText(table.columns, table.rows || []);
+  const csvChunks = buildCsvChunks(table.columns, table.rows || []);
   const filename = `topview-${slugify(tab.id)}.csv`;
   try {
-    const result = await saveSystemInfoCsv(csvText, filename);
+    const result = await saveSystemInfoCsv(csvChunks, filename);
     if (!result || !result.ok) {
       const msg = result && result.error ? result.error.message : "CSV export failed";
       reportError(msg);
@@ -759,7 +759,14 @@ async function exportSystemInfoCsv() {
   }
 }
 
-function buildCsvText(columns, rows) {
+/**
+ * Build CSV lines as chunks that concatenate to the full text (every line but
+ * the last ends in a newline), so the backend can stream them to disk.
+ * @param {Array<string>} columns
+ * @param {Array<Array<any>>} rows
+ * @returns {Array<string>}
+ */
+function buildCsvChunks(columns, rows) {
   const lines = [];
   lines.push(columns.map(csvEscape).join(","));
   if (rows && rows.length) {
@@ -768,7 +775,10 @@ function buildCsvText(columns, rows) {
       lines.push(cells.join(","));
     });
   }
-  return lines.join("\n");
+  for (let idx = 0; idx < lines.length - 1; idx += 1) {
+    lines[idx] += "\n";
+  }
+  return lines;
 }
 
 function csvEscape(value) {